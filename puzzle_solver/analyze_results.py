@@ -2,38 +2,110 @@
 Visualization and reporting script for experiment results.
 """
 
+import os
 import sys
-import json
-from typing import Dict, List
+import importlib.util
+from typing import Dict, List, Tuple
 
-# Try to import visualization libraries
-try:
-    import matplotlib.pyplot as plt
-    import numpy as np
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
-    print("Warning: matplotlib/numpy not available. Text report will be generated.")
+# Visualization libraries are heavy (matplotlib alone costs hundreds of
+# milliseconds to import), so only check that they are installed here and
+# load them on first use in _load_plotting(). Without NumPy, the metrics and
+# the text report are computed in pure Python.
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+HAS_MATPLOTLIB = HAS_NUMPY and importlib.util.find_spec("matplotlib") is not None
+
+_plotting = None
+
+
+def _load_plotting():
+    """
+    Import matplotlib and numpy on first use.
+    
+    Returns:
+        Tuple of (pyplot module, numpy module), or None if unavailable
+    """
+    global _plotting
+    if _plotting is None and HAS_MATPLOTLIB:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        import numpy as np
+        _plotting = (plt, np)
+    return _plotting
 
 # Add parent directory to path
 sys.path.insert(0, '/home/luffy/class/DAA CLA2')
 
+from puzzle_solver.results_store import ResultsTable
+
+
+def _percentile(ordered: List[float], p: float) -> float:
+    """
+    Percentile of a sorted list, interpolated linearly as np.percentile() does.
+    
+    Args:
+        ordered: Non-empty sorted values
+        p: Percentile (0-100)
+    
+    Returns:
+        Interpolated value
+    """
+    position = (len(ordered) - 1) * p / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return float(ordered[low] + (ordered[high] - ordered[low]) * (position - low))
+
 
 class ResultsAnalyzer:
     """Analyze and visualize experiment results."""
     
     def __init__(self, results_file: str = "results.json"):
         """
-        Load results from JSON file.
+        Load results from a JSON or columnar results file.
+        
+        Columnar files (see results_store.py) are memory-mapped, so only the
+        columns an analysis touches are read from disk.
         
         Args:
-            results_file: Path to results JSON file
+            results_file: Path to results file, relative to the project directory
         """
-        filepath = f'/home/luffy/class/DAA CLA2/{results_file}'
-        with open(filepath, 'r') as f:
-            self.results = json.load(f)
+        if os.path.isabs(results_file):
+            filepath = results_file
+        else:
+            filepath = f'/home/luffy/class/DAA CLA2/{results_file}'
+        self.table = ResultsTable.open(filepath)
         
-        self.heuristics = list(self.results.keys())
+        self.heuristics = list(self.table.heuristics)
+    
+    def _successful_groups(self, values):
+        """
+        Select successful rows of a column, grouped by heuristic code.
+        
+        Args:
+            values: Column array aligned with the table
+        
+        Returns:
+            Tuple of (heuristic codes, values) restricted to successful rows
+        """
+        found = self.table["solution_found"].astype(bool)
+        codes = self.table["heuristic"][found]
+        return codes, values[found]
+    
+    def _successful_lists(self, values) -> List[List[float]]:
+        """
+        Pure-Python _successful_groups(): values of successful rows per heuristic code.
+        
+        Args:
+            values: Column aligned with the table
+        
+        Returns:
+            One list of values per heuristic, in heuristic order
+        """
+        groups = [[] for _ in self.heuristics]
+        for code, found, value in zip(self.table["heuristic"], self.table["solution_found"], values):
+            if found:
+                groups[code].append(value)
+        return groups
     
     def extract_metrics(self) -> Dict[str, Dict[str, float]]:
         """
@@ -42,55 +114,163 @@ class ResultsAnalyzer:
         Returns:
             Dictionary with metrics for each heuristic
         """
+        if not HAS_NUMPY:
+            return self._extract_metrics_python()
+        
+        import numpy as np
+        
+        n = len(self.heuristics)
+        totals = np.bincount(self.table["heuristic"], minlength=n)
+        
+        codes, times = self._successful_groups(self.table["execution_time"])
+        _, ratios = self._successful_groups(self.table.ratio())
+        _, nodes = self._successful_groups(self.table["nodes_expanded"])
+        _, memory = self._successful_groups(self.table.memory())
+        
+        counts = np.bincount(codes, minlength=n)
+        safe_counts = np.maximum(counts, 1)
+        avg_time = np.bincount(codes, weights=times, minlength=n) / safe_counts
+        avg_ratio = np.bincount(codes, weights=ratios, minlength=n) / safe_counts
+        avg_nodes = np.bincount(codes, weights=nodes, minlength=n) / safe_counts
+        avg_memory = np.bincount(codes, weights=memory, minlength=n) / safe_counts
+        
         metrics = {}
+        for code, heuristic in enumerate(self.heuristics):
+            metrics[heuristic] = {
+                "avg_time": float(avg_time[code]),
+                "avg_ratio": float(avg_ratio[code]),
+                "avg_nodes": float(avg_nodes[code]),
+                "avg_memory": float(avg_memory[code]),
+                "success_rate": float(counts[code] / totals[code]) if totals[code] else 0
+            }
         
-        for heuristic, data in self.results.items():
-            stats = data["statistics"]
-            successful = [s for s in stats if s["solution_found"]]
-            
-            if successful:
-                times = [s["execution_time"] for s in successful]
-                ratios = [s["ratio"] for s in successful]
-                nodes = [s["nodes_expanded"] for s in successful]
-                
-                # Calculate mean manually if numpy not available
-                avg_time = sum(times) / len(times) if times else 0
-                avg_ratio = sum(ratios) / len(ratios) if ratios else 0
-                avg_nodes = sum(nodes) / len(nodes) if nodes else 0
-                
-                metrics[heuristic] = {
-                    "avg_time": avg_time,
-                    "avg_ratio": avg_ratio,
-                    "avg_nodes": avg_nodes,
-                    "success_rate": len(successful) / len(stats)
-                }
-            else:
-                metrics[heuristic] = {
-                    "avg_time": 0,
-                    "avg_ratio": 0,
-                    "avg_nodes": 0,
-                    "success_rate": 0
-                }
+        return metrics
+    
+    def _extract_metrics_python(self) -> Dict[str, Dict[str, float]]:
+        """extract_metrics() without NumPy."""
+        totals = [0] * len(self.heuristics)
+        for code in self.table["heuristic"]:
+            totals[code] += 1
+        
+        columns = {
+            "avg_time": self._successful_lists(self.table["execution_time"]),
+            "avg_ratio": self._successful_lists(self.table.ratio()),
+            "avg_nodes": self._successful_lists(self.table["nodes_expanded"]),
+            "avg_memory": self._successful_lists(self.table.memory()),
+        }
+        
+        metrics = {}
+        for code, heuristic in enumerate(self.heuristics):
+            count = len(columns["avg_time"][code])
+            metrics[heuristic] = {
+                name: float(sum(groups[code])) / max(count, 1) for name, groups in columns.items()
+            }
+            metrics[heuristic]["success_rate"] = count / totals[code] if totals[code] else 0
         
         return metrics
     
+    def percentiles(self, column: str = "execution_time",
+                    q: Tuple[float, ...] = (50, 90, 99)) -> Dict[str, Dict[float, float]]:
+        """
+        Compute percentiles of a metric over successful solves per heuristic.
+        
+        Args:
+            column: Column name, or "ratio" for the lower-bound ratio
+            q: Percentiles to compute (0-100)
+        
+        Returns:
+            Dictionary mapping heuristic name to {percentile: value}
+        """
+        values = self.table.ratio() if column == "ratio" else self.table[column]
+        if not HAS_NUMPY:
+            result = {}
+            for heuristic, group in zip(self.heuristics, self._successful_lists(values)):
+                group.sort()
+                result[heuristic] = {p: _percentile(group, p) if group else 0.0 for p in q}
+            return result
+        
+        import numpy as np
+        
+        codes, values = self._successful_groups(values)
+        
+        # Sort once by (heuristic, value) so each group is a contiguous slice
+        order = np.lexsort((values, codes))
+        codes, values = codes[order], values[order]
+        bounds = np.searchsorted(codes, np.arange(len(self.heuristics) + 1))
+        
+        result = {}
+        for code, heuristic in enumerate(self.heuristics):
+            group = values[bounds[code]:bounds[code + 1]]
+            if len(group):
+                result[heuristic] = dict(zip(q, np.percentile(group, q).tolist()))
+            else:
+                result[heuristic] = {p: 0.0 for p in q}
+        return result
+    
+    def depth_breakdown(self, column: str = "nodes_expanded") -> Dict[str, Dict[int, float]]:
+        """
+        Compute the mean of a metric per optimal solution depth per heuristic.
+        
+        Args:
+            column: Column name, or "ratio" for the lower-bound ratio
+        
+        Returns:
+            Dictionary mapping heuristic name to {depth: mean value}
+        """
+        values = self.table.ratio() if column == "ratio" else self.table[column]
+        if not HAS_NUMPY:
+            depths = self._successful_lists(self.table["optimal_cost"])
+            result = {}
+            for heuristic, group, group_depths in zip(self.heuristics, self._successful_lists(values), depths):
+                sums, counts = {}, {}
+                for depth, value in zip(group_depths, group):
+                    sums[depth] = sums.get(depth, 0.0) + value
+                    counts[depth] = counts.get(depth, 0) + 1
+                result[heuristic] = {depth: sums[depth] / counts[depth] for depth in sorted(sums)}
+            return result
+        
+        import numpy as np
+        
+        codes, values = self._successful_groups(values)
+        _, depths = self._successful_groups(self.table["optimal_cost"])
+        if len(depths) == 0:
+            return {heuristic: {} for heuristic in self.heuristics}
+        
+        # One flat bin per (heuristic, depth) pair
+        width = int(depths.max()) + 1
+        cells = codes.astype(np.int64) * width + depths
+        size = len(self.heuristics) * width
+        counts = np.bincount(cells, minlength=size).reshape(-1, width)
+        sums = np.bincount(cells, weights=values, minlength=size).reshape(-1, width)
+        
+        result = {}
+        for code, heuristic in enumerate(self.heuristics):
+            present = np.nonzero(counts[code])[0]
+            result[heuristic] = {
+                int(d): float(sums[code, d] / counts[code, d]) for d in present
+            }
+        return result
+    
     def plot_results(self, output_dir: str = "/home/luffy/class/DAA CLA2"):
         """
-        Create three plots for the results.
+        Create four plots for the results: time, ratio, nodes and memory.
         
         Args:
             output_dir: Directory to save plots
         """
-        if not HAS_MATPLOTLIB:
-            print("Matplotlib not available. Skipping visualization plots.")
+        plotting = _load_plotting()
+        if plotting is None:
+            print("Warning: matplotlib/numpy not available. Skipping visualization plots.")
             return None
-            
+        plt, np = plotting
+        
         metrics = self.extract_metrics()
         
         heuristic_names = []
         times = []
         ratios = []
         nodes = []
+        memory = []
         
         for heuristic, data in metrics.items():
             # Extract short name from heuristic
@@ -99,9 +279,10 @@ class ResultsAnalyzer:
             times.append(data["avg_time"])
             ratios.append(data["avg_ratio"])
             nodes.append(data["avg_nodes"])
+            memory.append(data["avg_memory"] / 1024)
         
-        # Create figure with three subplots
-        fig, axes = plt.subplots(1, 3, figsize=(16, 5))
+        # Create figure with four subplots
+        fig, axes = plt.subplots(1, 4, figsize=(21, 5))
         
         # Plot 1: Execution Time
         axes[0].bar(heuristic_names, times, color='steelblue', edgecolor='black')
@@ -130,6 +311,15 @@ class ResultsAnalyzer:
         for i, v in enumerate(nodes):
             axes[2].text(i, v + max(nodes)*0.02, f'{v:.0f}', ha='center', fontsize=9)
         
+        # Plot 4: Peak Memory (measured when profiled, otherwise estimated)
+        axes[3].bar(heuristic_names, memory, color='plum', edgecolor='black')
+        axes[3].set_title('Average Peak Search Memory', fontsize=12, fontweight='bold')
+        axes[3].set_ylabel('Memory (KiB)', fontsize=11)
+        axes[3].set_xlabel('Heuristic', fontsize=11)
+        axes[3].grid(axis='y', alpha=0.3)
+        for i, v in enumerate(memory):
+            axes[3].text(i, v + max(memory)*0.02, f'{v:.0f}', ha='center', fontsize=9)
+        
         # Adjust layout and save
         plt.tight_layout()
         output_path = f"{output_dir}/experiment_results.png"
@@ -156,13 +346,27 @@ class ResultsAnalyzer:
         # Summary table
         report.append("SUMMARY TABLE")
         report.append("-" * 80)
-        report.append(f"{'Heuristic':<25} {'Avg Time':<15} {'Avg Ratio':<15} {'Avg Nodes':<15}")
+        report.append(f"{'Heuristic':<25} {'Avg Time':<13} {'Avg Ratio':<11} {'Avg Nodes':<13} {'Avg Memory (KiB)':<16}")
         report.append("-" * 80)
         
         for heuristic, metrics_data in metrics.items():
             report.append(
-                f"{heuristic:<25} {metrics_data['avg_time']:<15.6f} "
-                f"{metrics_data['avg_ratio']:<15.4f} {metrics_data['avg_nodes']:<15.1f}"
+                f"{heuristic:<25} {metrics_data['avg_time']:<13.6f} "
+                f"{metrics_data['avg_ratio']:<11.4f} {metrics_data['avg_nodes']:<13.1f} "
+                f"{metrics_data['avg_memory'] / 1024:<16.1f}"
+            )
+        
+        report.append("")
+        
+        # Tail latency
+        percentiles = self.percentiles("execution_time")
+        report.append("EXECUTION TIME PERCENTILES (seconds)")
+        report.append("-" * 80)
+        report.append(f"{'Heuristic':<25} {'p50':<15} {'p90':<15} {'p99':<15}")
+        report.append("-" * 80)
+        for heuristic, values in percentiles.items():
+            report.append(
+                f"{heuristic:<25} {values[50]:<15.6f} {values[90]:<15.6f} {values[99]:<15.6f}"
             )
         
         report.append("")
@@ -200,6 +404,21 @@ H4: Linear Conflict Heuristic
     as their goal position but in reverse order
   - Tighter lower bound than Manhattan distance
   - Most expensive to compute but should give best search performance
+
+H5: Walking Distance Heuristic
+  - Vertical moves needed to bring each tile into its goal row, plus the
+    horizontal moves needed to bring each tile into its goal column
+  - Looked up in a precomputed table of row/column tile counts
+  - Admissible; dominates Manhattan distance
+
+H6: Inversion Distance Heuristic
+  - Half the row-major inversions plus half the column-major inversions
+  - Admissible; complements Manhattan distance on scrambled rows/columns
+
+H7: Linear Conflict + Corner Tiles Heuristic
+  - Manhattan distance + linear conflicts (table lookup per row/column)
+    + 2 for each blocked corner whose neighbors are already in place
+  - Admissible; dominates Manhattan distance
 """)
         
         report.append("=" * 80)
@@ -245,9 +464,11 @@ The experiment demonstrates the importance of good heuristics in guided search:
    Dramatically reduces search time compared to H2
    This is a commonly used heuristic for 8-puzzle
 
-4. H4 (Linear Conflict) provides the tightest bounds
+4. H4 (Linear Conflict) tightens Manhattan distance with line conflicts
    More expensive to compute but explores far fewer nodes
-   Best overall search performance
+
+5. H5-H7 (Walking Distance, Inversion Distance, Corner Tiles) use
+   precomputed tables to give tight bounds at close to Manhattan cost
 
 The ratio (average lower bound / optimal cost) indicates bound tightness:
 - Ratio close to 1 = very tight bound = efficient search
@@ -0,0 +1,433 @@
+"""
+Micro-benchmarks for the 8-puzzle solver package.
+
+Run all benchmarks with:
+    python -m puzzle_solver.benchmarks
+or a subset by name:
+    python -m puzzle_solver.benchmarks import_time
+"""
+
+import sys
+import time
+import random
+import subprocess
+from typing import Dict, List
+
+# Modules that must never be pulled in by the solver core
+HEAVY_MODULES = ("numpy", "matplotlib")
+
+# Modules whose cold-start import cost is tracked
+IMPORT_TARGETS = (
+    "puzzle_solver.puzzle_state",
+    "puzzle_solver.heuristics",
+    "puzzle_solver.branch_and_bound",
+    "puzzle_solver.run_experiment",
+    "puzzle_solver.analyze_results",
+)
+
+# Modules that make up the solver core
+CORE_MODULES = IMPORT_TARGETS[:3]
+
+
+def measure_import(module: str, repeats: int = 5) -> Dict:
+    """
+    Measure the cold-start import time of a module in a fresh interpreter.
+
+    Uses `python -X importtime`, which reports the cumulative time spent
+    importing each module, and records which heavy dependencies ended up
+    in sys.modules.
+
+    Args:
+        module: Dotted module name to import
+        repeats: Number of fresh interpreters to start (best time is kept)
+
+    Returns:
+        Dictionary with the best cumulative time in microseconds and the
+        heavy modules that were loaded
+    """
+    code = (
+        f"import {module}, sys; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    best_us = None
+    heavy_loaded: List[str] = []
+
+    for _ in range(repeats):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True, text=True, check=True
+        )
+
+        # Lines look like: "import time:  self [us] | cumulative | imported package"
+        cumulative_us = None
+        for line in proc.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                cumulative_us = int(parts[1].strip())
+
+        if cumulative_us is not None and (best_us is None or cumulative_us < best_us):
+            best_us = cumulative_us
+        heavy_loaded = [m for m in proc.stdout.strip().split(",") if m]
+
+    return {
+        "module": module,
+        "cumulative_us": best_us or 0,
+        "heavy_loaded": heavy_loaded,
+    }
+
+
+def bench_import_time() -> List[Dict]:
+    """
+    Benchmark cold-start import time of the package modules.
+
+    A solver core module that loads numpy or matplotlib is reported as a
+    regression.
+
+    Returns:
+        List of measurement dictionaries, one per module
+    """
+    print("Import time (best of 5 fresh interpreters)")
+    print("-" * 70)
+    print(f"{'Module':<36} {'Cumulative (ms)':<18} {'Heavy deps'}")
+
+    results = []
+    for module in IMPORT_TARGETS:
+        result = measure_import(module)
+        results.append(result)
+        heavy = ", ".join(result["heavy_loaded"]) or "-"
+        flag = "  <-- REGRESSION" if module in CORE_MODULES and result["heavy_loaded"] else ""
+        print(f"{module:<36} {result['cumulative_us'] / 1000:<18.2f} {heavy}{flag}")
+
+    print()
+    return results
+
+
+class _DictPuzzleState:
+    """The PuzzleState layout before __slots__: a __dict__ and an uncached hash."""
+
+    def __init__(self, state):
+        self.state = tuple(state)
+        self.empty_pos = self.state.index(0)
+
+    def __hash__(self):
+        return hash(self.state)
+
+    def __eq__(self, other):
+        return self.state == other.state if isinstance(other, _DictPuzzleState) else False
+
+
+def bench_state_layout(count: int = 100000, lookups: int = 500000) -> Dict[str, Dict[str, float]]:
+    """
+    Compare memory per object and set-lookup throughput of PuzzleState
+    against the previous __dict__-based layout.
+
+    Memory is measured with tracemalloc over `count` instances sharing the
+    same tile tuples, so only per-object overhead is counted: the object,
+    its cached hash and its slot in the list holding it. Lookups probe
+    a set of all instances with equal-but-distinct objects, as the solver
+    does with freshly generated neighbors.
+
+    Args:
+        count: Number of states to create
+        lookups: Number of set membership tests
+
+    Returns:
+        Dictionary mapping class label to bytes per object and lookups/s
+    """
+    import tracemalloc
+    from puzzle_solver.state_space import exact_distances
+    from puzzle_solver.puzzle_state import PuzzleState
+
+    tiles = list(exact_distances())[:count]
+    probes = [tiles[i % len(tiles)] for i in range(lookups)]
+
+    print(f"PuzzleState layout ({len(tiles)} objects, {lookups} set lookups)")
+    print("-" * 70)
+    results = {}
+    for label, cls in (("dict (previous)", _DictPuzzleState), ("slots + cached hash", PuzzleState)):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [cls(t) for t in tiles]
+        bytes_per_object = (tracemalloc.get_traced_memory()[0] - before) / len(objects)
+        tracemalloc.stop()
+
+        members = set(objects)
+        probe_objects = [cls(t) for t in probes]
+        start = time.perf_counter()
+        for probe in probe_objects:
+            probe in members
+        rate = lookups / (time.perf_counter() - start)
+
+        results[label] = {"bytes_per_object": bytes_per_object, "lookups_per_second": rate}
+        print(f"{label:<24} {bytes_per_object:>8.1f} bytes/object  {rate / 1e6:>8.2f} M lookups/s")
+
+    previous = results["dict (previous)"]["bytes_per_object"]
+    saved = previous - results["slots + cached hash"]["bytes_per_object"]
+    print(f"Saved {saved:.1f} bytes/object ({saved / previous:.1%}): 3 slots plus a 30-bit cached hash")
+    print()
+    return results
+
+
+def bench_pooled_solver(count: int = 1000, max_walk: int = 16, seed: int = 0) -> Dict[str, float]:
+    """
+    Compare solve throughput on a stream of small instances with and
+    without pooled scratch structures.
+
+    Instances are short random walks from the goal, the workload where
+    per-solve allocation dominates.
+
+    Args:
+        count: Number of instances in the stream
+        max_walk: Maximum random-walk length used to scramble each instance
+        seed: Random seed
+
+    Returns:
+        Dictionary mapping solver label to solves per second
+    """
+    from puzzle_solver.puzzle_state import PuzzleState
+    from puzzle_solver.heuristics import h3
+    from puzzle_solver.branch_and_bound import BranchAndBoundSolver, PooledBranchAndBoundSolver
+
+    rng = random.Random(seed)
+    stream = []
+    for _ in range(count):
+        state = PuzzleState()
+        for _ in range(rng.randint(4, max_walk)):
+            state = rng.choice(state.get_neighbors())
+        stream.append(state)
+
+    print(f"Small-instance stream ({count} instances, random walks of 4-{max_walk} moves, H3)")
+    print("-" * 70)
+    rates = {}
+    for label, solver in (("BranchAndBoundSolver", BranchAndBoundSolver(h3)),
+                          ("PooledBranchAndBoundSolver", PooledBranchAndBoundSolver(h3))):
+        start = time.perf_counter()
+        for state in stream:
+            solver.solve(state)
+        rates[label] = count / (time.perf_counter() - start)
+        print(f"{label:<36} {rates[label]:>10.1f} solves/s")
+
+    print()
+    return rates
+
+
+def bench_parallel_ida(max_workers: int = None, count: int = 5) -> Dict[int, float]:
+    """
+    Speedup curve of ParallelIDAStarSolver for 1..max_workers workers on
+    the hardest 8-puzzle instances (31 moves), with H3.
+
+    Args:
+        max_workers: Largest worker count measured (default: CPU count)
+        count: Number of 31-move instances solved per worker count
+
+    Returns:
+        Dictionary mapping worker count to speedup over serial IDA*
+    """
+    import os
+    from puzzle_solver.heuristics import h3
+    from puzzle_solver.ida_star import IDAStarSolver
+    from puzzle_solver.parallel import ParallelIDAStarSolver
+    from puzzle_solver.state_space import states_at_depth
+
+    max_workers = max_workers or os.cpu_count() or 1
+    instances = states_at_depth(31)[:count]
+
+    def total_time(solver) -> float:
+        start = time.perf_counter()
+        for state in instances:
+            solver.solve(state)
+        return time.perf_counter() - start
+
+    serial = total_time(IDAStarSolver(h3))
+    print(f"Parallel IDA* speedup ({len(instances)} instances at depth 31, H3, "
+          f"{os.cpu_count()} CPUs)")
+    print("-" * 70)
+    print(f"{'Serial IDA*':<20} {serial:>8.2f}s")
+    speedups = {}
+    for workers in range(1, max_workers + 1):
+        elapsed = total_time(ParallelIDAStarSolver(h3, workers=workers))
+        speedups[workers] = serial / elapsed
+        print(f"{workers:>2} worker(s){'':<9} {elapsed:>8.2f}s   speedup {speedups[workers]:>5.2f}x")
+
+    print()
+    return speedups
+
+
+def bench_solution_encoding(count: int = 50) -> Dict[str, Dict[str, float]]:
+    """
+    Compare the size of solutions stored as state lists and as MoveSequence,
+    on optimal solutions of the hardest (30- and 31-move) instances.
+
+    Args:
+        count: Number of solutions
+
+    Returns:
+        Dictionary mapping representation to mean payload bytes and
+        mean in-memory bytes per solution
+    """
+    import json
+    import pickle
+    from puzzle_solver.heuristics import h3
+    from puzzle_solver.ida_star import IDAStarSolver
+    from puzzle_solver.moves import MoveSequence
+    from puzzle_solver.state_space import states_at_depth
+
+    solver = IDAStarSolver(h3)
+    instances = (states_at_depth(31) + states_at_depth(30))[:count]
+    paths = [solver.solve(state)[0] for state in instances]
+    sequences = [MoveSequence.from_path(path) for path in paths]
+
+    def path_memory(path) -> int:
+        # The list, each state object and its tile tuple (small ints are shared)
+        return sys.getsizeof(path) + sum(sys.getsizeof(s) + sys.getsizeof(s.state) for s in path)
+
+    def sequence_memory(seq) -> int:
+        return sys.getsizeof(seq) + sys.getsizeof(seq.start) + sys.getsizeof(seq.bits)
+
+    sizes = {
+        "State list (pickle)": {
+            "payload": sum(len(pickle.dumps(p)) for p in paths) / len(paths),
+            "memory": sum(path_memory(p) for p in paths) / len(paths),
+        },
+        "State list (JSON)": {
+            "payload": sum(len(json.dumps([list(s.state) for s in p])) for p in paths) / len(paths),
+            "memory": sum(path_memory(p) for p in paths) / len(paths),
+        },
+        "MoveSequence (bytes)": {
+            "payload": sum(len(m.to_bytes()) for m in sequences) / len(sequences),
+            "memory": sum(sequence_memory(m) for m in sequences) / len(sequences),
+        },
+        "MoveSequence (JSON)": {
+            "payload": sum(len(json.dumps(m.to_dict())) for m in sequences) / len(sequences),
+            "memory": sum(sequence_memory(m) for m in sequences) / len(sequences),
+        },
+    }
+
+    print(f"Solution encoding ({len(paths)} optimal 30-31 move solutions)")
+    print("-" * 70)
+    print(f"{'Representation':<24} {'Payload bytes':>14} {'Memory bytes':>14}")
+    for label, size in sizes.items():
+        print(f"{label:<24} {size['payload']:>14.1f} {size['memory']:>14.1f}")
+
+    print()
+    return sizes
+
+
+def bench_tie_breaking(count: int = 30, min_depth: int = 20, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """
+    Compare open-list tie-breaking policies on deep instances.
+
+    Args:
+        count: Number of instances
+        min_depth: Minimum optimal solution length of the instances
+        seed: Random seed for sampling instances and the "random" policy
+
+    Returns:
+        Dictionary mapping "heuristic / policy" to mean nodes expanded and
+        mean time
+    """
+    from puzzle_solver.puzzle_state import PuzzleState
+    from puzzle_solver.heuristics import h3, h5
+    from puzzle_solver.branch_and_bound import BranchAndBoundSolver, TIE_BREAKING_POLICIES
+    from puzzle_solver.state_space import exact_distances
+
+    rng = random.Random(seed)
+    deep = [tiles for tiles, depth in exact_distances().items() if depth >= min_depth]
+    instances = [PuzzleState(tiles) for tiles in rng.sample(deep, count)]
+
+    print(f"Tie-breaking policies ({count} instances with optimal cost >= {min_depth})")
+    print("-" * 70)
+    print(f"{'Heuristic':<24} {'Policy':<10} {'Mean nodes':>12} {'Mean time (s)':>14}")
+    results = {}
+    for heuristic in (h3, h5):
+        for policy in TIE_BREAKING_POLICIES:
+            solver = BranchAndBoundSolver(heuristic, tie_breaking=policy, seed=seed)
+            nodes = 0
+            start = time.perf_counter()
+            for state in instances:
+                nodes += solver.solve(state)[1].nodes_expanded
+            elapsed = time.perf_counter() - start
+            label = f"{heuristic.get_name().split(':')[0]} / {policy}"
+            results[label] = {"nodes": nodes / count, "time": elapsed / count}
+            print(f"{heuristic.get_name():<24} {policy:<10} {nodes / count:>12.1f} {elapsed / count:>14.4f}")
+
+    print()
+    return results
+
+
+def bench_ranking(count: int = 100000, seed: int = 0) -> Dict[str, float]:
+    """
+    Measure throughput of the board rankings, one board at a time and
+    batched with NumPy.
+
+    Args:
+        count: Number of solvable boards ranked and unranked
+        seed: Random seed for sampling boards
+
+    Returns:
+        Dictionary mapping operation to boards per second
+    """
+    from puzzle_solver import ranking
+    from puzzle_solver.puzzle_state import PuzzleState
+    from puzzle_solver.state_space import exact_distances, solvable_state_arrays
+
+    rng = random.Random(seed)
+    boards = rng.sample(list(exact_distances()), count)
+    full = [ranking.rank(tiles) for tiles in boards]
+    solvable = [ranking.rank_solvable(tiles) for tiles in boards]
+    keys = [PuzzleState(tiles).pack() for tiles in boards]
+    states, _ = solvable_state_arrays()
+    batch = states[:count]
+
+    operations = (
+        ("rank", lambda: [ranking.rank(tiles) for tiles in boards]),
+        ("unrank", lambda: [ranking.unrank(index) for index in full]),
+        ("rank_solvable", lambda: [ranking.rank_solvable(tiles) for tiles in boards]),
+        ("unrank_solvable", lambda: [ranking.unrank_solvable(index) for index in solvable]),
+        ("rank_solvable_packed", lambda: [ranking.rank_solvable_packed(key) for key in keys]),
+        ("rank_batch", lambda: ranking.rank_batch(batch)),
+        ("unrank_batch", lambda: ranking.unrank_batch(full)),
+        ("rank_solvable_batch", lambda: ranking.rank_solvable_batch(batch)),
+        ("unrank_solvable_batch", lambda: ranking.unrank_solvable_batch(solvable)),
+    )
+
+    print(f"Board ranking ({count} solvable boards)")
+    print("-" * 70)
+    results = {}
+    for label, operation in operations:
+        start = time.perf_counter()
+        operation()
+        rate = count / (time.perf_counter() - start)
+        results[label] = rate
+        print(f"{label:<24} {rate / 1e6:>8.2f} M boards/s")
+
+    print()
+    return results
+
+
+BENCHMARKS = {
+    "import_time": bench_import_time,
+    "state_layout": bench_state_layout,
+    "pooled_solver": bench_pooled_solver,
+    "parallel_ida": bench_parallel_ida,
+    "solution_encoding": bench_solution_encoding,
+    "tie_breaking": bench_tie_breaking,
+    "ranking": bench_ranking,
+}
+
+
+def main():
+    """Run the benchmarks named on the command line (default: all)."""
+    names = sys.argv[1:] or list(BENCHMARKS)
+
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark: {name}. Available: {', '.join(BENCHMARKS)}")
+            return 1
+        BENCHMARKS[name]()
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -3,10 +3,48 @@ Branch and Bound search algorithm for the 8-puzzle problem.
 """
 
 from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from .puzzle_state import PuzzleState
 from .heuristics import Heuristic
+from .telemetry import DEFAULT_INTERVAL, TelemetrySampler
+from .checkpoint import (
+    DEFAULT_CHECKPOINT_INTERVAL, CheckpointLog, pack_boards, unpack_boards, pack_path, unpack_path,
+    pack_words, unpack_words
+)
+import sys
 import time
+import heapq
+import random
+from collections import deque
+from itertools import islice
+from operator import itemgetter
+
+
+# Which nodes feed SearchStatistics.lower_bound_sum / lower_bound_count
+LOWER_BOUND_MODES = ("expanded", "generated")
+
+# Order among open nodes with equal f:
+#   fifo    - first generated first (the original behavior)
+#   lifo    - last generated first
+#   deep_g  - highest g first, then fifo
+#   low_h   - lowest h first, then fifo (same order as deep_g for equal f)
+#   random  - uniformly random
+TIE_BREAKING_POLICIES = ("fifo", "lifo", "deep_g", "low_h", "random")
+
+# When the search stops once a solution is known:
+#   drain - when the open list is empty; nodes that cannot beat the
+#           incumbent are popped and pruned one by one (the original behavior)
+#   bound - as soon as the lowest f in the open list reaches the incumbent
+#           cost; no remaining node can lead to a cheaper solution, so the
+#           result is the same with an admissible heuristic
+TERMINATION_MODES = ("drain", "bound")
+
+# Where a state is tested for being the goal:
+#   expansion  - when it is popped from the open list (the original behavior)
+#   generation - when it is generated; the goal becomes the incumbent at
+#                once but is only known to be optimal when the search
+#                terminates, since a cheaper path may still be open
+GOAL_TEST_MODES = ("expansion", "generation")
 
 
 @dataclass
@@ -20,6 +58,20 @@ class SearchStatistics:
     execution_time: float
     lower_bound_sum: float
     lower_bound_count: int
+    heuristic_calls: int = 0
+    # Cost of the first solution found and nodes expanded after it
+    first_solution_cost: int = 0
+    nodes_after_solution: int = 0
+    # Memory: most open-list entries at once, most states held in the
+    # visited table (best known g-values; the current path for IDA*) and
+    # estimated bytes per held state
+    peak_frontier: int = 0
+    peak_closed: int = 0
+    bytes_per_node: float = 0
+    # Measured only when profiled (see memory_profile.py): peak bytes
+    # allocated during the solve and peak resident set size of the process
+    peak_memory: int = 0
+    peak_rss: int = 0
     
     @property
     def average_lower_bound(self) -> float:
@@ -44,15 +96,73 @@ class BranchAndBoundSolver:
     - h(n) is the lower bound (heuristic) estimate from n to goal
     """
     
-    def __init__(self, heuristic: Heuristic):
+    def __init__(self, heuristic: Heuristic, lower_bound_mode: str = "expanded",
+                 tie_breaking: str = "fifo", seed: Optional[int] = None,
+                 termination: str = "drain", goal_test: str = "expansion",
+                 telemetry=None, telemetry_interval: int = DEFAULT_INTERVAL,
+                 checkpoint: Optional[CheckpointLog] = None,
+                 checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL):
         """
         Initialize solver with a heuristic.
         
         Args:
             heuristic: Heuristic function to use for search
+            lower_bound_mode: Average the lower bound over "expanded" nodes
+                              (popped from the open list) or over every
+                              "generated" node; generated nodes get their
+                              exact h, so the heuristic cannot stop early
+                              on nodes that are about to be pruned
+            tie_breaking: Order among nodes with equal f, one of
+                          TIE_BREAKING_POLICIES
+            seed: Random seed for the "random" policy
+            termination: When to stop once a solution is known, one of
+                         TERMINATION_MODES
+            goal_test: Test for the goal at "expansion" or at "generation"
+            telemetry: Optional callable receiving a telemetry.TelemetrySample
+                       every `telemetry_interval` expansions and at the end
+            telemetry_interval: Expansions between telemetry samples
+            checkpoint: Optional log the search state is written to every
+                        `checkpoint_interval` expansions; a solve of the
+                        same board with the same log resumes from it
+            checkpoint_interval: Expansions between checkpoints
         """
+        if lower_bound_mode not in LOWER_BOUND_MODES:
+            raise ValueError(f"lower_bound_mode must be one of {LOWER_BOUND_MODES}")
+        if tie_breaking not in TIE_BREAKING_POLICIES:
+            raise ValueError(f"tie_breaking must be one of {TIE_BREAKING_POLICIES}")
+        if termination not in TERMINATION_MODES:
+            raise ValueError(f"termination must be one of {TERMINATION_MODES}")
+        if goal_test not in GOAL_TEST_MODES:
+            raise ValueError(f"goal_test must be one of {GOAL_TEST_MODES}")
         self.heuristic = heuristic
+        self.lower_bound_mode = lower_bound_mode
+        self.tie_breaking = tie_breaking
+        self.termination = termination
+        self.goal_test = goal_test
+        self.telemetry = telemetry
+        self.telemetry_interval = telemetry_interval
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self.rng = random.Random(seed)
         self.statistics = None
+        
+        # Encodings reused by the next checkpoint of the current solve: the
+        # boards of the first best_g keys (keys are only ever added), and
+        # sequence number -> h byte and encoded path of the open-list entries
+        self._packed_closed = b""
+        self._packed_entries: Dict[int, bytes] = {}
+    
+    def _tie_key(self, g_value: int, h_value: int, sequence: int):
+        """Secondary open-list key among nodes with equal f (lower pops first)."""
+        if self.tie_breaking == "fifo":
+            return 0
+        if self.tie_breaking == "lifo":
+            return -sequence
+        if self.tie_breaking == "deep_g":
+            return -g_value
+        if self.tie_breaking == "low_h":
+            return h_value
+        return self.rng.random()
     
     def solve(self, initial_state: PuzzleState) -> Tuple[Optional[List[PuzzleState]], SearchStatistics]:
         """
@@ -96,48 +206,78 @@ class BranchAndBoundSolver:
         # Initialize best solution cost to infinity
         best_solution_cost = float('inf')
         best_solution_path = None
+        count_generated = self.lower_bound_mode == "generated"
+        stop_at_bound = self.termination == "bound"
+        test_generated = self.goal_test == "generation"
         
-        # Open list (priority queue): (f_value, g_value, state, path)
+        # Open list (binary heap): (f_value, tie key, sequence, g_value, state, path, h_value);
+        # the generation sequence number keeps equal keys first-in first-out
         open_list = []
-        open_set = set()
+        sequence = 0
+        
+        # Cheapest known path cost to each generated state; a state is
+        # queued again only when a strictly cheaper path to it is found
+        best_g = {initial_state: 0}
         
         # Initialize open list with initial state
         h_initial = self.heuristic.compute(initial_state)
+        stats.heuristic_calls += 1
+        if count_generated:
+            stats.lower_bound_sum += h_initial
+            stats.lower_bound_count += 1
         f_initial = h_initial
-        open_list.append((f_initial, 0, initial_state, [initial_state]))
-        open_set.add(initial_state)
+        open_list.append((f_initial, self._tie_key(0, h_initial, 0), 0, 0, initial_state, [initial_state], h_initial))
+        peak_frontier = 1
         
-        # Closed set for visited states
-        closed_set = set()
+        # Continue a checkpointed search of this board instead
+        checkpoint = self.checkpoint
+        if checkpoint is not None:
+            self._packed_closed, self._packed_entries = b"", {}
+            resumed = self._load_checkpoint(initial_state)
+            if resumed is not None:
+                (stats, open_list, best_g, sequence, best_solution_cost,
+                 best_solution_path, peak_frontier) = resumed
+                start_time -= stats.execution_time
+            next_checkpoint = stats.nodes_expanded + self.checkpoint_interval
         
-        # Sort by f-value (we'll manually maintain priority)
-        open_list.sort(key=lambda x: x[0])
+        telemetry, interval = self.telemetry, self.telemetry_interval
+        sampler = TelemetrySampler(stats.heuristic_name) if telemetry is not None else None
         
         while open_list:
-            # Get node with minimum f-value
-            open_list.sort(key=lambda x: x[0])
-            f_value, g_value, current_state, path = open_list.pop(0)
+            if checkpoint is not None and stats.nodes_expanded >= next_checkpoint:
+                stats.execution_time = time.time() - start_time
+                self._save_checkpoint(initial_state, stats, open_list, best_g, sequence,
+                                      best_solution_cost, best_solution_path, peak_frontier)
+                next_checkpoint = stats.nodes_expanded + self.checkpoint_interval
+            
+            # Nothing left in the open list can beat the incumbent
+            if stop_at_bound and open_list[0][0] >= best_solution_cost:
+                break
             
-            if current_state in open_set:
-                open_set.remove(current_state)
+            # Get node with minimum f-value
+            f_value, _, _, g_value, current_state, path, h_value = heapq.heappop(open_list)
             
-            # Skip if we've already visited this state
-            if current_state in closed_set:
+            # Skip entries superseded by a cheaper path to the same state
+            if g_value > best_g[current_state]:
                 continue
             
-            closed_set.add(current_state)
             stats.nodes_expanded += 1
+            if telemetry is not None and stats.nodes_expanded % interval == 0:
+                telemetry(sampler.sample(stats.nodes_expanded, f_value, len(open_list), best_solution_cost))
+            if stats.solution_found:
+                stats.nodes_after_solution += 1
+            if not count_generated:
+                stats.lower_bound_sum += h_value
+                stats.lower_bound_count += 1
             
             # Prune: if current lower bound + g >= best solution, skip
-            h_value = self.heuristic.compute(current_state)
-            stats.lower_bound_sum += h_value
-            stats.lower_bound_count += 1
-            
             if g_value + h_value >= best_solution_cost:
                 continue
             
             # Check if goal
             if current_state.is_goal():
+                if not stats.solution_found:
+                    stats.first_solution_cost = g_value
                 best_solution_cost = g_value
                 best_solution_path = path
                 stats.solution_found = True
@@ -146,23 +286,181 @@ class BranchAndBoundSolver:
                 continue
             
             # Expand neighbors
+            new_g = g_value + 1
             for neighbor in current_state.get_neighbors():
-                if neighbor not in closed_set and neighbor not in open_set:
-                    new_g = g_value + 1
+                if new_g >= best_g.get(neighbor, float('inf')):
+                    continue
+                
+                # Record a generated goal as the incumbent instead of queueing it
+                if test_generated and neighbor.is_goal():
+                    if new_g < best_solution_cost:
+                        if not stats.solution_found:
+                            stats.first_solution_cost = new_g
+                        best_g[neighbor] = new_g
+                        best_solution_cost = new_g
+                        best_solution_path = path + [neighbor]
+                        stats.solution_found = True
+                        stats.solution_length = new_g
+                        stats.optimal_cost = new_g
+                    continue
+                
+                # Anything at or above this h is pruned below, so the
+                # heuristic may stop evaluating once it gets there, unless
+                # every generated node's exact bound is being recorded
+                if count_generated:
                     h_neighbor = self.heuristic.compute(neighbor)
-                    f_neighbor = new_g + h_neighbor
-                    
-                    # Only add if potentially better than current best
-                    if f_neighbor < best_solution_cost:
-                        new_path = path + [neighbor]
-                        open_list.append((f_neighbor, new_g, neighbor, new_path))
-                        open_set.add(neighbor)
+                else:
+                    h_neighbor = self.heuristic.compute_bounded(neighbor, best_solution_cost - new_g)
+                stats.heuristic_calls += 1
+                if count_generated:
+                    stats.lower_bound_sum += h_neighbor
+                    stats.lower_bound_count += 1
+                f_neighbor = new_g + h_neighbor
+                
+                # Only add if potentially better than current best
+                if f_neighbor < best_solution_cost:
+                    best_g[neighbor] = new_g
+                    sequence += 1
+                    heapq.heappush(open_list, (f_neighbor, self._tie_key(new_g, h_neighbor, sequence), sequence,
+                                               new_g, neighbor, path + [neighbor], h_neighbor))
+            
+            if len(open_list) > peak_frontier:
+                peak_frontier = len(open_list)
+        
+        # Every state ever queued stays in best_g, so its final size is the peak
+        stats.peak_frontier = peak_frontier
+        stats.peak_closed = len(best_g)
+        stats.bytes_per_node = self._estimate_node_bytes(initial_state, stats.solution_length)
+        if telemetry is not None:
+            telemetry(sampler.sample(stats.nodes_expanded, best_solution_cost if stats.solution_found else 0,
+                                     len(open_list), best_solution_cost, done=True))
+        if checkpoint is not None:
+            checkpoint.clear()
+            self._packed_closed, self._packed_entries = b"", {}
         
         stats.execution_time = time.time() - start_time
         self.statistics = stats
         
         return best_solution_path, stats
     
+    def _checkpoint_header(self, initial_state: PuzzleState) -> dict:
+        """Settings a checkpoint must have been written with to be resumed."""
+        return {
+            "solver": "branch_and_bound",
+            "heuristic": self.heuristic.get_name(),
+            "start": initial_state.pack(),
+            "lower_bound_mode": self.lower_bound_mode,
+            "tie_breaking": self.tie_breaking,
+            "termination": self.termination,
+            "goal_test": self.goal_test,
+        }
+    
+    def _save_checkpoint(self, initial_state: PuzzleState, stats: SearchStatistics, open_list: list,
+                         best_g: Dict[PuzzleState, int], sequence: int, best_solution_cost: float,
+                         best_solution_path: Optional[List[PuzzleState]], peak_frontier: int):
+        """
+        Write the search state to the checkpoint log, replacing the last one.
+        
+        Data: the best_g boards and their g-values, then the sequence
+        numbers and g-values of the open-list entries and, per entry, its
+        h-value and path. f and the tie keys are recomputed on resume.
+        
+        Only the boards added to best_g and the entries queued since the last
+        checkpoint are encoded; the rest is reused from it.
+        """
+        packed_closed = self._packed_closed
+        if len(packed_closed) < 9 * len(best_g):
+            packed_closed += pack_boards(islice(best_g, len(packed_closed) // 9, None))
+            self._packed_closed = packed_closed
+        
+        entries = self._packed_entries
+        for seq in entries.keys() - set(map(itemgetter(2), open_list)):
+            del entries[seq]
+        for _, _, seq, _, _, path, h_value in [entry for entry in open_list if entry[2] not in entries]:
+            entries[seq] = bytes((h_value,)) + pack_path(path)
+        
+        data = [
+            packed_closed,
+            bytes(best_g.values()),
+            pack_words(entries),
+            # g-value: the path length, one byte less than the entry
+            bytes([len(packed) - 1 for packed in entries.values()]),
+        ]
+        data.extend(entries.values())
+        
+        header = self._checkpoint_header(initial_state)
+        header.update(
+            stats=asdict(stats),
+            closed=len(best_g),
+            open=len(open_list),
+            sequence=sequence,
+            peak_frontier=peak_frontier,
+            incumbent=None if best_solution_path is None else list(pack_path(best_solution_path)),
+        )
+        self.checkpoint.save(header, b"".join(data))
+    
+    def _load_checkpoint(self, initial_state: PuzzleState):
+        """
+        Read the last checkpoint of this search, if any.
+        
+        Tie keys are recomputed, so the "random" policy draws new ones.
+        
+        Returns:
+            None, or a tuple of (stats, open_list, best_g, sequence,
+            best_solution_cost, best_solution_path, peak_frontier)
+        
+        Raises:
+            ValueError: If the log holds a checkpoint of another search
+        """
+        record = self.checkpoint.load()
+        if record is None:
+            return None
+        header, data = record
+        expected = self._checkpoint_header(initial_state)
+        if any(header.get(key) != value for key, value in expected.items()):
+            raise ValueError(f"Checkpoint log {self.checkpoint.path} holds a different search")
+        
+        closed, count = header["closed"], header["open"]
+        offset = 9 * closed
+        best_g = dict(zip(unpack_boards(data[:offset], type(initial_state)), data[offset:offset + closed]))
+        offset += closed
+        sequences = unpack_words(data[offset:offset + 8 * count])
+        offset += 8 * count
+        g_values = data[offset:offset + count]
+        offset += count
+        
+        open_list = []
+        for seq, g_value in zip(sequences, g_values):
+            h_value = data[offset]
+            path = unpack_path(initial_state, data[offset + 1:offset + 1 + g_value])
+            offset += 1 + g_value
+            open_list.append((g_value + h_value, self._tie_key(g_value, h_value, seq), seq,
+                              g_value, path[-1], path, h_value))
+        heapq.heapify(open_list)
+        
+        best_solution_cost, best_solution_path = float('inf'), None
+        if header["incumbent"] is not None:
+            best_solution_path = unpack_path(initial_state, bytes(header["incumbent"]))
+            best_solution_cost = len(best_solution_path) - 1
+        
+        return (SearchStatistics(**header["stats"]), open_list, best_g, header["sequence"],
+                best_solution_cost, best_solution_path, header["peak_frontier"])
+    
+    @staticmethod
+    def _estimate_node_bytes(state: PuzzleState, depth: int) -> int:
+        """
+        Estimate memory per held state: the board, its best-g entry, and an
+        open-list entry whose path has the average length over depths
+        0..depth.
+        """
+        path = [state] * (depth // 2 + 1)
+        entry = (0, 0, 0, 0, state, path, 0)
+        return (
+            sys.getsizeof(state) + sys.getsizeof(state.state)
+            + 3 * 8  # hash, key and value of the dictionary slot
+            + sys.getsizeof(entry) + sys.getsizeof(path)
+        )
+    
     def solve_multiple(self, initial_states: List[PuzzleState]) -> List[Tuple[Optional[List[PuzzleState]], SearchStatistics]]:
         """
         Solve multiple puzzle instances.
@@ -178,3 +476,273 @@ class BranchAndBoundSolver:
             result = self.solve(state)
             results.append(result)
         return results
+
+
+class PooledBranchAndBoundSolver(BranchAndBoundSolver):
+    """
+    Branch and Bound solver that reuses its scratch structures across solves.
+    
+    Expands nodes in the same order as BranchAndBoundSolver (lowest f first,
+    first-in first-out among equal f) and returns identical results, but
+    replaces the heap and the per-node path lists:
+    - The frontier is an array of first-in first-out buckets indexed by f
+      (costs and heuristics are integers), so pushing and popping a node is
+      O(1) instead of a sift over tuple comparisons. A solve drains the
+      buckets it uses, so they are kept for the next solve as they are.
+    - Nodes live in parallel arrays (state, parent index, g) that are
+      overwritten in place; h is recovered as f - g from the bucket a node
+      is popped from, and solution paths are rebuilt from parent indices
+      instead of copying a path list into every node.
+    - Best known g-values are kept in a dictionary local to each solve, so
+      no board outlives the solve that generated it.
+    """
+    
+    def __init__(self, heuristic: Heuristic, initial_capacity: int = 4096, max_f: int = 64,
+                 lower_bound_mode: str = "expanded", tie_breaking: str = "fifo", termination: str = "drain",
+                 goal_test: str = "expansion", telemetry=None, telemetry_interval: int = DEFAULT_INTERVAL):
+        """
+        Initialize solver and preallocate scratch structures.
+        
+        Args:
+            heuristic: Heuristic function to use for search
+            initial_capacity: Initial number of node slots
+            max_f: Initial number of f-value buckets
+            lower_bound_mode: "expanded" or "generated", as in BranchAndBoundSolver
+            tie_breaking: Must be "fifo"; other policies need BranchAndBoundSolver
+            termination: "drain" or "bound", as in BranchAndBoundSolver
+            goal_test: "expansion" or "generation", as in BranchAndBoundSolver
+            telemetry: Telemetry callback, as in BranchAndBoundSolver
+            telemetry_interval: Expansions between telemetry samples
+        """
+        # Buckets are first-in first-out, so only the "fifo" policy is supported
+        if tie_breaking != "fifo":
+            raise ValueError(f"PooledBranchAndBoundSolver only supports tie_breaking='fifo', got {tie_breaking!r}; "
+                             f"use BranchAndBoundSolver for other policies")
+        super().__init__(heuristic, lower_bound_mode, termination=termination, goal_test=goal_test,
+                         telemetry=telemetry, telemetry_interval=telemetry_interval)
+        
+        self._buckets: List[deque] = [deque() for _ in range(max_f)]
+        
+        self._node_state: List[Optional[PuzzleState]] = [None] * initial_capacity
+        self._node_parent = [0] * initial_capacity
+        self._node_g = [0] * initial_capacity
+    
+    def _grow_buckets(self, f_value: int):
+        """Add buckets so that index f_value exists."""
+        self._buckets.extend(deque() for _ in range(f_value + 1 - len(self._buckets)))
+    
+    @staticmethod
+    def _estimate_node_bytes(state: PuzzleState, depth: int) -> int:
+        """
+        Estimate memory per held state: the board, its best-g entry, and one
+        slot in each node array and in a bucket (paths are not stored).
+        """
+        return sys.getsizeof(state) + sys.getsizeof(state.state) + 3 * 8 + 4 * 8
+    
+    def _grow_nodes(self):
+        """Double the node arrays."""
+        extra = len(self._node_state)
+        self._node_state.extend([None] * extra)
+        self._node_parent.extend([0] * extra)
+        self._node_g.extend([0] * extra)
+    
+    def solve(self, initial_state: PuzzleState) -> Tuple[Optional[List[PuzzleState]], SearchStatistics]:
+        """
+        Solve the puzzle using Branch and Bound search with pooled scratch space.
+        
+        Args:
+            initial_state: Starting puzzle state
+        
+        Returns:
+            Tuple of (solution_path, statistics), as BranchAndBoundSolver.solve
+        """
+        start_time = time.time()
+        
+        stats = SearchStatistics(
+            heuristic_name=self.heuristic.get_name(),
+            solution_found=False,
+            solution_length=0,
+            nodes_expanded=0,
+            optimal_cost=0,
+            execution_time=0,
+            lower_bound_sum=0,
+            lower_bound_count=0
+        )
+        
+        if not initial_state.is_solvable():
+            stats.execution_time = time.time() - start_time
+            return None, stats
+        
+        if initial_state.is_goal():
+            stats.solution_found = True
+            stats.execution_time = time.time() - start_time
+            return [initial_state], stats
+        
+        buckets = self._buckets
+        num_buckets = len(buckets)
+        node_state, node_parent, node_g = self._node_state, self._node_parent, self._node_g
+        capacity = len(node_state)
+        heuristic = self.heuristic
+        compute, compute_bounded = heuristic.compute, heuristic.compute_bounded
+        best_g = {initial_state: 0}
+        best_g_get = best_g.get
+        inf = float('inf')
+        
+        best_solution_cost = inf
+        best_node = -1
+        solution_found = False
+        count_generated = self.lower_bound_mode == "generated"
+        stop_at_bound = self.termination == "bound"
+        test_generated = self.goal_test == "generation"
+        
+        # Counters are kept in locals and stored in stats at the end
+        nodes_expanded = nodes_after_solution = 0
+        lower_bound_sum = lower_bound_count = 0
+        
+        h_initial = heuristic.compute(initial_state)
+        heuristic_calls = 1
+        if count_generated:
+            lower_bound_sum += h_initial
+            lower_bound_count += 1
+        if h_initial >= num_buckets:
+            self._grow_buckets(h_initial)
+            num_buckets = len(buckets)
+        node_state[0], node_parent[0], node_g[0] = initial_state, -1, 0
+        node_count = 1
+        buckets[h_initial].append(0)
+        
+        # Queued bucket entries, stale ones included, as in the heap
+        open_count = peak_frontier = 1
+        
+        telemetry, interval = self.telemetry, self.telemetry_interval
+        sampler = TelemetrySampler(stats.heuristic_name) if telemetry is not None else None
+        
+        f_current = h_initial
+        while True:
+            # Find the lowest non-empty bucket
+            while f_current < num_buckets and not buckets[f_current]:
+                f_current += 1
+            if f_current == num_buckets or (stop_at_bound and f_current >= best_solution_cost):
+                break
+            
+            node = buckets[f_current].popleft()
+            open_count -= 1
+            current_state = node_state[node]
+            g_value = node_g[node]
+            
+            # Skip nodes superseded by a cheaper path to the same state
+            if g_value > best_g[current_state]:
+                continue
+            
+            h_value = f_current - g_value
+            nodes_expanded += 1
+            if telemetry is not None and nodes_expanded % interval == 0:
+                telemetry(sampler.sample(nodes_expanded, f_current, open_count, best_solution_cost))
+            if solution_found:
+                nodes_after_solution += 1
+            if not count_generated:
+                lower_bound_sum += h_value
+                lower_bound_count += 1
+            
+            if f_current >= best_solution_cost:
+                continue
+            
+            if current_state.is_goal():
+                if not solution_found:
+                    stats.first_solution_cost = g_value
+                best_solution_cost = g_value
+                best_node = node
+                solution_found = True
+                continue
+            
+            new_g = g_value + 1
+            for neighbor in current_state.get_neighbors():
+                if new_g >= best_g_get(neighbor, inf):
+                    continue
+                
+                if test_generated and neighbor.is_goal():
+                    if new_g < best_solution_cost:
+                        if node_count == capacity:
+                            self._grow_nodes()
+                            capacity = len(node_state)
+                        node_state[node_count] = neighbor
+                        node_parent[node_count] = node
+                        node_g[node_count] = new_g
+                        if not solution_found:
+                            stats.first_solution_cost = new_g
+                        best_g[neighbor] = new_g
+                        best_solution_cost = new_g
+                        best_node = node_count
+                        solution_found = True
+                        node_count += 1
+                    continue
+                
+                if count_generated:
+                    h_neighbor = compute(neighbor)
+                else:
+                    h_neighbor = compute_bounded(neighbor, best_solution_cost - new_g)
+                heuristic_calls += 1
+                if count_generated:
+                    lower_bound_sum += h_neighbor
+                    lower_bound_count += 1
+                f_neighbor = new_g + h_neighbor
+                if f_neighbor >= best_solution_cost:
+                    continue
+                
+                if node_count == capacity:
+                    self._grow_nodes()
+                    capacity = len(node_state)
+                node_state[node_count] = neighbor
+                node_parent[node_count] = node
+                node_g[node_count] = new_g
+                best_g[neighbor] = new_g
+                
+                if f_neighbor >= num_buckets:
+                    self._grow_buckets(f_neighbor)
+                    num_buckets = len(buckets)
+                buckets[f_neighbor].append(node_count)
+                if f_neighbor < f_current:
+                    f_current = f_neighbor
+                open_count += 1
+                node_count += 1
+            
+            if open_count > peak_frontier:
+                peak_frontier = open_count
+        
+        # Stopping at the bound leaves entries behind
+        if open_count:
+            for bucket in buckets[f_current:]:
+                bucket.clear()
+        
+        best_solution_path = None
+        if best_node >= 0:
+            best_solution_path = []
+            node = best_node
+            while node >= 0:
+                best_solution_path.append(node_state[node])
+                node = node_parent[node]
+            best_solution_path.reverse()
+        
+        # Drop state references so pooled slots do not keep boards alive
+        node_state[:node_count] = [None] * node_count
+        
+        stats.nodes_expanded = nodes_expanded
+        stats.nodes_after_solution = nodes_after_solution
+        stats.heuristic_calls = heuristic_calls
+        stats.lower_bound_sum = lower_bound_sum
+        stats.lower_bound_count = lower_bound_count
+        if solution_found:
+            stats.solution_found = True
+            stats.solution_length = stats.optimal_cost = best_solution_cost
+        stats.peak_frontier = peak_frontier
+        # Every state ever queued stays in best_g, so its final size is the peak
+        stats.peak_closed = len(best_g)
+        stats.bytes_per_node = self._estimate_node_bytes(initial_state, stats.solution_length)
+        if telemetry is not None:
+            telemetry(sampler.sample(nodes_expanded, best_solution_cost if solution_found else 0,
+                                     open_count, best_solution_cost, done=True))
+        
+        stats.execution_time = time.time() - start_time
+        self.statistics = stats
+        
+        return best_solution_path, stats
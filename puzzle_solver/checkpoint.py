@@ -0,0 +1,175 @@
+"""
+Checkpoints that let a killed or preempted solve resume where it stopped.
+
+Solvers that accept a `checkpoint` log write a snapshot of their search
+state to it every `checkpoint_interval` expansions. When solve() is called
+again with the same log and starting board, it resumes from the snapshot
+instead of starting over. A finished solve deletes the log, so one log
+holds one search at a time.
+
+File layout (a single record):
+    b"PZCK" magic, uint32 header length (little-endian), JSON header,
+    then header["size"] bytes of search state.
+
+Each snapshot is written to a temporary file next to the log and renamed
+over it, so the log always holds exactly one complete snapshot: its size
+stays that of the latest search state, and a process dying mid-write
+leaves the previous snapshot in place.
+
+The state is encoded in bulk so a snapshot costs a few C-level passes over
+the solver's tables: boards as their 9 tile bytes, small counts as one
+byte each, and paths as the blank position after each move.
+"""
+
+import os
+import sys
+import json
+import struct
+from array import array
+from operator import attrgetter
+from typing import Iterable, List, Optional, Tuple
+
+from .puzzle_state import PuzzleState
+
+
+MAGIC = b"PZCK"
+
+DEFAULT_CHECKPOINT_INTERVAL = 1000000
+
+_tiles = attrgetter("state")
+_blank = attrgetter("empty_pos")
+
+
+class CheckpointLog:
+    """File holding the latest search snapshot."""
+
+    def __init__(self, path: str, fsync: bool = False):
+        """
+        Initialize log. Nothing is read or written until a solver uses it.
+
+        Args:
+            path: Log file, created on the first checkpoint
+            fsync: Force every snapshot to disk before renaming it into
+                   place; only needed to survive the machine, not just the
+                   process, going down
+        """
+        self.path = path
+        self.fsync = fsync
+        self.records_written = 0
+        self.bytes_written = 0
+
+    def save(self, header: dict, data: bytes):
+        """
+        Replace the snapshot.
+
+        Args:
+            header: JSON-serializable search scalars; "size" is added
+            data: Encoded search state
+        """
+        encoded = json.dumps(dict(header, size=len(data))).encode()
+        temporary = self.path + ".tmp"
+        with open(temporary, "wb") as f:
+            f.write(MAGIC + struct.pack("<I", len(encoded)) + encoded)
+            f.write(data)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(temporary, self.path)
+        self.records_written += 1
+        self.bytes_written += 8 + len(encoded) + len(data)
+
+    def load(self) -> Optional[Tuple[dict, bytes]]:
+        """
+        Read the snapshot.
+
+        Returns:
+            (header, data), or None if the log is missing or incomplete
+        """
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return None
+        with f:
+            start = f.read(8)
+            if len(start) < 8 or start[:4] != MAGIC:
+                return None
+            (header_len,) = struct.unpack("<I", start[4:])
+            try:
+                header = json.loads(f.read(header_len))
+            except ValueError:
+                return None
+            data = f.read(header["size"])
+            if len(data) < header["size"]:
+                return None
+            return header, data
+
+    def clear(self):
+        """Delete the log and any snapshot left half-written."""
+        for path in (self.path, self.path + ".tmp"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def pack_boards(states: Iterable[PuzzleState]) -> bytes:
+    """Encode boards as 9 tile bytes each."""
+    return b"".join(map(bytes, map(_tiles, states)))
+
+
+def unpack_boards(data: bytes, state_class: type = PuzzleState) -> List[PuzzleState]:
+    """
+    Decode boards written by pack_boards().
+
+    Args:
+        data: Encoded boards
+        state_class: PuzzleState or a subclass with another goal
+
+    Returns:
+        List of states
+    """
+    return [state_class(tuple(data[i:i + 9])) for i in range(0, len(data), 9)]
+
+
+def pack_path(path: List[PuzzleState]) -> bytes:
+    """Encode a path as the blank position of each state after the first."""
+    return bytes(map(_blank, path[1:]))
+
+
+def unpack_path(start: PuzzleState, blanks: bytes) -> List[PuzzleState]:
+    """
+    Rebuild a path written by pack_path().
+
+    Args:
+        start: First state of the path
+        blanks: Blank position after each move
+
+    Returns:
+        List of states from start
+    """
+    path = [start]
+    tiles = list(start.state)
+    blank = start.empty_pos
+    state_class = type(start)
+    for target in blanks:
+        tiles[blank], tiles[target] = tiles[target], 0
+        blank = target
+        path.append(state_class._from_known(tuple(tiles), blank))
+    return path
+
+
+def pack_words(values: Iterable[int]) -> bytes:
+    """Encode integers as little-endian uint64s."""
+    words = array("Q", values)
+    if sys.byteorder == "big":
+        words.byteswap()
+    return words.tobytes()
+
+
+def unpack_words(data: bytes) -> array:
+    """Decode integers written by pack_words()."""
+    words = array("Q")
+    words.frombytes(data)
+    if sys.byteorder == "big":
+        words.byteswap()
+    return words
@@ -0,0 +1,216 @@
+"""
+Source-level dependencies between the package's modules.
+
+Cached artifacts (pipeline result columns, table files) are named by a
+fingerprint of the code that produced them. Hashing only a class or a
+function misses the helpers, tables and rankings it calls in other
+modules, so fingerprints hash the source of the defining module and of
+every package module it imports instead.
+
+Imports are read from each module's syntax tree, so imports inside
+functions count, and modules are located by file, so nothing is imported.
+
+Hashing whole modules is coarse where one module holds many independent
+definitions (all heuristics live in heuristics.py), so definition_sources()
+narrows a fingerprint to one top-level definition and the definitions it
+references, followed through imports into other package modules. A
+module-level name is defined by the statements that assign or modify it,
+so a table filled by a loop or a registry populated by register() calls
+includes those statements.
+"""
+
+import os
+import ast
+import importlib.util
+from functools import lru_cache
+from typing import Dict, Tuple
+
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PACKAGE = os.path.basename(_PACKAGE_DIR)
+
+
+def _module_file(name: str) -> str:
+    """Source file of a package module ("" if `name` is not one)."""
+    parts = name.split(".")
+    if parts[0] != _PACKAGE:
+        return ""
+    base = os.path.join(os.path.dirname(_PACKAGE_DIR), *parts)
+    for path in (base + ".py", os.path.join(base, "__init__.py")):
+        if os.path.isfile(path):
+            return path
+    return ""
+
+
+@lru_cache(maxsize=None)
+def module_source(name: str) -> str:
+    """
+    Source of a package module.
+
+    Args:
+        name: Fully qualified module name
+
+    Returns:
+        Source text, or "" if `name` is not a module of this package
+    """
+    path = _module_file(name)
+    if not path:
+        return ""
+    with open(path, 'r') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def package_modules(name: str) -> Tuple[str, ...]:
+    """
+    A package module and every package module it imports, directly or indirectly.
+
+    Args:
+        name: Fully qualified module name
+
+    Returns:
+        Sorted module names (empty if `name` is not a module of this package)
+    """
+    found = set()
+    pending = [name]
+    while pending:
+        module = pending.pop()
+        source = module_source(module) if module not in found else ""
+        if not source:
+            continue
+        found.add(module)
+        is_package = _module_file(module).endswith("__init__.py")
+        package = module if is_package else module.rpartition(".")[0]
+        for node in ast.walk(ast.parse(source)):
+            if isinstance(node, ast.ImportFrom):
+                base = importlib.util.resolve_name("." * node.level + (node.module or ""), package) \
+                    if node.level else node.module
+                # "from . import name" may import a submodule
+                pending.append(base)
+                pending.extend(f"{base}.{alias.name}" for alias in node.names)
+            elif isinstance(node, ast.Import):
+                pending.extend(alias.name for alias in node.names)
+    return tuple(sorted(found))
+
+
+def _resolve(node: ast.ImportFrom, module: str) -> str:
+    """Absolute name of the module an import statement in `module` imports from."""
+    if not node.level:
+        return node.module
+    package = module if _module_file(module).endswith("__init__.py") else module.rpartition(".")[0]
+    return importlib.util.resolve_name("." * node.level + (node.module or ""), package)
+
+
+def _root_name(node: ast.AST) -> str:
+    """Name an attribute or subscript chain starts from ("" if none)."""
+    while isinstance(node, (ast.Attribute, ast.Subscript)):
+        node = node.value
+    return node.id if isinstance(node, ast.Name) else ""
+
+
+def _defined_names(statement: ast.stmt):
+    """Module-level names a statement assigns or modifies."""
+    # Comprehension variables are local to the comprehension
+    local = {id(node) for comprehension in ast.walk(statement) if isinstance(comprehension, ast.comprehension)
+             for node in ast.walk(comprehension.target)}
+    for node in ast.walk(statement):
+        if id(node) in local:
+            continue
+        if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            yield node.id
+        elif isinstance(node, (ast.Attribute, ast.Subscript)) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            yield _root_name(node)
+    # Calls made for their effect on an object, e.g. TABLES.register(...)
+    if isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Call):
+        yield _root_name(statement.value.func)
+
+
+@lru_cache(maxsize=None)
+def _definitions(module: str) -> Tuple[Dict[str, Tuple[str, ...]], Dict[str, Tuple[str, str]]]:
+    """
+    Top-level definitions and imports of a package module.
+
+    Returns:
+        Tuple of (name -> source of the statements defining it,
+        name -> (module, name) it is imported as; the name is "" for a
+        whole module)
+    """
+    source = module_source(module)
+    definitions: Dict[str, Tuple[str, ...]] = {}
+    imports: Dict[str, Tuple[str, str]] = {}
+    for statement in ast.parse(source).body:
+        segment = ast.get_source_segment(source, statement)
+        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            definitions[statement.name] = definitions.get(statement.name, ()) + (segment,)
+            continue
+        imported = False
+        for node in ast.walk(statement):
+            if isinstance(node, ast.ImportFrom):
+                imported = True
+                base = _resolve(node, module)
+                for alias in node.names:
+                    imports[alias.asname or alias.name] = (base, alias.name)
+            elif isinstance(node, ast.Import):
+                imported = True
+                for alias in node.names:
+                    # "import a.b" binds "a"; "import a.b as c" binds the module itself
+                    imports[alias.asname or alias.name.partition(".")[0]] = \
+                        (alias.name if alias.asname else alias.name.partition(".")[0], "")
+        if imported:
+            continue
+        for name in set(_defined_names(statement)) - {""}:
+            definitions[name] = definitions.get(name, ()) + (segment,)
+    return definitions, imports
+
+
+@lru_cache(maxsize=None)
+def definition_sources(module: str, name: str) -> Tuple[str, ...]:
+    """
+    Source of a top-level definition and of everything it references.
+
+    Names used in the definition are looked up among the module's own
+    definitions and imports; imported names are followed into the package
+    module defining them, and imports inside functions count too. Names
+    from outside the package (the standard library, NumPy) are not
+    followed.
+
+    Args:
+        module: Fully qualified name of the package module defining `name`
+        name: Top-level name (function, class or variable)
+
+    Returns:
+        Sources of the statements involved, in a stable order (empty if
+        `module` is not a package module or does not define `name`)
+    """
+    found: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+    pending = [(module, name)]
+    while pending:
+        key = pending.pop()
+        if key in found or not module_source(key[0]):
+            continue
+        owner, target = key
+        definitions, imports = _definitions(owner)
+        found[key] = ()
+        if target == "":
+            # A whole module, used through attribute access
+            pending.extend((owner, defined) for defined in definitions)
+            continue
+        if target in imports:
+            pending.append(imports[target])
+            continue
+        if target not in definitions:
+            # "from package import submodule" names a module
+            pending.append((f"{owner}.{target}", ""))
+            continue
+        found[key] = definitions[target]
+        for segment in definitions[target]:
+            for node in ast.walk(ast.parse(segment)):
+                if isinstance(node, ast.Name):
+                    pending.append((owner, node.id))
+                elif isinstance(node, ast.ImportFrom):
+                    base = _resolve(node, owner)
+                    pending.extend((base, alias.name) for alias in node.names)
+                elif isinstance(node, ast.Import):
+                    pending.extend((alias.name, "") for alias in node.names)
+    return tuple(f"# {owner}.{target}\n{segment}"
+                 for (owner, target), segments in sorted(found.items()) for segment in segments)
@@ -0,0 +1,232 @@
+"""
+External-memory breadth-first search over the puzzle state space.
+
+Each BFS layer is stored on disk as a sorted file of packed states
+(PuzzleState.pack(), one little-endian uint64 per state), so memory use is
+bounded by the sort chunk size rather than by the size of the layers.
+
+Expanding layer d streams it from disk, generates successors with
+PuzzleState.get_neighbors(), and writes them out as sorted runs of at most
+`chunk_size` states. Duplicate detection is delayed until the runs are
+merged: the merge drops repeated states and, in the same sequential pass,
+subtracts layers d and d-1 (in an undirected graph every neighbor of layer
+d lies in layer d-1, d or d+1). All file access is bulk and sequential.
+
+Run as a script to enumerate the 8-puzzle from the goal:
+    python -m puzzle_solver.external_bfs /path/to/scratch
+"""
+
+import os
+import sys
+import time
+import heapq
+from array import array
+from typing import Iterator, List, Optional
+
+sys.path.insert(0, '/home/luffy/class/DAA CLA2')
+
+from puzzle_solver.puzzle_state import PuzzleState
+
+
+class ExternalBFS:
+    """Disk-backed breadth-first search with delayed duplicate detection."""
+
+    def __init__(self, scratch_dir: str, chunk_size: int = 1 << 20,
+                 block_size: int = 1 << 16, keep_layers: bool = False):
+        """
+        Initialize search.
+
+        Args:
+            scratch_dir: Directory for layer and run files
+            chunk_size: Maximum successors sorted in memory before a run is written
+            block_size: Number of states read or written per I/O call
+            keep_layers: Keep all layer files instead of deleting layers
+                         that are no longer needed for duplicate detection
+        """
+        self.scratch_dir = scratch_dir
+        self.chunk_size = chunk_size
+        self.block_size = block_size
+        self.keep_layers = keep_layers
+
+        self.layer_sizes: List[int] = []
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.execution_time = 0.0
+
+        os.makedirs(scratch_dir, exist_ok=True)
+
+    def layer_path(self, depth: int) -> str:
+        """Path of the sorted file holding BFS layer `depth`."""
+        return os.path.join(self.scratch_dir, f"layer_{depth:03d}.bin")
+
+    def _run_path(self, depth: int, index: int) -> str:
+        return os.path.join(self.scratch_dir, f"run_{depth:03d}_{index:05d}.bin")
+
+    def read_layer(self, depth: int) -> Iterator[int]:
+        """
+        Stream the packed states of a layer in sorted order.
+
+        Args:
+            depth: BFS depth
+
+        Yields:
+            Packed state keys
+        """
+        return self._read_sorted(self.layer_path(depth))
+
+    def _read_sorted(self, path: str) -> Iterator[int]:
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            while True:
+                block = array("Q")
+                try:
+                    block.fromfile(f, self.block_size)
+                except EOFError:
+                    pass  # short final block; fromfile keeps what it read
+                if not block:
+                    return
+                self.bytes_read += len(block) * block.itemsize
+                if sys.byteorder == "big":
+                    block.byteswap()
+                yield from block
+
+    def _write_block(self, f, block: array):
+        if sys.byteorder == "big":
+            block.byteswap()
+        block.tofile(f)
+        self.bytes_written += len(block) * block.itemsize
+
+    def _write_run(self, path: str, keys: List[int]):
+        """Sort and deduplicate keys in memory and write them as one run."""
+        keys.sort()
+        block = array("Q")
+        last = -1
+        with open(path, "wb") as f:
+            for key in keys:
+                if key != last:
+                    block.append(key)
+                    last = key
+                    if len(block) >= self.block_size:
+                        self._write_block(f, block)
+                        block = array("Q")
+            if block:
+                self._write_block(f, block)
+
+    def _expand(self, depth: int) -> List[str]:
+        """
+        Generate the successors of layer `depth` into sorted run files.
+
+        Returns:
+            Paths of the run files written
+        """
+        runs = []
+        buffer: List[int] = []
+        for key in self.read_layer(depth):
+            for neighbor in PuzzleState.unpack(key).get_neighbors():
+                buffer.append(neighbor.pack())
+            if len(buffer) >= self.chunk_size:
+                runs.append(self._run_path(depth + 1, len(runs)))
+                self._write_run(runs[-1], buffer)
+                buffer = []
+        if buffer:
+            runs.append(self._run_path(depth + 1, len(runs)))
+            self._write_run(runs[-1], buffer)
+        return runs
+
+    def _merge(self, depth: int, runs: List[str]) -> int:
+        """
+        Merge successor runs into layer `depth`, removing duplicates and
+        every state already in layers depth-1 and depth-2.
+
+        Returns:
+            Number of states in the new layer
+        """
+        previous = [self.read_layer(d) for d in (depth - 1, depth - 2) if d >= 0]
+        previous_keys = [next(it, None) for it in previous]
+
+        count = 0
+        last = -1
+        block = array("Q")
+        with open(self.layer_path(depth), "wb") as out:
+            for key in heapq.merge(*(self._read_sorted(run) for run in runs)):
+                if key == last:
+                    continue
+                last = key
+
+                # Advance the older layers up to key (all streams are sorted)
+                seen = False
+                for i, it in enumerate(previous):
+                    while previous_keys[i] is not None and previous_keys[i] < key:
+                        previous_keys[i] = next(it, None)
+                    if previous_keys[i] == key:
+                        seen = True
+                if seen:
+                    continue
+
+                block.append(key)
+                count += 1
+                if len(block) >= self.block_size:
+                    self._write_block(out, block)
+                    block = array("Q")
+            if block:
+                self._write_block(out, block)
+
+        for run in runs:
+            os.remove(run)
+        return count
+
+    def run(self, start: Optional[PuzzleState] = None, max_depth: Optional[int] = None) -> List[int]:
+        """
+        Enumerate all states reachable from `start`, layer by layer.
+
+        Args:
+            start: Root state (default: the goal)
+            max_depth: Stop after this many layers (default: until exhausted)
+
+        Returns:
+            Number of states at each depth
+        """
+        start_time = time.time()
+        start = start if start is not None else PuzzleState()
+
+        with open(self.layer_path(0), "wb") as f:
+            self._write_block(f, array("Q", [start.pack()]))
+        self.layer_sizes = [1]
+
+        depth = 0
+        while max_depth is None or depth < max_depth:
+            runs = self._expand(depth)
+            size = self._merge(depth + 1, runs)
+            if not self.keep_layers and depth >= 1:
+                os.remove(self.layer_path(depth - 1))
+            if size == 0:
+                os.remove(self.layer_path(depth + 1))
+                break
+            self.layer_sizes.append(size)
+            depth += 1
+
+        self.execution_time = time.time() - start_time
+        return self.layer_sizes
+
+
+def main():
+    """Enumerate the 8-puzzle state space on disk."""
+    scratch_dir = sys.argv[1] if len(sys.argv) > 1 else "bfs_scratch"
+
+    print("External-Memory BFS")
+    print("=" * 80)
+    print(f"Scratch directory: {scratch_dir}\n")
+
+    bfs = ExternalBFS(scratch_dir, keep_layers=True)
+    sizes = bfs.run()
+
+    for depth, size in enumerate(sizes):
+        print(f"  Depth {depth:>3}: {size:>10} states")
+    print(f"\nTotal states: {sum(sizes)}")
+    print(f"Time: {bfs.execution_time:.2f}s, read {bfs.bytes_read / 1e6:.1f} MB, "
+          f"written {bfs.bytes_written / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
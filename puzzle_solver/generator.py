@@ -11,32 +11,38 @@ class PuzzleGenerator:
     """Generate random solvable 8-puzzle instances."""
     
     @staticmethod
-    def generate_single() -> PuzzleState:
+    def generate_single(rng: random.Random = None) -> PuzzleState:
         """
         Generate a single random solvable puzzle by applying random moves from goal state.
         This guarantees the puzzle is solvable.
         
+        Args:
+            rng: Random number generator (default: the global random module)
+        
         Returns:
             Random solvable PuzzleState
         """
+        rng = rng or random
         state = PuzzleState(PuzzleState.GOAL_STATE)
         
         # Apply random moves to guarantee solvability
-        num_moves = random.randint(50, 100)
+        num_moves = rng.randint(50, 100)
         
         for _ in range(num_moves):
             neighbors = state.get_neighbors()
-            state = random.choice(neighbors)
+            state = rng.choice(neighbors)
         
         return state
     
     @staticmethod
-    def generate_batch(count: int) -> List[PuzzleState]:
+    def generate_batch(count: int, rng: random.Random = None) -> List[PuzzleState]:
         """
         Generate multiple random solvable puzzles.
         
         Args:
             count: Number of puzzles to generate
+            rng: Random number generator; pass random.Random(seed) for a
+                 reproducible batch (default: the global random module)
         
         Returns:
             List of random solvable PuzzleState objects
@@ -45,7 +51,7 @@ class PuzzleGenerator:
         seen = set()
         
         while len(puzzles) < count:
-            puzzle = PuzzleGenerator.generate_single()
+            puzzle = PuzzleGenerator.generate_single(rng)
             # Avoid duplicates
             if puzzle not in seen:
                 puzzles.append(puzzle)
@@ -54,7 +60,8 @@ class PuzzleGenerator:
         return puzzles
     
     @staticmethod
-    def generate_with_inversion_check(count: int, max_attempts: int = 10000) -> List[PuzzleState]:
+    def generate_with_inversion_check(count: int, max_attempts: int = 10000,
+                                      rng: random.Random = None) -> List[PuzzleState]:
         """
         Generate solvable puzzles by random shuffling and inversion count check.
         (Alternative method to random moves)
@@ -62,10 +69,12 @@ class PuzzleGenerator:
         Args:
             count: Number of puzzles to generate
             max_attempts: Maximum attempts to find solvable puzzles
+            rng: Random number generator (default: the global random module)
         
         Returns:
             List of random solvable PuzzleState objects
         """
+        rng = rng or random
         puzzles = []
         seen = set()
         attempts = 0
@@ -73,7 +82,7 @@ class PuzzleGenerator:
         while len(puzzles) < count and attempts < max_attempts:
             # Create random permutation
             tiles = list(range(9))
-            random.shuffle(tiles)
+            rng.shuffle(tiles)
             state = PuzzleState(tuple(tiles))
             
             # Check if solvable
@@ -0,0 +1,164 @@
+"""
+Solving towards arbitrary goal boards.
+
+Moves only depend on where the blank is, so renaming the tiles does not
+change any distance: a search towards goal G is the same as a search
+towards another goal C after every tile is renamed to the tile C holds in
+its position in G. The eight symmetries of the board (rotations and
+reflections) preserve moves too, so G is first turned to bring its blank
+to position 0 (a corner), 1 (an edge) or 4 (the centre), and then
+relabeled to the canonical goal with that blank position: tiles 1-8 in
+reading order around the blank.
+
+The corner canonical goal is the standard goal, so the four corner-blank
+goals reuse every heuristic and precomputed table unchanged. Edge and
+centre goals need heuristics that support them through
+Heuristic.for_goal(); only three goal-specific heuristics (and their
+tables) are ever needed, however many goals are solved.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .puzzle_state import PuzzleState
+from .heuristics import Heuristic
+from .branch_and_bound import BranchAndBoundSolver, SearchStatistics
+
+
+class EdgeGoalState(PuzzleState):
+    """PuzzleState searching towards the canonical goal with the blank on an edge."""
+    __slots__ = ()
+    GOAL_STATE = (1, 0, 2, 3, 4, 5, 6, 7, 8)
+
+
+class CentreGoalState(PuzzleState):
+    """PuzzleState searching towards the canonical goal with the blank in the centre."""
+    __slots__ = ()
+    GOAL_STATE = (1, 2, 3, 4, 0, 5, 6, 7, 8)
+
+
+# State class of each canonical goal, by the goal's blank position
+GOAL_STATE_CLASSES = {0: PuzzleState, 1: EdgeGoalState, 4: CentreGoalState}
+
+CANONICAL_GOALS = {blank: cls.GOAL_STATE for blank, cls in GOAL_STATE_CLASSES.items()}
+
+
+def _symmetries() -> List[Tuple[int, ...]]:
+    """The 8 symmetries of the board, each mapping a position to its image."""
+    rotate = tuple((pos % 3) * 3 + 2 - pos // 3 for pos in range(9))
+    reflect = tuple((pos // 3) * 3 + 2 - pos % 3 for pos in range(9))
+    symmetries = []
+    current = tuple(range(9))
+    for _ in range(4):
+        symmetries.append(current)
+        symmetries.append(tuple(reflect[p] for p in current))
+        current = tuple(rotate[p] for p in current)
+    return symmetries
+
+
+SYMMETRIES = _symmetries()
+
+
+class GoalFrame:
+    """Mapping between boards measured against one goal and its canonical goal."""
+
+    def __init__(self, goal: Tuple[int, ...]):
+        """
+        Initialize the mapping.
+
+        Args:
+            goal: Goal board in row-major order, 0 for the blank
+
+        Raises:
+            ValueError: If goal is not a permutation of 0-8
+        """
+        goal = tuple(goal)
+        if sorted(goal) != list(range(9)):
+            raise ValueError(f"Goal must be a permutation of 0-8: {goal}")
+        self.goal = goal
+
+        blank = goal.index(0)
+        self.symmetry = next(sym for sym in SYMMETRIES if sym[blank] in CANONICAL_GOALS)
+        self.state_class = GOAL_STATE_CLASSES[self.symmetry[blank]]
+        self.canonical_goal = self.state_class.GOAL_STATE
+
+        # relabel[tile of goal] = tile of the canonical goal in the same (turned) position
+        self.relabel = [0] * 9
+        for pos, tile in enumerate(goal):
+            self.relabel[tile] = self.canonical_goal[self.symmetry[pos]]
+        self._unlabel = [0] * 9
+        for tile, label in enumerate(self.relabel):
+            self._unlabel[label] = tile
+
+    def to_canonical(self, state: PuzzleState) -> PuzzleState:
+        """
+        Turn and relabel a board.
+
+        Returns:
+            Board as seen from the canonical goal (of its goal state class)
+        """
+        tiles = [0] * 9
+        for pos, tile in enumerate(state.state):
+            tiles[self.symmetry[pos]] = self.relabel[tile]
+        return self.state_class(tuple(tiles))
+
+    def from_canonical(self, state: PuzzleState) -> PuzzleState:
+        """
+        Undo to_canonical().
+
+        Returns:
+            Board as seen from this frame's goal
+        """
+        return PuzzleState(tuple(self._unlabel[state.state[self.symmetry[pos]]] for pos in range(9)))
+
+    def solve(self, solver, start: PuzzleState) -> Tuple[Optional[List[PuzzleState]], SearchStatistics]:
+        """
+        Solve from `start` to this frame's goal.
+
+        Args:
+            solver: Solver built with a heuristic for canonical_goal
+                    (see heuristic.for_goal())
+            start: Starting board
+
+        Returns:
+            Tuple of (solution_path, statistics), with the path made of
+            boards as seen from this frame's goal
+        """
+        path, stats = solver.solve(self.to_canonical(start))
+        if path is not None:
+            path = [self.from_canonical(state) for state in path]
+        return path, stats
+
+
+def solve_pairs(pairs: Iterable[Tuple[PuzzleState, PuzzleState]], heuristic: Heuristic,
+                engine: Callable[[Heuristic], object] = BranchAndBoundSolver
+                ) -> List[Tuple[Optional[List[PuzzleState]], SearchStatistics]]:
+    """
+    Solve many (start, goal) pairs.
+
+    One solver (and one goal-specific heuristic, with its tables) is built
+    per canonical goal and reused for every pair that maps to it.
+
+    Args:
+        pairs: (start, goal) boards
+        heuristic: Heuristic for the standard goal; converted with for_goal()
+        engine: Callable taking a heuristic and returning an object with
+                solve(initial_state) -> (path, SearchStatistics)
+
+    Returns:
+        List of (solution_path, statistics) tuples, in the order of pairs
+
+    Raises:
+        ValueError: If the heuristic does not support a needed canonical goal
+    """
+    frames: Dict[Tuple[int, ...], GoalFrame] = {}
+    solvers: Dict[Tuple[int, ...], object] = {}
+    results = []
+    for start, goal in pairs:
+        frame = frames.get(goal.state)
+        if frame is None:
+            frame = frames[goal.state] = GoalFrame(goal.state)
+        solver = solvers.get(frame.canonical_goal)
+        if solver is None:
+            solver = solvers[frame.canonical_goal] = engine(heuristic.for_goal(frame.canonical_goal))
+        results.append(frame.solve(solver, start))
+    return results
@@ -0,0 +1,292 @@
+"""
+Hash-distributed A* (HDA*) for the 8-puzzle.
+
+Each worker process owns the states whose packed key hashes to it and
+keeps the open list, best g-values and parent links for those states
+only. A worker expanding a node computes h for every child, keeps the
+children it owns and sends the others to their owners in one batch per
+destination (packed keys in array columns over multiprocessing queues).
+
+Workers run in synchronous rounds driven by a coordinator: in each round
+a worker first receives exactly the batches sent to it in the previous
+round, then expands up to `expansions_per_round` nodes with f below the
+incumbent, then reports its lowest open f, goal cost and batch counts.
+Because every batch is received in the round after it is sent, nothing
+is in flight at a round boundary, and the search stops once every
+worker's lowest open f is at least the incumbent goal cost. With an
+admissible heuristic no cheaper path can remain, so the result is optimal.
+"""
+
+import time
+import heapq
+import multiprocessing
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .puzzle_state import PuzzleState
+from .heuristics import Heuristic
+from .branch_and_bound import SearchStatistics
+
+
+_NO_PARENT = (1 << 64) - 1
+
+
+def owner_of(key: int, workers: int) -> int:
+    """
+    Worker that owns a packed state.
+
+    Packed keys are highly structured, so they are mixed with a
+    multiplicative (Fibonacci) hash before taking the remainder.
+
+    Args:
+        key: Packed state key (PuzzleState.pack())
+        workers: Number of workers
+
+    Returns:
+        Owning worker index
+    """
+    return (((key * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 32) % workers
+
+
+@dataclass
+class DistributedSearchStatistics(SearchStatistics):
+    """Merged statistics of a distributed search."""
+    nodes_per_worker: List[int] = field(default_factory=list)
+    rounds: int = 0
+    batches_sent: int = 0
+    nodes_sent: int = 0
+    bytes_sent: int = 0
+
+
+def _worker(index: int, workers: int, heuristic: Heuristic, expansions_per_round: int,
+            state_class, control, inboxes):
+    """
+    Worker process: owns one hash slice of the state space. The goal is
+    state_class.GOAL_STATE (PuzzleState or a goals.py goal state class).
+
+    Commands on the control pipe:
+        ("start", key, h)          -- seed the search with the initial state
+        ("round", incumbent, n)    -- receive n batches, then expand
+        ("parent", key)            -- look up the parent of an owned state
+        ("stop",)                  -- exit
+    """
+    open_list: List[Tuple[int, int, int]] = []
+    g_values: Dict[int, int] = {}
+    parents: Dict[int, int] = {}
+    best_goal = float('inf')
+    goal_key = state_class().pack()
+    inbox = inboxes[index]
+
+    def insert(key: int, g: int, h: int, parent: int):
+        nonlocal best_goal
+        if g >= g_values.get(key, float('inf')):
+            return
+        # New state, or a cheaper path to a known one (reopened)
+        g_values[key] = g
+        parents[key] = parent
+        if key == goal_key:
+            best_goal = min(best_goal, g)
+        else:
+            heapq.heappush(open_list, (g + h, g, key))
+
+    while True:
+        command = control.recv()
+
+        if command[0] == "round":
+            _, incumbent, expected = command
+            for _ in range(expected):
+                keys, parent_keys, gs, hs = inbox.get()
+                for key, parent, g, h in zip(array('Q', keys), array('Q', parent_keys),
+                                             array('H', gs), array('H', hs)):
+                    insert(key, g, h, parent)
+
+            incumbent = min(incumbent, best_goal)
+            outgoing = [(array('Q'), array('Q'), array('H'), array('H')) for _ in range(workers)]
+            expanded = 0
+            lower_bound_sum = 0
+            while open_list and expanded < expansions_per_round:
+                f, g, key = open_list[0]
+                if f >= incumbent:
+                    break
+                heapq.heappop(open_list)
+                if g != g_values[key]:
+                    continue  # stale entry superseded by a cheaper path
+                expanded += 1
+                lower_bound_sum += f - g
+
+                for neighbor in PuzzleState.unpack(key).get_neighbors():
+                    child = neighbor.pack()
+                    if child == parents[key]:
+                        continue
+                    h = heuristic.compute(neighbor)
+                    if g + 1 + h >= incumbent:
+                        continue
+                    owner = owner_of(child, workers)
+                    if owner == index:
+                        insert(child, g + 1, h, key)
+                        incumbent = min(incumbent, best_goal)
+                    else:
+                        batch = outgoing[owner]
+                        batch[0].append(child)
+                        batch[1].append(key)
+                        batch[2].append(g + 1)
+                        batch[3].append(h)
+
+            sent = [0] * workers
+            nodes_sent = 0
+            bytes_sent = 0
+            for owner, batch in enumerate(outgoing):
+                if batch[0]:
+                    payload = tuple(column.tobytes() for column in batch)
+                    inboxes[owner].put(payload)
+                    sent[owner] = 1
+                    nodes_sent += len(batch[0])
+                    bytes_sent += sum(len(column) for column in payload)
+
+            min_f = open_list[0][0] if open_list else float('inf')
+            control.send((min_f, best_goal, sent, expanded, lower_bound_sum, nodes_sent, bytes_sent))
+
+        elif command[0] == "start":
+            _, key, h = command
+            insert(key, 0, h, _NO_PARENT)
+
+        elif command[0] == "parent":
+            control.send(parents.get(command[1], _NO_PARENT))
+
+        else:
+            break
+
+
+class HDAStarSolver:
+    """A* distributed over worker processes by hashing states to owners."""
+
+    def __init__(self, heuristic: Heuristic, workers: int = 2, expansions_per_round: int = 256):
+        """
+        Initialize solver.
+
+        Args:
+            heuristic: Heuristic function to use for search
+            workers: Number of worker processes
+            expansions_per_round: Maximum expansions per worker between
+                                  synchronization rounds
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.heuristic = heuristic
+        self.workers = workers
+        self.expansions_per_round = expansions_per_round
+        self.statistics = None
+
+    def solve(self, initial_state: PuzzleState) -> Tuple[Optional[List[PuzzleState]], DistributedSearchStatistics]:
+        """
+        Solve the puzzle with hash-distributed A*.
+
+        Args:
+            initial_state: Starting puzzle state
+
+        Returns:
+            Tuple of (solution_path, statistics); the statistics add
+            per-worker expansion counts and communication volume
+        """
+        start_time = time.time()
+
+        stats = DistributedSearchStatistics(
+            heuristic_name=self.heuristic.get_name(),
+            solution_found=False,
+            solution_length=0,
+            nodes_expanded=0,
+            optimal_cost=0,
+            execution_time=0,
+            lower_bound_sum=0,
+            lower_bound_count=0,
+            nodes_per_worker=[0] * self.workers
+        )
+
+        if not initial_state.is_solvable():
+            stats.execution_time = time.time() - start_time
+            return None, stats
+
+        inboxes = [multiprocessing.Queue() for _ in range(self.workers)]
+        pipes = [multiprocessing.Pipe() for _ in range(self.workers)]
+        processes = [
+            multiprocessing.Process(
+                target=_worker,
+                args=(i, self.workers, self.heuristic, self.expansions_per_round, type(initial_state),
+                      pipes[i][1], inboxes),
+                daemon=True
+            )
+            for i in range(self.workers)
+        ]
+        controls = [parent_end for parent_end, _ in pipes]
+
+        path = None
+        try:
+            for process in processes:
+                process.start()
+
+            root = initial_state.pack()
+            controls[owner_of(root, self.workers)].send(
+                ("start", root, self.heuristic.compute(initial_state)))
+
+            incumbent = float('inf')
+            expected = [0] * self.workers
+            while True:
+                for i, control in enumerate(controls):
+                    control.send(("round", incumbent, expected[i]))
+                reports = [control.recv() for control in controls]
+                stats.rounds += 1
+
+                expected = [0] * self.workers
+                min_f = float('inf')
+                in_flight = 0
+                for i, (worker_min_f, best_goal, sent, expanded, lb_sum, nodes_sent, bytes_sent) in enumerate(reports):
+                    incumbent = min(incumbent, best_goal)
+                    min_f = min(min_f, worker_min_f)
+                    for owner, count in enumerate(sent):
+                        expected[owner] += count
+                        in_flight += count
+                    stats.nodes_per_worker[i] += expanded
+                    stats.nodes_expanded += expanded
+                    stats.lower_bound_sum += lb_sum
+                    stats.lower_bound_count += expanded
+                    stats.nodes_sent += nodes_sent
+                    stats.bytes_sent += bytes_sent
+
+                stats.batches_sent += in_flight
+                if in_flight == 0 and min_f >= incumbent:
+                    break
+
+            if incumbent != float('inf'):
+                path = self._trace_path(controls, root, type(initial_state))
+
+            for control in controls:
+                control.send(("stop",))
+            for process in processes:
+                process.join()
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+
+        if path is not None:
+            stats.solution_found = True
+            stats.solution_length = len(path) - 1
+            stats.optimal_cost = len(path) - 1
+
+        stats.execution_time = time.time() - start_time
+        self.statistics = stats
+
+        return path, stats
+
+    def _trace_path(self, controls, root: int, state_class) -> List[PuzzleState]:
+        """Follow parent links from the goal back to the root, asking each state's owner."""
+        key = state_class().pack()
+        keys = [key]
+        while key != root:
+            control = controls[owner_of(key, self.workers)]
+            control.send(("parent", key))
+            key = control.recv()
+            keys.append(key)
+        keys.reverse()
+        return [state_class(PuzzleState.unpack(key).state) for key in keys]
@@ -0,0 +1,258 @@
+"""
+Full state-space sweep of the heuristics.
+
+Evaluates every heuristic on all 181,440 solvable states against the exact
+distances from state_space.py, instead of the 50-100 random samples used by
+run_experiment.py. Reports per-depth bound tightness, admissibility,
+dominance relations and measured per-call cost, and predicts nodes expanded
+per solution depth from those measurements.
+"""
+
+import sys
+import time
+import random
+from typing import Dict, List
+
+sys.path.insert(0, '/home/luffy/class/DAA CLA2')
+
+from puzzle_solver.puzzle_state import PuzzleState
+from puzzle_solver.heuristics import Heuristic, HEURISTICS
+from puzzle_solver.state_space import solvable_state_arrays, layer_sizes, BLANK_MOVES
+
+
+class HeuristicSweep:
+    """Evaluate heuristics exhaustively over the 8-puzzle state space."""
+
+    def __init__(self, heuristics: List[Heuristic] = None, cost_sample: int = 5000, seed: int = 0):
+        """
+        Initialize sweep.
+
+        Args:
+            heuristics: Heuristics to evaluate (default: HEURISTICS)
+            cost_sample: Number of states used to time scalar compute() calls
+            seed: Seed for choosing the timing sample
+        """
+        self.heuristics = heuristics if heuristics is not None else HEURISTICS
+        self.cost_sample = cost_sample
+        self.seed = seed
+        self.results = None
+
+    def run(self) -> Dict:
+        """
+        Run the sweep.
+
+        Returns:
+            Dictionary with per-heuristic measurements, dominance relations
+            and the state-space layer sizes
+        """
+        import numpy as np
+
+        states, depths = solvable_state_arrays()
+        depths = depths.astype(np.int64)
+        max_depth = int(depths.max())
+        layers = layer_sizes()
+        depth_counts = np.bincount(depths, minlength=max_depth + 1)
+
+        # Average branching factor (neighbors per expanded state)
+        blank_positions = np.argmax(states == 0, axis=1)
+        branch_counts = np.array([len(moves) for moves in BLANK_MOVES])
+        branching = float(branch_counts[blank_positions].mean())
+
+        sample_rows = random.Random(self.seed).sample(range(len(states)), min(self.cost_sample, len(states)))
+        sample = [PuzzleState(tuple(int(t) for t in states[i])) for i in sample_rows]
+        expansion_cost = self._time_per_call(lambda s: s.get_neighbors(), sample)
+
+        values = {}
+        heuristics = {}
+        for heuristic in self.heuristics:
+            name = heuristic.get_name()
+            start = time.perf_counter()
+            h = heuristic.compute_batch(states).astype(np.int64)
+            batch_time = time.perf_counter() - start
+            values[name] = h
+
+            # Mean h/h* per true depth (depth 0 is the goal, where the ratio is undefined)
+            nonzero = depths > 0
+            ratio_sums = np.bincount(depths[nonzero], weights=h[nonzero] / depths[nonzero],
+                                     minlength=max_depth + 1)
+            ratio_by_depth = {d: float(ratio_sums[d] / depth_counts[d]) for d in range(1, max_depth + 1)}
+
+            # P(h <= v) over the whole state space
+            h_cdf = np.cumsum(np.bincount(h, minlength=max_depth + 1)) / len(h)
+
+            per_call_cost = self._time_per_call(heuristic.compute, sample)
+            predicted_nodes = {
+                d: self._predict_nodes(d, layers, h_cdf) for d in range(max_depth + 1)
+            }
+            node_cost = expansion_cost + branching * per_call_cost
+
+            heuristics[name] = {
+                "ratio_by_depth": ratio_by_depth,
+                "mean_ratio": float(np.mean(h[nonzero] / depths[nonzero])),
+                "overestimates": int(np.count_nonzero(h > depths)),
+                "max_overestimate": int(max(0, (h - depths).max())),
+                "per_call_cost": per_call_cost,
+                "batch_time": batch_time,
+                "predicted_nodes": predicted_nodes,
+                "predicted_time": {d: n * node_cost for d, n in predicted_nodes.items()},
+            }
+
+        # a dominates b when h_a >= h_b on every state and is larger on some
+        dominance = []
+        names = list(values)
+        for a in names:
+            for b in names:
+                if a != b and (values[a] >= values[b]).all() and (values[a] > values[b]).any():
+                    dominance.append((a, b))
+
+        self.results = {
+            "num_states": len(states),
+            "layer_sizes": layers,
+            "branching": branching,
+            "expansion_cost": expansion_cost,
+            "heuristics": heuristics,
+            "dominance": dominance,
+        }
+        return self.results
+
+    @staticmethod
+    def _time_per_call(func, sample: List[PuzzleState]) -> float:
+        """Best-of-three average seconds per call of func over the sample."""
+        best = float('inf')
+        for _ in range(3):
+            start = time.perf_counter()
+            for state in sample:
+                func(state)
+            best = min(best, (time.perf_counter() - start) / len(sample))
+        return best
+
+    @staticmethod
+    def _predict_nodes(depth: int, layers: List[int], h_cdf) -> float:
+        """
+        Predict nodes expanded for an instance of the given solution depth.
+
+        Uses the Korf-Reid-Edelkamp estimate: a node i moves from the start
+        is expanded when i + h <= depth, so the expected count is the sum of
+        N_i * P(h <= depth - i), with N_i approximated by the number of
+        states i moves from the goal.
+        """
+        total = 0.0
+        for i in range(min(depth, len(layers) - 1) + 1):
+            total += layers[i] * float(h_cdf[min(depth - i, len(h_cdf) - 1)])
+        return total
+
+    def recommend(self) -> Dict[int, str]:
+        """
+        Pick the heuristic with the lowest predicted time for each depth.
+
+        Returns:
+            Dictionary mapping solution depth to heuristic name
+        """
+        if self.results is None:
+            self.run()
+
+        recommendation = {}
+        for depth in range(len(self.results["layer_sizes"])):
+            recommendation[depth] = min(
+                self.results["heuristics"],
+                key=lambda name: self.results["heuristics"][name]["predicted_time"][depth]
+            )
+        return recommendation
+
+    def format_report(self) -> str:
+        """
+        Format the sweep results as a text report.
+
+        Returns:
+            Report text
+        """
+        if self.results is None:
+            self.run()
+
+        results = self.results
+        names = list(results["heuristics"])
+        short = [name.split(":")[0] for name in names]
+        max_depth = len(results["layer_sizes"]) - 1
+
+        report = []
+        report.append("=" * 80)
+        report.append("HEURISTIC SWEEP OVER THE FULL 8-PUZZLE STATE SPACE")
+        report.append("=" * 80)
+        report.append(f"Solvable states: {results['num_states']}, maximum depth: {max_depth}")
+        report.append(f"Average branching factor: {results['branching']:.3f}, "
+                      f"expansion cost: {results['expansion_cost'] * 1e6:.2f} us")
+        report.append("")
+
+        report.append("COST AND ADMISSIBILITY")
+        report.append("-" * 80)
+        report.append(f"{'Heuristic':<25} {'Mean h/h*':<12} {'Call (us)':<12} "
+                      f"{'Batch (ms)':<12} {'Overestimates':<14}")
+        for name in names:
+            data = results["heuristics"][name]
+            over = str(data["overestimates"])
+            if data["overestimates"]:
+                over += f" (max +{data['max_overestimate']})"
+            report.append(f"{name:<25} {data['mean_ratio']:<12.4f} {data['per_call_cost'] * 1e6:<12.2f} "
+                          f"{data['batch_time'] * 1e3:<12.2f} {over:<14}")
+        report.append("")
+
+        report.append("DOMINANCE (A >= B on every state, > on some)")
+        report.append("-" * 80)
+        for a, b in results["dominance"]:
+            report.append(f"  {a}  dominates  {b}")
+        if not results["dominance"]:
+            report.append("  No dominance relations")
+        report.append("")
+
+        report.append("MEAN h/h* BY TRUE DEPTH")
+        report.append("-" * 80)
+        report.append(f"{'Depth':<7} {'States':<9} " + " ".join(f"{s:<9}" for s in short))
+        for d in range(1, max_depth + 1):
+            ratios = " ".join(f"{results['heuristics'][n]['ratio_by_depth'][d]:<9.3f}" for n in names)
+            report.append(f"{d:<7} {results['layer_sizes'][d]:<9} {ratios}")
+        report.append("")
+
+        recommendation = self.recommend()
+        report.append("PREDICTED NODES EXPANDED BY SOLUTION DEPTH")
+        report.append("-" * 80)
+        report.append(f"{'Depth':<7} " + " ".join(f"{s:<11}" for s in short) + " Fastest")
+        for d in range(max_depth + 1):
+            nodes = " ".join(f"{results['heuristics'][n]['predicted_nodes'][d]:<11.0f}" for n in names)
+            report.append(f"{d:<7} {nodes} {recommendation[d].split(':')[0]}")
+        report.append("")
+        report.append("=" * 80)
+
+        return "\n".join(report)
+
+    def save_report(self, output_file: str = "sweep_report.txt"):
+        """
+        Write the text report.
+
+        Args:
+            output_file: Output file name
+        """
+        report_text = self.format_report()
+
+        filepath = f'/home/luffy/class/DAA CLA2/{output_file}'
+        with open(filepath, 'w') as f:
+            f.write(report_text)
+
+        print(f"Sweep report saved to {filepath}")
+        return report_text
+
+
+def main():
+    """Run the full state-space sweep and print the report."""
+    print("Heuristic Sweep - Full State Space")
+    print("=" * 80)
+    print()
+
+    start = time.perf_counter()
+    sweep = HeuristicSweep()
+    sweep.run()
+    print(sweep.format_report())
+    print(f"\nSweep completed in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
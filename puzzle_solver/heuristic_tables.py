@@ -0,0 +1,153 @@
+"""
+Precomputed tables for the walking-distance and linear-conflict heuristics.
+
+The builders here are registered in table_registry.TABLES, so each table
+is generated once, stored as a file and memory-mapped by every process.
+
+Walking distance (Takahashi): ignoring columns, a board is summarized by a
+3x3 matrix counting the tiles in each row by their goal row, plus the
+blank's row. A vertical move swaps the blank with any tile of an adjacent
+row. The number of such moves needed to reach the goal matrix is a lower
+bound on the vertical moves of any solution; the same table, applied to
+columns, bounds the horizontal moves. The table only depends on the goal
+through the line of the goal blank: the standard goal's blank is on the
+first line, and a separate table covers goals with it on the middle line.
+
+Linear conflict lines: for each row and column and each of the 9^3
+possible tile triples in it, the tiles that belong to that line must leave
+it, except for a longest subsequence already in goal order; each one that
+leaves costs two moves beyond its Manhattan distance. The table depends on
+the goal through every tile's goal position, so there is one per canonical
+goal of goals.py (LC_GOALS).
+"""
+
+from array import array
+from collections import deque
+from typing import Dict, List, Tuple
+
+
+# Walking distance codes: 2 bits per (row, goal row) count, blank row above
+WD_BLANK_SHIFT = 18
+WD_TABLE_SIZE = 1 << 20
+WD_UNREACHABLE = 255
+
+
+# Linear conflict lines: rows 0-2 then columns 0-2, as board positions in order
+LC_LINES: Tuple[Tuple[int, int, int], ...] = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+)
+
+# Goal of the linear conflict table for each goal blank position: the
+# canonical goals of goals.py, tiles 1-8 in reading order around the blank
+LC_GOALS: Dict[int, Tuple[int, ...]] = {
+    0: (0, 1, 2, 3, 4, 5, 6, 7, 8),
+    1: (1, 0, 2, 3, 4, 5, 6, 7, 8),
+    4: (1, 2, 3, 4, 0, 5, 6, 7, 8),
+}
+
+
+def wd_shift(line: int, goal_line: int) -> int:
+    """Bit offset of the count of tiles in `line` whose goal is `goal_line`."""
+    return 2 * (3 * line + goal_line)
+
+
+def wd_goal(blank_line: int) -> int:
+    """Code of the goal: 3 tiles of each line at home, 2 plus the blank in `blank_line`."""
+    code = blank_line << WD_BLANK_SHIFT
+    for line in range(3):
+        code |= (2 if line == blank_line else 3) << wd_shift(line, line)
+    return code
+
+
+# Goal: 2 tiles of row 0 in row 0 (the blank is the third), 3 each in rows 1 and 2
+WD_GOAL = wd_goal(0)
+
+
+def build_walking_distance_table(blank_line: int = 0) -> array:
+    """
+    Breadth-first search over walking-distance codes from the goal.
+
+    Args:
+        blank_line: Line (row or column index) of the blank in the goal
+
+    Returns:
+        array('B') of 2^20 distances indexed by code, WD_UNREACHABLE for
+        codes that are not reachable
+    """
+    goal = wd_goal(blank_line)
+    table = array('B', [WD_UNREACHABLE]) * WD_TABLE_SIZE
+    table[goal] = 0
+    queue = deque([goal])
+    counts_mask = (1 << WD_BLANK_SHIFT) - 1
+
+    while queue:
+        code = queue.popleft()
+        blank = code >> WD_BLANK_SHIFT
+        counts = code & counts_mask
+        next_distance = table[code] + 1
+        for other in (blank - 1, blank + 1):
+            if not 0 <= other < 3:
+                continue
+            # Move one tile of each goal row from the adjacent row into the blank's row
+            for goal_line in range(3):
+                if (counts >> wd_shift(other, goal_line)) & 3:
+                    moved = counts - (1 << wd_shift(other, goal_line)) + (1 << wd_shift(blank, goal_line))
+                    neighbor = moved | (other << WD_BLANK_SHIFT)
+                    if table[neighbor] == WD_UNREACHABLE:
+                        table[neighbor] = next_distance
+                        queue.append(neighbor)
+
+    return table
+
+
+def build_walking_distance_table_middle() -> array:
+    """Walking distance table for goals with the blank on the middle line."""
+    return build_walking_distance_table(1)
+
+
+def _longest_increasing(values: List[int]) -> int:
+    best = [1] * len(values)
+    for i in range(len(values)):
+        for j in range(i):
+            if values[j] < values[i]:
+                best[i] = max(best[i], best[j] + 1)
+    return max(best, default=0)
+
+
+def build_linear_conflict_table(goal: Tuple[int, ...] = LC_GOALS[0]) -> array:
+    """
+    Extra moves forced by linear conflicts, per line and tile triple.
+
+    Args:
+        goal: Goal board (default: the standard goal)
+
+    Returns:
+        array('B') indexed by line * 729 + a * 81 + b * 9 + c, where a, b, c
+        are the tiles at the line's positions in LC_LINES order
+    """
+    goal_pos = [goal.index(tile) for tile in range(9)]
+    table = array('B', [0]) * (len(LC_LINES) * 729)
+    for line, positions in enumerate(LC_LINES):
+        is_row = line < 3
+        for a in range(9):
+            for b in range(9):
+                for c in range(9):
+                    # Goal index within the line of each tile that belongs to it
+                    goals = [
+                        (goal_pos[tile] % 3 if is_row else goal_pos[tile] // 3)
+                        for tile in (a, b, c)
+                        if tile != 0 and (goal_pos[tile] // 3 if is_row else goal_pos[tile] % 3) == line % 3
+                    ]
+                    table[line * 729 + a * 81 + b * 9 + c] = 2 * (len(goals) - _longest_increasing(goals))
+    return table
+
+
+def build_linear_conflict_table_edge() -> array:
+    """Linear conflict table for the canonical goal with the blank on an edge."""
+    return build_linear_conflict_table(LC_GOALS[1])
+
+
+def build_linear_conflict_table_centre() -> array:
+    """Linear conflict table for the canonical goal with the blank in the centre."""
+    return build_linear_conflict_table(LC_GOALS[4])
@@ -2,17 +2,73 @@
 Heuristic functions for the 8-puzzle problem.
 """
 
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 from .puzzle_state import PuzzleState
+from .ranking import rank_solvable_checked
+from .heuristic_tables import WD_BLANK_SHIFT, LC_LINES, LC_GOALS, wd_shift
 
 
 class Heuristic:
     """Base class for heuristics."""
     
+    # Relative per-call cost, used to order evaluation in MaxHeuristic
+    # (roughly microseconds per call, as measured by heuristic_sweep.py)
+    cost = 1.0
+    
     def compute(self, state: PuzzleState) -> int:
         """Compute heuristic value for a given state."""
         raise NotImplementedError
     
+    def compute_bounded(self, state: PuzzleState, bound: float) -> int:
+        """
+        Compute a heuristic value, allowed to stop early at a threshold.
+        
+        Returns the exact value whenever it is below `bound`; once the value
+        is known to be >= bound (the node will be pruned), any admissible
+        value >= bound may be returned instead.
+        
+        Args:
+            state: PuzzleState to evaluate
+            bound: Pruning threshold for h (e.g. best cost - g)
+        
+        Returns:
+            Heuristic value
+        """
+        return self.compute(state)
+    
+    def compute_batch(self, states):
+        """
+        Compute heuristic values for many states at once.
+        Subclasses override this with vectorized NumPy versions; the
+        default falls back to calling compute() per state.
+        
+        Args:
+            states: (N, 9) integer NumPy array, one board per row
+        
+        Returns:
+            NumPy integer array of N heuristic values
+        """
+        import numpy as np
+        values = (self.compute(PuzzleState(tuple(int(t) for t in row))) for row in states)
+        return np.fromiter(values, dtype=np.int32, count=len(states))
+    
+    def for_goal(self, goal: Tuple[int, ...]) -> 'Heuristic':
+        """
+        The same heuristic measured towards another goal board.
+        
+        Args:
+            goal: Goal board in row-major order, 0 for the blank
+        
+        Returns:
+            Heuristic for `goal` (self if it already measures towards it)
+        
+        Raises:
+            ValueError: If the heuristic only supports the standard goal
+        """
+        if tuple(goal) == PuzzleState.GOAL_STATE:
+            return self
+        raise ValueError(f"{self.get_name()} only supports the standard goal")
+    
     def get_name(self) -> str:
         """Get heuristic name."""
         raise NotImplementedError
@@ -21,10 +77,19 @@ class Heuristic:
 class H1_Trivial(Heuristic):
     """H1: Trivial heuristic (h = 0). Baseline uninformed search."""
     
+    cost = 0.0
+    
     def compute(self, state: PuzzleState) -> int:
         """Always returns 0."""
         return 0
     
+    def compute_batch(self, states):
+        import numpy as np
+        return np.zeros(len(states), dtype=np.int32)
+    
+    def for_goal(self, goal: Tuple[int, ...]) -> 'Heuristic':
+        return self
+    
     def get_name(self) -> str:
         return "H1: Trivial (h=0)"
 
@@ -32,6 +97,19 @@ class H1_Trivial(Heuristic):
 class H2_MisplacedTiles(Heuristic):
     """H2: Misplaced Tiles heuristic. Counts tiles not in correct position."""
     
+    cost = 0.8
+    goal = PuzzleState.GOAL_STATE
+    
+    def __init__(self, goal: Tuple[int, ...] = None):
+        """
+        Initialize heuristic.
+        
+        Args:
+            goal: Goal board (default: the standard goal)
+        """
+        if goal is not None:
+            self.goal = tuple(goal)
+    
     def compute(self, state: PuzzleState) -> int:
         """
         Count the number of misplaced tiles (not in goal position).
@@ -42,10 +120,19 @@ class H2_MisplacedTiles(Heuristic):
         """
         misplaced = 0
         for i in range(9):
-            if state.state[i] != PuzzleState.GOAL_STATE[i] and state.state[i] != 0:
+            if state.state[i] != self.goal[i] and state.state[i] != 0:
                 misplaced += 1
         return misplaced
     
+    def compute_batch(self, states):
+        import numpy as np
+        goal = np.array(self.goal)
+        return ((states != goal) & (states != 0)).sum(axis=1, dtype=np.int32)
+    
+    def for_goal(self, goal: Tuple[int, ...]) -> 'Heuristic':
+        goal = tuple(goal)
+        return self if goal == self.goal else H2_MisplacedTiles(goal)
+    
     def get_name(self) -> str:
         return "H2: Misplaced Tiles"
 
@@ -53,6 +140,22 @@ class H2_MisplacedTiles(Heuristic):
 class H3_Manhattan(Heuristic):
     """H3: Manhattan Distance heuristic. Sum of distances of each tile to goal position."""
     
+    cost = 1.3
+    goal = PuzzleState.GOAL_STATE
+    # Goal position of each tile
+    _goal_pos = tuple(range(9))
+    
+    def __init__(self, goal: Tuple[int, ...] = None):
+        """
+        Initialize heuristic.
+        
+        Args:
+            goal: Goal board (default: the standard goal)
+        """
+        if goal is not None:
+            self.goal = tuple(goal)
+            self._goal_pos = tuple(self.goal.index(tile) for tile in range(9))
+    
     def compute(self, state: PuzzleState) -> int:
         """
         Calculate sum of Manhattan distances.
@@ -61,6 +164,7 @@ class H3_Manhattan(Heuristic):
         Returns:
             Sum of Manhattan distances for all tiles
         """
+        goal_positions = self._goal_pos
         distance = 0
         for i in range(9):
             tile = state.state[i]
@@ -72,7 +176,7 @@ class H3_Manhattan(Heuristic):
             current_col = i % 3
             
             # Goal position of tile
-            goal_pos = tile
+            goal_pos = goal_positions[tile]
             goal_row = goal_pos // 3
             goal_col = goal_pos % 3
             
@@ -81,6 +185,19 @@ class H3_Manhattan(Heuristic):
         
         return distance
     
+    def compute_batch(self, states):
+        import numpy as np
+        # distances[pos, tile]: moves from pos to tile's goal position (0 for the blank)
+        pos = np.arange(9)
+        goal_pos = np.array(self._goal_pos)
+        distances = abs(pos[:, None] // 3 - goal_pos[None, :] // 3) + abs(pos[:, None] % 3 - goal_pos[None, :] % 3)
+        distances[:, 0] = 0
+        return distances[pos, states].sum(axis=1, dtype=np.int32)
+    
+    def for_goal(self, goal: Tuple[int, ...]) -> 'Heuristic':
+        goal = tuple(goal)
+        return self if goal == self.goal else H3_Manhattan(goal)
+    
     def get_name(self) -> str:
         return "H3: Manhattan Distance"
 
@@ -93,6 +210,24 @@ class H4_LinearConflict(Heuristic):
     as their goal position, but are in reverse order.
     """
     
+    cost = 7.3
+    goal = PuzzleState.GOAL_STATE
+    # Goal position of each tile, and the Manhattan distance to the goal
+    _goal_pos = tuple(range(9))
+    _manhattan = H3_Manhattan()
+    
+    def __init__(self, goal: Tuple[int, ...] = None):
+        """
+        Initialize heuristic.
+        
+        Args:
+            goal: Goal board (default: the standard goal)
+        """
+        if goal is not None:
+            self.goal = tuple(goal)
+            self._goal_pos = tuple(self.goal.index(tile) for tile in range(9))
+            self._manhattan = H3_Manhattan(self.goal)
+    
     def compute(self, state: PuzzleState) -> int:
         """
         Calculate Manhattan distance + 2 × linear conflicts.
@@ -101,13 +236,32 @@ class H4_LinearConflict(Heuristic):
             Heuristic value combining Manhattan distance and linear conflicts
         """
         # First, get Manhattan distance
-        manhattan = H3_Manhattan().compute(state)
+        manhattan = self._manhattan.compute(state)
         
         # Count linear conflicts
         conflicts = self._count_linear_conflicts(state)
         
         return manhattan + 2 * conflicts
     
+    def compute_batch(self, states):
+        import numpy as np
+        # Goal row and column of each tile
+        goal_pos = np.array(self._goal_pos)
+        rows, cols = goal_pos // 3, goal_pos % 3
+        conflicts = np.zeros(len(states), dtype=np.int32)
+        for line in range(3):
+            for i in range(3):
+                for j in range(i + 1, 3):
+                    # Row `line`, columns i < j
+                    a, b = states[:, line * 3 + i], states[:, line * 3 + j]
+                    conflicts += ((a != 0) & (b != 0) & (rows[a] == line) & (rows[b] == line)
+                                  & (cols[a] > cols[b]))
+                    # Column `line`, rows i < j
+                    a, b = states[:, i * 3 + line], states[:, j * 3 + line]
+                    conflicts += ((a != 0) & (b != 0) & (cols[a] == line) & (cols[b] == line)
+                                  & (rows[a] > rows[b]))
+        return self._manhattan.compute_batch(states) + 2 * conflicts
+    
     def _count_linear_conflicts(self, state: PuzzleState) -> int:
         """
         Count the number of linear conflicts.
@@ -121,6 +275,7 @@ class H4_LinearConflict(Heuristic):
             Number of linear conflicts
         """
         conflicts = 0
+        goal_positions = self._goal_pos
         
         # Check each row
         for row in range(3):
@@ -137,13 +292,13 @@ class H4_LinearConflict(Heuristic):
                         continue
                     
                     # Check if both tiles belong to this row in goal state
-                    goal_row_i = tile_i // 3
-                    goal_row_j = tile_j // 3
+                    goal_row_i = goal_positions[tile_i] // 3
+                    goal_row_j = goal_positions[tile_j] // 3
                     
                     if goal_row_i == row and goal_row_j == row:
                         # Both belong to this row
-                        goal_col_i = tile_i % 3
-                        goal_col_j = tile_j % 3
+                        goal_col_i = goal_positions[tile_i] % 3
+                        goal_col_j = goal_positions[tile_j] % 3
                         
                         # Check if they're in reverse order
                         if goal_col_i > goal_col_j:
@@ -164,13 +319,13 @@ class H4_LinearConflict(Heuristic):
                         continue
                     
                     # Check if both tiles belong to this column in goal state
-                    goal_col_i = tile_i % 3
-                    goal_col_j = tile_j % 3
+                    goal_col_i = goal_positions[tile_i] % 3
+                    goal_col_j = goal_positions[tile_j] % 3
                     
                     if goal_col_i == col and goal_col_j == col:
                         # Both belong to this column
-                        goal_row_i = tile_i // 3
-                        goal_row_j = tile_j // 3
+                        goal_row_i = goal_positions[tile_i] // 3
+                        goal_row_j = goal_positions[tile_j] // 3
                         
                         # Check if they're in reverse order
                         if goal_row_i > goal_row_j:
@@ -178,14 +333,475 @@ class H4_LinearConflict(Heuristic):
         
         return conflicts
     
+    def for_goal(self, goal: Tuple[int, ...]) -> 'Heuristic':
+        goal = tuple(goal)
+        return self if goal == self.goal else H4_LinearConflict(goal)
+    
     def get_name(self) -> str:
         return "H4: Linear Conflict"
 
 
+class TableHeuristic(Heuristic):
+    """
+    Base class for heuristics backed by a table in a TableRegistry.
+    The table is attached on first use, separately in each process, so
+    instances can be pickled into worker processes.
+    """
+    
+    # Name of the table in the registry
+    table_name: str = None
+    
+    def __init__(self, registry=None):
+        """
+        Initialize heuristic.
+        
+        Args:
+            registry: TableRegistry holding the table
+                      (default: table_registry.TABLES)
+        """
+        self.registry = registry
+        self._table = None
+    
+    def table(self) -> memoryview:
+        """Attach to the table, building it if needed."""
+        if self._table is None:
+            if self.registry is None:
+                from .table_registry import TABLES
+                self.registry = TABLES
+            self._table = self.registry.get(self.table_name)
+        return self._table
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_table"] = None
+        return state
+
+
+def _manhattan_lookup(goal: Tuple[int, ...]) -> List[int]:
+    """Manhattan distance per (position, tile), indexed by pos * 9 + tile; the blank contributes nothing."""
+    goal_pos = [goal.index(tile) for tile in range(9)]
+    return [
+        0 if tile == 0 else abs(pos // 3 - goal_pos[tile] // 3) + abs(pos % 3 - goal_pos[tile] % 3)
+        for pos in range(9) for tile in range(9)
+    ]
+
+
+_MANHATTAN = _manhattan_lookup(PuzzleState.GOAL_STATE)
+
+# Walking distance table by the line of the goal blank, counted from the
+# nearest edge (a goal blank on the last line is handled by mirroring)
+_WD_TABLES = ("walking_distance", "walking_distance_middle")
+
+
+def _walking_distance_layout(goal: Tuple[int, ...]):
+    """
+    Walking distance lookups for a goal board.
+    
+    Returns:
+        Tuple of (row bits, column bits) indexed by pos * 9 + tile, the
+        (row, column) line number of each position, and the names of the
+        row and column tables
+    """
+    goal_pos = [goal.index(tile) for tile in range(9)]
+    blank = goal_pos[0]
+    # Number lines from the goal blank's side, so that its line is 0 or 1
+    rows = (2, 1, 0) if blank // 3 == 2 else (0, 1, 2)
+    cols = (2, 1, 0) if blank % 3 == 2 else (0, 1, 2)
+    row_bits = [
+        0 if tile == 0 else 1 << wd_shift(rows[pos // 3], rows[goal_pos[tile] // 3])
+        for pos in range(9) for tile in range(9)
+    ]
+    col_bits = [
+        0 if tile == 0 else 1 << wd_shift(cols[pos % 3], cols[goal_pos[tile] % 3])
+        for pos in range(9) for tile in range(9)
+    ]
+    lines = tuple((rows[pos // 3] << WD_BLANK_SHIFT, cols[pos % 3] << WD_BLANK_SHIFT) for pos in range(9))
+    return row_bits, col_bits, lines, _WD_TABLES[rows[blank // 3]], _WD_TABLES[cols[blank % 3]]
+
+
+# Board positions in column-major order
+_COLUMN_MAJOR = (0, 3, 6, 1, 4, 7, 2, 5, 8)
+
+
+def _goal_ranks(goal: Tuple[int, ...], order) -> Tuple[int, ...]:
+    """Rank (1-8) of each tile when the goal is read in `order`, 0 for the blank."""
+    ranks = [0] * 9
+    rank = 0
+    for pos in order:
+        if goal[pos]:
+            rank += 1
+            ranks[goal[pos]] = rank
+    return tuple(ranks)
+
+# Each corner with its two neighboring positions
+_CORNER_NEIGHBORS = ((0, 1, 3), (2, 1, 5), (6, 3, 7), (8, 5, 7))
+
+# Linear conflict table for each goal blank position (see LC_GOALS)
+_LC_TABLES = {0: "linear_conflict", 1: "linear_conflict_edge", 4: "linear_conflict_centre"}
+
+
+def _corner_layout(goal: Tuple[int, ...]) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Corners checked by the corner-tile term of a goal board.
+    
+    Returns:
+        Tuple of (corner, neighbor a, neighbor b, and the goal tile of
+        each) for the corners where the goal has a tile at the corner and
+        at both neighbors
+    """
+    return tuple(
+        (corner, a, b, goal[corner], goal[a], goal[b])
+        for corner, a, b in _CORNER_NEIGHBORS
+        if goal[corner] and goal[a] and goal[b]
+    )
+
+
+class H5_WalkingDistance(TableHeuristic):
+    """
+    H5: Walking Distance heuristic.
+    Vertical moves needed to bring every tile into its goal row, moving
+    tiles freely within a row, plus the same for columns; both looked up
+    in the walking distance table (see heuristic_tables.py).
+    """
+    
+    cost = 1.5
+    table_name = "walking_distance"
+    
+    def __init__(self, registry=None, goal: Tuple[int, ...] = None):
+        """
+        Initialize heuristic.
+        
+        Args:
+            registry: TableRegistry holding the tables
+                      (default: table_registry.TABLES)
+            goal: Goal board (default: the standard goal)
+        """
+        super().__init__(registry)
+        self.goal = PuzzleState.GOAL_STATE if goal is None else tuple(goal)
+        (self._row_bits, self._col_bits, self._lines,
+         self.table_name, self.column_table_name) = _walking_distance_layout(self.goal)
+        self._column_table = None
+    
+    def table(self) -> memoryview:
+        """Attach to the row table and the column table, building them if needed."""
+        if self._table is None:
+            super().table()
+            self._column_table = self.registry.get(self.column_table_name)
+        return self._table
+    
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["_column_table"] = None
+        return state
+    
+    def compute(self, state: PuzzleState) -> int:
+        """
+        Calculate vertical plus horizontal walking distance.
+        
+        Returns:
+            Walking distance lower bound
+        """
+        table = self._table if self._table is not None else self.table()
+        row_bits, col_bits = self._row_bits, self._col_bits
+        rows = cols = 0
+        for i, tile in enumerate(state.state):
+            rows += row_bits[i * 9 + tile]
+            cols += col_bits[i * 9 + tile]
+        row_line, col_line = self._lines[state.empty_pos]
+        return table[rows | row_line] + self._column_table[cols | col_line]
+    
+    def compute_batch(self, states):
+        import numpy as np
+        row_table = np.asarray(self.table())
+        col_table = np.asarray(self._column_table)
+        index = np.arange(9) * 9 + states
+        rows = np.array(self._row_bits, dtype=np.int64)[index].sum(axis=1)
+        cols = np.array(self._col_bits, dtype=np.int64)[index].sum(axis=1)
+        lines = np.array(self._lines, dtype=np.int64)[np.argmax(states == 0, axis=1)]
+        return row_table[rows | lines[:, 0]].astype(np.int32) + col_table[cols | lines[:, 1]]
+    
+    def for_goal(self, goal: Tuple[int, ...]) -> 'Heuristic':
+        goal = tuple(goal)
+        return self if goal == self.goal else H5_WalkingDistance(self.registry, goal)
+    
+    def get_name(self) -> str:
+        return "H5: Walking Distance"
+
+
+class H6_InversionDistance(Heuristic):
+    """
+    H6: Inversion Distance heuristic.
+    A vertical move changes the row-major inversion count by 0 or 2 and a
+    horizontal move leaves it unchanged (and vice versa for column-major
+    order), so half of each inversion count bounds the moves in that
+    direction.
+    """
+    
+    cost = 4.6
+    goal = PuzzleState.GOAL_STATE
+    # Rank of each tile in the goal read in row-major and in column-major order
+    _row_rank = _goal_ranks(PuzzleState.GOAL_STATE, range(9))
+    _col_rank = _goal_ranks(PuzzleState.GOAL_STATE, _COLUMN_MAJOR)
+    
+    def __init__(self, goal: Tuple[int, ...] = None):
+        """
+        Initialize heuristic.
+        
+        Args:
+            goal: Goal board (default: the standard goal)
+        """
+        if goal is not None:
+            self.goal = tuple(goal)
+            self._row_rank = _goal_ranks(self.goal, range(9))
+            self._col_rank = _goal_ranks(self.goal, _COLUMN_MAJOR)
+    
+    def compute(self, state: PuzzleState) -> int:
+        """
+        Calculate row-major inversions / 2 + column-major inversions / 2.
+        
+        Returns:
+            Inversion distance lower bound
+        """
+        tiles = state.state
+        row_rank, col_rank = self._row_rank, self._col_rank
+        by_rows = [row_rank[tile] for tile in tiles if tile]
+        by_cols = [col_rank[tiles[pos]] for pos in _COLUMN_MAJOR if tiles[pos]]
+        vertical = horizontal = 0
+        for i in range(8):
+            a, b = by_rows[i], by_cols[i]
+            for j in range(i + 1, 8):
+                if a > by_rows[j]:
+                    vertical += 1
+                if b > by_cols[j]:
+                    horizontal += 1
+        return vertical // 2 + horizontal // 2
+    
+    def compute_batch(self, states):
+        import numpy as np
+        
+        def half_inversions(order, ranks):
+            # Rank of each tile in reading order, with the blank removed
+            ranked = np.asarray(ranks)[states[:, order]]
+            tiles = ranked[ranked != 0].reshape(len(states), 8)
+            inversions = np.zeros(len(states), dtype=np.int32)
+            for i in range(8):
+                inversions += (tiles[:, i:i + 1] > tiles[:, i + 1:]).sum(axis=1)
+            return inversions // 2
+        
+        # The blank keeps rank 0 in both orders so it can be filtered out
+        return (half_inversions(list(range(9)), self._row_rank)
+                + half_inversions(list(_COLUMN_MAJOR), self._col_rank))
+    
+    def for_goal(self, goal: Tuple[int, ...]) -> 'Heuristic':
+        goal = tuple(goal)
+        return self if goal == self.goal else H6_InversionDistance(goal)
+    
+    def get_name(self) -> str:
+        return "H6: Inversion Distance"
+
+
+class H7_LinearConflictCorners(TableHeuristic):
+    """
+    H7: Linear Conflict + Corner Tiles heuristic.
+    Manhattan distance plus the linear conflict extra moves of each row and
+    column (table lookup, counting the minimum number of tiles that must
+    leave each line), plus 2 for each corner whose tile is missing while
+    both neighbors are in place, since one neighbor must step aside and
+    back. A corner is only counted when neither neighbor is involved in a
+    conflict already counted, so no extra move is counted twice.
+    """
+    
+    cost = 2.7
+    table_name = "linear_conflict"
+    goal = PuzzleState.GOAL_STATE
+    _manhattan = _MANHATTAN
+    _corners = _corner_layout(PuzzleState.GOAL_STATE)
+    
+    def __init__(self, registry=None, goal: Tuple[int, ...] = None):
+        """
+        Initialize heuristic.
+        
+        Args:
+            registry: TableRegistry holding the tables
+                      (default: table_registry.TABLES)
+            goal: Goal board (default: the standard goal); one of LC_GOALS,
+                  the goals linear conflict tables are built for
+        
+        Raises:
+            ValueError: If there is no linear conflict table for the goal
+        """
+        super().__init__(registry)
+        if goal is not None and tuple(goal) != self.goal:
+            goal = tuple(goal)
+            blank = goal.index(0)
+            if LC_GOALS.get(blank) != goal:
+                raise ValueError(f"{self.get_name()} only supports the canonical goals of goals.py, not {goal}")
+            self.goal = goal
+            self.table_name = _LC_TABLES[blank]
+            self._manhattan = _manhattan_lookup(goal)
+            self._corners = _corner_layout(goal)
+    
+    def compute(self, state: PuzzleState) -> int:
+        """
+        Calculate Manhattan distance + linear conflicts + corner conflicts.
+        
+        Returns:
+            Heuristic value
+        """
+        table = self._table if self._table is not None else self.table()
+        manhattan = self._manhattan
+        s = state.state
+        h = 0
+        for i, tile in enumerate(s):
+            h += manhattan[i * 9 + tile]
+        
+        lines = [
+            table[line * 729 + s[a] * 81 + s[b] * 9 + s[c]]
+            for line, (a, b, c) in enumerate(LC_LINES)
+        ]
+        h += sum(lines)
+        
+        charged = set()
+        for corner, a, b, corner_tile, a_tile, b_tile in self._corners:
+            if (s[corner] != corner_tile and s[a] == a_tile and s[b] == b_tile
+                    and a not in charged and b not in charged
+                    and not (lines[a // 3] or lines[3 + a % 3] or lines[b // 3] or lines[3 + b % 3])):
+                h += 2
+                charged.add(a)
+                charged.add(b)
+        
+        return h
+    
+    def compute_batch(self, states):
+        import numpy as np
+        table = np.asarray(self.table())
+        states = np.asarray(states, dtype=np.int64)
+        h = np.array(self._manhattan, dtype=np.int32)[np.arange(9) * 9 + states].sum(axis=1, dtype=np.int32)
+        
+        # lines[:, line]: extra moves of each row, then each column
+        lines = np.stack([
+            table[line * 729 + states[:, a] * 81 + states[:, b] * 9 + states[:, c]]
+            for line, (a, b, c) in enumerate(LC_LINES)
+        ], axis=1).astype(np.int32)
+        h += lines.sum(axis=1, dtype=np.int32)
+        
+        # Corners in the same order as compute(), so shared neighbors are charged once
+        free = lines == 0
+        charged = np.zeros(states.shape, dtype=bool)
+        for corner, a, b, corner_tile, a_tile, b_tile in self._corners:
+            counted = ((states[:, corner] != corner_tile) & (states[:, a] == a_tile) & (states[:, b] == b_tile)
+                       & ~charged[:, a] & ~charged[:, b]
+                       & free[:, a // 3] & free[:, 3 + a % 3] & free[:, b // 3] & free[:, 3 + b % 3])
+            h += 2 * counted
+            charged[:, a] |= counted
+            charged[:, b] |= counted
+        return h
+    
+    def for_goal(self, goal: Tuple[int, ...]) -> 'Heuristic':
+        goal = tuple(goal)
+        return self if goal == self.goal else H7_LinearConflictCorners(self.registry, goal)
+    
+    def get_name(self) -> str:
+        return "H7: LC + Corner Tiles"
+
+
+class ExactDistance(TableHeuristic):
+    """
+    H*: Exact optimal solution cost, read from the shared exact distance
+    table. Not part of HEURISTICS; it serves as a perfect-information
+    reference. Only defined for solvable boards.
+    """
+    
+    cost = 0.6
+    table_name = "exact_distances"
+    
+    def compute(self, state: PuzzleState) -> int:
+        """
+        Look up the exact distance.
+        
+        Raises:
+            ValueError: If the board is unsolvable, rather than reading the
+                        distance of its solvable partner
+        """
+        table = self._table if self._table is not None else self.table()
+        return table[rank_solvable_checked(state.state)]
+    
+    def get_name(self) -> str:
+        return "H*: Exact Distance"
+
+
+class MaxHeuristic(Heuristic):
+    """
+    Maximum of several heuristics.
+    The maximum of admissible heuristics is admissible and at least as tight
+    as each component. Components are evaluated cheapest first, and
+    compute_bounded() skips the costlier ones once a cheaper component
+    already reaches the pruning threshold.
+    """
+    
+    def __init__(self, heuristics: List[Heuristic]):
+        """
+        Initialize composite heuristic.
+        
+        Args:
+            heuristics: Component heuristics
+        """
+        if not heuristics:
+            raise ValueError("MaxHeuristic needs at least one component")
+        self.heuristics = sorted(heuristics, key=lambda h: h.cost)
+        self.cost = sum(h.cost for h in heuristics)
+        
+        # Number of compute_bounded() calls that skipped at least one component
+        self.short_circuits = 0
+    
+    def compute(self, state: PuzzleState) -> int:
+        """
+        Compute the maximum over all components.
+        
+        Returns:
+            Largest component value
+        """
+        return max(h.compute(state) for h in self.heuristics)
+    
+    def compute_bounded(self, state: PuzzleState, bound: float) -> int:
+        """
+        Compute the maximum, stopping as soon as it reaches `bound`.
+        
+        Returns:
+            Largest component value, or the first partial maximum >= bound
+        """
+        best = 0
+        last = len(self.heuristics) - 1
+        for i, heuristic in enumerate(self.heuristics):
+            value = heuristic.compute_bounded(state, bound)
+            if value > best:
+                best = value
+            if best >= bound and i < last:
+                self.short_circuits += 1
+                break
+        return best
+    
+    def compute_batch(self, states):
+        import numpy as np
+        return np.maximum.reduce([h.compute_batch(states) for h in self.heuristics])
+    
+    def for_goal(self, goal: Tuple[int, ...]) -> 'Heuristic':
+        components = [h.for_goal(goal) for h in self.heuristics]
+        if all(new is old for new, old in zip(components, self.heuristics)):
+            return self
+        return MaxHeuristic(components)
+    
+    def get_name(self) -> str:
+        return "Max(" + ", ".join(h.get_name().split(":")[0] for h in self.heuristics) + ")"
+
+
 # Singleton instances for easy access
 h1 = H1_Trivial()
 h2 = H2_MisplacedTiles()
 h3 = H3_Manhattan()
 h4 = H4_LinearConflict()
+h5 = H5_WalkingDistance()
+h6 = H6_InversionDistance()
+h7 = H7_LinearConflictCorners()
 
-HEURISTICS = [h1, h2, h3, h4]
+HEURISTICS = [h1, h2, h3, h4, h5, h6, h7]
@@ -0,0 +1,333 @@
+"""
+Iterative Deepening A* (IDA*) for the 8-puzzle.
+
+IDA* runs depth-first searches bounded by f = g + h <= threshold, raising
+the threshold to the smallest f that exceeded it after each failed pass.
+It needs memory only for the current path, which makes it the base for the
+parallel engine in parallel.py.
+"""
+
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, List, Optional, Tuple
+
+from .puzzle_state import PuzzleState
+from .heuristics import Heuristic
+from .branch_and_bound import SearchStatistics
+from .telemetry import DEFAULT_INTERVAL, TelemetrySampler
+from .checkpoint import DEFAULT_CHECKPOINT_INTERVAL, CheckpointLog, pack_boards, unpack_boards, pack_path, unpack_path
+
+
+@dataclass
+class DFSResult:
+    """Outcome of one threshold-bounded depth-first search."""
+    path: Optional[List[PuzzleState]]
+    next_threshold: float
+    nodes_expanded: int
+    lower_bound_sum: float
+    # Most unexplored children held on the stack, and longest path, at once
+    peak_frontier: int = 0
+    peak_path: int = 0
+
+
+def bounded_dfs(path: List[PuzzleState], g: int, threshold: float, heuristic: Heuristic,
+                should_stop: Optional[Callable[[], bool]] = None,
+                stop_interval: int = 256,
+                progress: Optional[Callable[[int, int], None]] = None,
+                progress_interval: int = DEFAULT_INTERVAL,
+                progress_offset: int = 0,
+                snapshot: Optional[Callable[[List[PuzzleState], List[List[PuzzleState]], DFSResult], None]] = None,
+                snapshot_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+                resume: Optional[Tuple[List[List[PuzzleState]], DFSResult]] = None) -> DFSResult:
+    """
+    Search below the last state of `path` for a goal with f <= threshold.
+
+    States already on the path are not revisited. The search is iterative
+    (explicit stack of unexplored children per depth).
+
+    Args:
+        path: States from the root to the subtree root
+        g: Cost of `path` (normally len(path) - 1)
+        threshold: Maximum f-value explored
+        heuristic: Heuristic function
+        should_stop: Optional callback polled every `stop_interval`
+                     expansions; the search gives up when it returns True
+        stop_interval: Expansions between should_stop polls
+        progress: Optional callback called every `progress_interval`
+                  expansions with (expansions so far, counting
+                  `progress_offset`, and unexplored children on the stack)
+        progress_interval: Expansions between progress calls
+        progress_offset: Expansions made before this search (e.g. by
+                         earlier IDA* iterations); the interval runs over
+                         the total, so it does not restart with every search
+        snapshot: Optional callback called every `snapshot_interval`
+                  expansions with the path, the stack of unexplored
+                  children per depth below the subtree root, and the
+                  counters so far (as a DFSResult without a path)
+        snapshot_interval: Expansions between snapshot calls
+        resume: (stack, counters) from a snapshot to continue from, with
+                `path` the snapshot's path
+
+    Returns:
+        DFSResult with the solution path (or None), the smallest f above
+        the threshold seen, expansion counts and peak memory use
+    """
+    path = list(path)
+    on_path = set(path)
+    next_threshold = float('inf')
+    nodes_expanded = 0
+    lower_bound_sum = 0
+
+    # stack[i] holds the children of path[base + i] not yet explored
+    base = len(path) - 1
+    stack: List[List[PuzzleState]] = []
+    pending = [path[-1]]
+    frontier = peak_frontier = 0
+    peak_path = len(path)
+
+    if resume is not None:
+        stack = [list(children) for children in resume[0]]
+        base = len(path) - len(stack)
+        pending = None
+        frontier = sum(map(len, stack))
+        counters = resume[1]
+        next_threshold, nodes_expanded = counters.next_threshold, counters.nodes_expanded
+        lower_bound_sum = counters.lower_bound_sum
+        peak_frontier, peak_path = counters.peak_frontier, counters.peak_path
+
+    while True:
+        if pending is not None:
+            # Evaluate the node just placed at the end of the path
+            state = pending[0]
+            pending = None
+            depth_g = g + len(stack)
+            h = heuristic.compute_bounded(state, threshold - depth_g + 1)
+            f = depth_g + h
+            if f > threshold:
+                next_threshold = min(next_threshold, f)
+                if not stack:
+                    break
+                on_path.discard(path.pop())
+            elif state.is_goal():
+                return DFSResult(path, threshold, nodes_expanded, lower_bound_sum, peak_frontier, peak_path)
+            else:
+                nodes_expanded += 1
+                lower_bound_sum += h
+                if should_stop is not None and nodes_expanded % stop_interval == 0 and should_stop():
+                    break
+                if progress is not None and (progress_offset + nodes_expanded) % progress_interval == 0:
+                    progress(progress_offset + nodes_expanded, frontier)
+                children = [n for n in state.get_neighbors() if n not in on_path]
+                children.reverse()
+                stack.append(children)
+                frontier += len(children)
+                if frontier > peak_frontier:
+                    peak_frontier = frontier
+                if snapshot is not None and nodes_expanded % snapshot_interval == 0:
+                    snapshot(path, stack, DFSResult(None, next_threshold, nodes_expanded, lower_bound_sum,
+                                                    peak_frontier, peak_path))
+
+        # Descend into the next unexplored child, backtracking as needed
+        while stack and not stack[-1]:
+            stack.pop()
+            if len(path) - 1 > base:
+                on_path.discard(path.pop())
+        if not stack:
+            break
+        child = stack[-1].pop()
+        frontier -= 1
+        path.append(child)
+        if len(path) > peak_path:
+            peak_path = len(path)
+        on_path.add(child)
+        pending = [child]
+
+    return DFSResult(None, next_threshold, nodes_expanded, lower_bound_sum, peak_frontier, peak_path)
+
+
+class IDAStarSolver:
+    """Serial IDA* solver with the same interface as BranchAndBoundSolver."""
+
+    def __init__(self, heuristic: Heuristic, telemetry=None, telemetry_interval: int = DEFAULT_INTERVAL,
+                 checkpoint: Optional[CheckpointLog] = None,
+                 checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL):
+        """
+        Initialize solver with a heuristic.
+
+        Args:
+            heuristic: Heuristic function to use for search
+            telemetry: Optional callable receiving a telemetry.TelemetrySample
+                       every `telemetry_interval` expansions and at the end;
+                       the f-bound reported is the current threshold
+            telemetry_interval: Expansions between telemetry samples
+            checkpoint: Optional log the search state (threshold, current
+                        path and unexplored children) is written to every
+                        `checkpoint_interval` expansions of an iteration and
+                        between iterations once that many have passed; a
+                        solve of the same board with the same log resumes
+                        from it
+            checkpoint_interval: Expansions between checkpoints
+        """
+        self.heuristic = heuristic
+        self.telemetry = telemetry
+        self.telemetry_interval = telemetry_interval
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self.statistics = None
+
+    def solve(self, initial_state: PuzzleState) -> Tuple[Optional[List[PuzzleState]], SearchStatistics]:
+        """
+        Solve the puzzle using IDA*.
+
+        Args:
+            initial_state: Starting puzzle state
+
+        Returns:
+            Tuple of (solution_path, statistics)
+        """
+        start_time = time.time()
+
+        stats = SearchStatistics(
+            heuristic_name=self.heuristic.get_name(),
+            solution_found=False,
+            solution_length=0,
+            nodes_expanded=0,
+            optimal_cost=0,
+            execution_time=0,
+            lower_bound_sum=0,
+            lower_bound_count=0
+        )
+
+        if not initial_state.is_solvable():
+            stats.execution_time = time.time() - start_time
+            return None, stats
+
+        path = None
+        threshold = self.heuristic.compute(initial_state)
+
+        progress = None
+        if self.telemetry is not None:
+            sampler = TelemetrySampler(stats.heuristic_name)
+
+            def progress(nodes_expanded: int, frontier: int):
+                self.telemetry(sampler.sample(nodes_expanded, threshold, frontier))
+
+        # Continue a checkpointed search of this board instead
+        checkpoint = self.checkpoint
+        snapshot = resume = None
+        dfs_path = [initial_state]
+        if checkpoint is not None:
+            resumed = self._load_checkpoint(initial_state)
+            if resumed is not None:
+                stats, threshold, dfs_path, resume = resumed
+                start_time -= stats.execution_time
+            next_checkpoint = stats.nodes_expanded + self.checkpoint_interval
+
+            def snapshot(dfs_path: List[PuzzleState], stack: List[List[PuzzleState]],
+                         counters: Optional[DFSResult] = None):
+                stats.execution_time = time.time() - start_time
+                self._save_checkpoint(initial_state, stats, threshold, dfs_path, stack, counters)
+
+        while threshold != float('inf'):
+            if resume is None and checkpoint is not None and stats.nodes_expanded >= next_checkpoint:
+                snapshot(dfs_path, [])
+                next_checkpoint = stats.nodes_expanded + self.checkpoint_interval
+            result = bounded_dfs(dfs_path, 0, threshold, self.heuristic,
+                                 progress=progress, progress_interval=self.telemetry_interval,
+                                 progress_offset=stats.nodes_expanded,
+                                 snapshot=snapshot, snapshot_interval=self.checkpoint_interval,
+                                 resume=resume)
+            dfs_path, resume = [initial_state], None
+            stats.nodes_expanded += result.nodes_expanded
+            stats.lower_bound_sum += result.lower_bound_sum
+            stats.lower_bound_count += result.nodes_expanded
+            stats.peak_frontier = max(stats.peak_frontier, result.peak_frontier)
+            stats.peak_closed = max(stats.peak_closed, result.peak_path)
+            if result.path is not None:
+                path = result.path
+                break
+            threshold = result.next_threshold
+
+        stats.bytes_per_node = self._estimate_node_bytes(initial_state)
+        if self.telemetry is not None:
+            incumbent = len(path) - 1 if path is not None else float('inf')
+            self.telemetry(sampler.sample(stats.nodes_expanded, threshold, 0, incumbent, done=True))
+        if checkpoint is not None:
+            checkpoint.clear()
+
+        if path is not None:
+            stats.solution_found = True
+            stats.solution_length = len(path) - 1
+            stats.optimal_cost = len(path) - 1
+
+        stats.execution_time = time.time() - start_time
+        self.statistics = stats
+
+        return path, stats
+
+    def _checkpoint_header(self, initial_state: PuzzleState) -> dict:
+        """Settings a checkpoint must have been written with to be resumed."""
+        return {
+            "solver": "ida_star",
+            "heuristic": self.heuristic.get_name(),
+            "start": initial_state.pack(),
+        }
+
+    def _save_checkpoint(self, initial_state: PuzzleState, stats: SearchStatistics, threshold: float,
+                         path: List[PuzzleState], stack: List[List[PuzzleState]],
+                         counters: Optional[DFSResult]):
+        """
+        Write the search state to the checkpoint log, replacing the last one.
+
+        Data: the path, then the unexplored children of each depth. Without
+        counters the record marks the start of the iteration at `threshold`.
+        """
+        header = self._checkpoint_header(initial_state)
+        header.update(stats=asdict(stats), threshold=threshold,
+                      stack=[len(children) for children in stack], counters=None)
+        if counters is not None:
+            header["counters"] = [counters.next_threshold, counters.nodes_expanded, counters.lower_bound_sum,
+                                  counters.peak_frontier, counters.peak_path]
+        data = pack_path(path) + pack_boards(child for children in stack for child in children)
+        self.checkpoint.save(header, data)
+
+    def _load_checkpoint(self, initial_state: PuzzleState):
+        """
+        Read the last checkpoint of this search, if any.
+
+        Returns:
+            None, or a tuple of (stats, threshold, path, resume), with
+            resume the bounded_dfs() argument (None at an iteration start)
+
+        Raises:
+            ValueError: If the log holds a checkpoint of another search
+        """
+        record = self.checkpoint.load()
+        if record is None:
+            return None
+        header, data = record
+        expected = self._checkpoint_header(initial_state)
+        if any(header.get(key) != value for key, value in expected.items()):
+            raise ValueError(f"Checkpoint log {self.checkpoint.path} holds a different search")
+
+        stats = SearchStatistics(**header["stats"])
+        if header["counters"] is None:
+            return stats, header["threshold"], [initial_state], None
+
+        depth = len(data) - 9 * sum(header["stack"])
+        path = unpack_path(initial_state, data[:depth])
+        children = unpack_boards(data[depth:], type(initial_state))
+        stack = []
+        for size in header["stack"]:
+            stack.append(children[:size])
+            children = children[size:]
+        return stats, header["threshold"], path, (stack, DFSResult(None, *header["counters"]))
+
+    @staticmethod
+    def _estimate_node_bytes(state: PuzzleState) -> int:
+        """
+        Estimate memory per held state: the board plus a list slot (stack
+        or path) and, for states on the path, a set slot.
+        """
+        return sys.getsizeof(state) + sys.getsizeof(state.state) + 8 + 2 * 8
@@ -0,0 +1,234 @@
+"""
+Memory-bounded best-first search (SMA*) for the 8-puzzle.
+
+BranchAndBoundSolver keeps every generated state in its open and closed
+sets, which does not fit in memory for larger boards. SMA* keeps only a
+search tree of at most `max_nodes` nodes and no closed set. Each node
+records the blank position of its parent (the operator leading back), so
+the parent is never regenerated. When the cap is reached, the worst leaf
+is evicted and its f-value is backed up into its parent, which is
+re-opened so the subtree can be regenerated if it becomes promising again.
+"""
+
+import sys
+import time
+import heapq
+import itertools
+from typing import Dict, List, Optional, Tuple
+
+from .puzzle_state import PuzzleState
+from .heuristics import Heuristic
+from .branch_and_bound import SearchStatistics
+
+
+class _Node:
+    """Search tree node. f is the backed-up lower bound on cost through the node."""
+
+    __slots__ = ('state', 'g', 'h', 'f', 'parent', 'children', 'forgotten_f', 'in_open', 'alive')
+
+    def __init__(self, state: PuzzleState, g: int, h: int, f: float, parent: Optional['_Node']):
+        self.state = state
+        self.g = g
+        self.h = h
+        self.f = f
+        self.parent = parent
+        self.children: List['_Node'] = []
+        # Lowest f among evicted children, inf if none were evicted
+        self.forgotten_f = float('inf')
+        self.in_open = False
+        self.alive = True
+
+
+class SMAStarSolver:
+    """
+    Simplified Memory-bounded A* (Russell, 1992) with full node expansion.
+    Returns an optimal solution whenever its path fits within the node cap.
+    """
+
+    def __init__(self, heuristic: Heuristic, max_nodes: int = 100000):
+        """
+        Initialize solver.
+
+        Args:
+            heuristic: Heuristic function to use for search
+            max_nodes: Maximum number of search tree nodes kept in memory
+        """
+        if max_nodes < 2:
+            raise ValueError("max_nodes must be at least 2")
+        self.heuristic = heuristic
+        self.max_nodes = max_nodes
+        self.statistics = None
+        self.memory: Dict[str, float] = {}
+
+    def solve(self, initial_state: PuzzleState) -> Tuple[Optional[List[PuzzleState]], SearchStatistics]:
+        """
+        Solve the puzzle within the node cap.
+
+        Memory usage of the solve is reported in self.memory: peak nodes
+        held, evictions, and estimated bytes per node and at peak. Since a
+        node is expanded fully before eviction, the peak can exceed the cap
+        by up to the branching factor.
+
+        Args:
+            initial_state: Starting puzzle state
+
+        Returns:
+            Tuple of (solution_path, statistics); solution_path is None if
+            the puzzle is unsolvable or no solution fits in memory
+        """
+        start_time = time.time()
+
+        stats = SearchStatistics(
+            heuristic_name=self.heuristic.get_name(),
+            solution_found=False,
+            solution_length=0,
+            nodes_expanded=0,
+            optimal_cost=0,
+            execution_time=0,
+            lower_bound_sum=0,
+            lower_bound_count=0
+        )
+        self.memory = {"node_cap": self.max_nodes, "peak_nodes": 0, "evictions": 0}
+
+        if not initial_state.is_solvable():
+            stats.execution_time = time.time() - start_time
+            return None, stats
+
+        counter = itertools.count()
+        # best: lowest f, then deepest; worst: highest f, then shallowest
+        best_heap: List[Tuple] = []
+        worst_heap: List[Tuple] = []
+
+        def push_open(node: _Node):
+            node.in_open = True
+            seq = next(counter)
+            heapq.heappush(best_heap, (node.f, -node.g, seq, node))
+            heapq.heappush(worst_heap, (-node.f, node.g, seq, node))
+
+        h_root = self.heuristic.compute(initial_state)
+        root = _Node(initial_state, 0, h_root, h_root, None)
+        push_open(root)
+        node_count = 1
+        peak_nodes = 1
+        evictions = 0
+        bytes_per_node = self._estimate_node_bytes(root)
+
+        solution_node = None
+        while best_heap:
+            f_value, _, _, best = heapq.heappop(best_heap)
+            if not (best.alive and best.in_open and best.f == f_value):
+                continue  # stale entry
+            if best.f == float('inf'):
+                break  # no solution fits in memory
+
+            stats.nodes_expanded += 1
+            stats.lower_bound_sum += best.h
+            stats.lower_bound_count += 1
+
+            if best.state.is_goal():
+                solution_node = best
+                break
+
+            # Generate every successor not already in memory, except the parent
+            live = {child.state for child in best.children}
+            back_pos = best.parent.state.empty_pos if best.parent is not None else -1
+            new_g = best.g + 1
+            for neighbor in best.state.get_neighbors():
+                if neighbor.empty_pos == back_pos or neighbor in live:
+                    continue
+                h_neighbor = self.heuristic.compute(neighbor)
+                if new_g >= self.max_nodes - 1 and not neighbor.is_goal():
+                    # The path through this node can never fit in memory
+                    f_neighbor = float('inf')
+                else:
+                    f_neighbor = max(best.f, new_g + h_neighbor)
+                child = _Node(neighbor, new_g, h_neighbor, f_neighbor, best)
+                best.children.append(child)
+                push_open(child)
+                node_count += 1
+
+            # All successors are now in memory
+            best.in_open = False
+            best.forgotten_f = float('inf')
+            self._back_up(best, push_open)
+            peak_nodes = max(peak_nodes, node_count)
+
+            # Heaps use lazy deletion; drop stale entries once they dominate
+            if len(best_heap) > 4 * self.max_nodes:
+                best_heap[:] = [e for e in best_heap if e[3].alive and e[3].in_open and e[3].f == e[0]]
+                worst_heap[:] = [e for e in worst_heap if e[3].alive and e[3].in_open and e[3].f == -e[0]]
+                heapq.heapify(best_heap)
+                heapq.heapify(worst_heap)
+
+            # Evict the worst leaves until the tree fits again
+            while node_count > self.max_nodes and worst_heap:
+                neg_f, _, _, worst = heapq.heappop(worst_heap)
+                if not (worst.alive and worst.in_open and worst.f == -neg_f
+                        and not worst.children and worst.parent is not None):
+                    continue
+                parent = worst.parent
+                parent.children.remove(worst)
+                parent.forgotten_f = min(parent.forgotten_f, worst.f)
+                worst.alive = False
+                worst.in_open = False
+                node_count -= 1
+                evictions += 1
+                # Re-push even if already open: its earlier worst-heap entry
+                # may have been discarded while it still had children
+                push_open(parent)
+
+        best_solution_path = None
+        if solution_node is not None:
+            best_solution_path = []
+            node = solution_node
+            while node is not None:
+                best_solution_path.append(node.state)
+                node = node.parent
+            best_solution_path.reverse()
+            stats.solution_found = True
+            stats.solution_length = solution_node.g
+            stats.optimal_cost = solution_node.g
+
+        self.memory["peak_nodes"] = peak_nodes
+        self.memory["evictions"] = evictions
+        self.memory["bytes_per_node"] = bytes_per_node
+        self.memory["peak_bytes"] = peak_nodes * bytes_per_node
+        stats.peak_closed = peak_nodes
+        stats.bytes_per_node = bytes_per_node
+
+        stats.execution_time = time.time() - start_time
+        self.statistics = stats
+
+        return best_solution_path, stats
+
+    @staticmethod
+    def _back_up(node: _Node, push_open):
+        """
+        Raise f-values from `node` up towards the root.
+
+        A node's f becomes the lowest f among its children in memory and
+        its evicted children, and is re-propagated while it keeps changing.
+        """
+        while node is not None:
+            child_f = min((child.f for child in node.children), default=float('inf'))
+            new_f = max(node.f, min(child_f, node.forgotten_f))
+            if new_f == node.f:
+                break
+            node.f = new_f
+            if node.in_open:
+                push_open(node)
+            node = node.parent
+
+    @staticmethod
+    def _estimate_node_bytes(node: _Node) -> int:
+        """
+        Estimate memory per tree node: the node, its board, its share of the
+        children list, and its two heap entries.
+        """
+        entry = (node.f, -node.g, 0, node)
+        return (
+            sys.getsizeof(node)
+            + sys.getsizeof(node.state) + sys.getsizeof(node.state.state)
+            + sys.getsizeof(node.children)
+            + 2 * (sys.getsizeof(entry) + 8)
+        )
@@ -0,0 +1,116 @@
+"""
+Opt-in memory measurement of solves.
+
+Solvers always report cheap memory counters in SearchStatistics (peak
+frontier and visited-table sizes, estimated bytes per node). Measuring
+actual allocations is expensive, so it is done here instead, by wrapping a
+solver: MemoryProfiler traces every allocation with tracemalloc during
+solve() and records the peak, and can compare snapshots taken before and
+after to show what a solve leaves allocated.
+
+Process resident set size (RSS) is read from /proc where available, which
+is also how the parallel engine samples its worker processes.
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+from typing import List, Optional, Tuple
+
+from .puzzle_state import PuzzleState
+from .branch_and_bound import SearchStatistics
+
+
+def current_rss() -> int:
+    """
+    Resident set size of this process.
+
+    Returns:
+        Bytes currently resident, or the peak RSS where /proc is unavailable
+    """
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return peak_rss()
+
+
+def peak_rss() -> int:
+    """
+    Peak resident set size of this process since it started.
+
+    Returns:
+        Bytes, or 0 where the resource module is unavailable
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemoryProfiler:
+    """Solver wrapper that measures the memory allocated by each solve."""
+
+    def __init__(self, solver, snapshots: bool = False, top: int = 10):
+        """
+        Wrap a solver.
+
+        Args:
+            solver: Object with solve(initial_state) -> (path, SearchStatistics)
+            snapshots: Also compare tracemalloc snapshots taken before and
+                       after each solve (slower; see self.retained)
+            top: Number of source lines kept in self.retained
+        """
+        self.solver = solver
+        self.snapshots = snapshots
+        self.top = top
+        self.heuristic = getattr(solver, "heuristic", None)
+        self.statistics = None
+
+        # Largest allocations still alive after the last solve, by source line
+        self.retained: List[tracemalloc.StatisticDiff] = []
+
+    def solve(self, initial_state: PuzzleState) -> Tuple[Optional[List[PuzzleState]], SearchStatistics]:
+        """
+        Solve under tracemalloc.
+
+        Fills stats.peak_memory with the peak bytes allocated during the
+        solve (above what was allocated before it) and stats.peak_rss with
+        the process's peak RSS. Tracing slows the solve down severalfold,
+        so execution_time is not comparable with unprofiled runs.
+
+        Args:
+            initial_state: Starting puzzle state
+
+        Returns:
+            Tuple of (solution_path, statistics) from the wrapped solver
+        """
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot() if self.snapshots else None
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+
+            path, stats = self.solver.solve(initial_state)
+
+            _, peak = tracemalloc.get_traced_memory()
+            if before is not None:
+                # A full collection also empties CPython's free lists, which
+                # otherwise keep thousands of the solve's tuples allocated
+                gc.collect()
+                after = tracemalloc.take_snapshot()
+                self.retained = after.compare_to(before, "lineno")[:self.top]
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        stats.peak_memory = peak - baseline
+        stats.peak_rss = max(stats.peak_rss, peak_rss())
+        self.statistics = stats
+        return path, stats
@@ -0,0 +1,196 @@
+"""
+Compact move-sequence encoding of solutions.
+
+A solution is stored as its start state (PuzzleState.pack() key) and the
+moves of the blank, U/D/L/R, packed 2 bits per move into one integer, so a
+31-move 8-puzzle solution fits in 18 serialized bytes instead of a list
+of 32 boards. Boards are rebuilt only when they are asked for.
+
+U, D, L and R name the direction the blank moves in.
+"""
+
+import struct
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from .puzzle_state import PuzzleState
+
+
+MOVES = "UDLR"
+
+# Change of the blank position for each move code
+_DELTAS = (-3, 3, -1, 1)
+
+# Serialized header: start key, number of moves
+_HEADER = struct.Struct("<QH")
+
+
+def _is_legal(pos: int, code: int) -> bool:
+    if code == 0:
+        return pos >= 3
+    if code == 1:
+        return pos < 6
+    if code == 2:
+        return pos % 3 > 0
+    return pos % 3 < 2
+
+
+class MoveSequence:
+    """Solution as a start state plus a packed sequence of blank moves."""
+
+    __slots__ = ('start', 'length', 'bits')
+
+    def __init__(self, start: int, length: int = 0, bits: int = 0):
+        """
+        Initialize from packed parts; use from_path() or from_moves() instead
+        when building from a solver result.
+
+        Args:
+            start: Packed key of the start state (PuzzleState.pack())
+            length: Number of moves
+            bits: Move i in bits 2*i .. 2*i+1, as an index into MOVES
+        """
+        self.start = start
+        self.length = length
+        self.bits = bits
+
+    @classmethod
+    def from_moves(cls, start: PuzzleState, moves: str) -> 'MoveSequence':
+        """
+        Build from a start state and a move string such as "ULDR".
+
+        Raises:
+            ValueError: If the string contains a character other than U/D/L/R
+        """
+        bits = 0
+        for i, move in enumerate(moves):
+            code = MOVES.find(move)
+            if code < 0:
+                raise ValueError(f"Invalid move: {move!r}")
+            bits |= code << (2 * i)
+        return cls(start.pack(), len(moves), bits)
+
+    @classmethod
+    def from_path(cls, path: Sequence[PuzzleState]) -> 'MoveSequence':
+        """
+        Encode a solution path returned by a solver.
+
+        Args:
+            path: States from start to goal
+
+        Raises:
+            ValueError: If consecutive states are not one move apart
+        """
+        if not path:
+            raise ValueError("Cannot encode an empty path")
+        bits = 0
+        for i in range(len(path) - 1):
+            pos = path[i].empty_pos
+            target = path[i + 1].empty_pos
+            code = _DELTAS.index(target - pos) if target - pos in _DELTAS else -1
+            tiles = list(path[i].state)
+            tiles[pos], tiles[target] = tiles[target], 0
+            if code < 0 or not _is_legal(pos, code) or tuple(tiles) != path[i + 1].state:
+                raise ValueError(f"States {i} and {i + 1} are not one move apart")
+            bits |= code << (2 * i)
+        return cls(path[0].pack(), len(path) - 1, bits)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[str]:
+        bits = self.bits
+        for _ in range(self.length):
+            yield MOVES[bits & 3]
+            bits >>= 2
+
+    def __str__(self) -> str:
+        return "".join(self)
+
+    def __repr__(self) -> str:
+        return f"MoveSequence({PuzzleState.unpack(self.start).state}, {str(self)!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, MoveSequence):
+            return NotImplemented
+        return (self.start, self.length, self.bits) == (other.start, other.length, other.bits)
+
+    def __hash__(self):
+        return hash((self.start, self.length, self.bits))
+
+    def states(self) -> Iterator[PuzzleState]:
+        """
+        Replay the moves, yielding each state from start to end.
+
+        Assumes the sequence is legal (see validate()).
+        """
+        state = PuzzleState.unpack(self.start)
+        tiles = list(state.state)
+        pos = state.empty_pos
+        yield state
+        bits = self.bits
+        for _ in range(self.length):
+            target = pos + _DELTAS[bits & 3]
+            tiles[pos], tiles[target] = tiles[target], 0
+            pos = target
+            bits >>= 2
+            yield PuzzleState._from_known(tuple(tiles), pos)
+
+    def to_path(self) -> List[PuzzleState]:
+        """Expand into the list of states a solver returns."""
+        return list(self.states())
+
+    def validate(self, goal: Optional[PuzzleState] = None) -> bool:
+        """
+        Check that every move is legal and that the moves end at the goal.
+
+        Args:
+            goal: Expected final state (default: the standard goal)
+
+        Returns:
+            True if the sequence is a valid solution
+        """
+        goal_tiles = goal.state if goal is not None else PuzzleState.GOAL_STATE
+        tiles = [(self.start >> (4 * i)) & 0xF for i in range(9)]
+        if sorted(tiles) != list(range(9)):
+            return False
+        pos = tiles.index(0)
+        bits = self.bits
+        for _ in range(self.length):
+            code = bits & 3
+            if not _is_legal(pos, code):
+                return False
+            target = pos + _DELTAS[code]
+            tiles[pos], tiles[target] = tiles[target], 0
+            pos = target
+            bits >>= 2
+        return tuple(tiles) == goal_tiles
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize as start key, move count and 4 moves per byte.
+
+        Returns:
+            Serialized bytes (10 + ceil(length / 4) bytes)
+        """
+        return _HEADER.pack(self.start, self.length) + self.bits.to_bytes((self.length + 3) // 4, "little")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'MoveSequence':
+        """Deserialize bytes produced by to_bytes()."""
+        start, length = _HEADER.unpack_from(data)
+        payload = data[_HEADER.size:_HEADER.size + (length + 3) // 4]
+        return cls(start, length, int.from_bytes(payload, "little"))
+
+    def to_dict(self) -> Dict:
+        """
+        Convert to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with the start board and the move string
+        """
+        return {"start": list(PuzzleState.unpack(self.start).state), "moves": str(self)}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'MoveSequence':
+        """Build from a dictionary produced by to_dict()."""
+        return cls.from_moves(PuzzleState(tuple(data["start"])), data["moves"])
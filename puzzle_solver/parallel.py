@@ -0,0 +1,202 @@
+"""
+Parallel IDA* across processes.
+
+The search tree is split breadth-first at a shallow depth into many
+subtrees. Each IDA* iteration hands the subtrees to a process pool one at a
+time, so idle workers keep pulling the next unexplored subtree from the
+shared task queue (dynamic load balancing in place of per-worker deques).
+Workers share the incumbent solution cost through shared memory and stop
+as soon as any worker has found a solution within the current threshold.
+
+Within an iteration with threshold T every solution found costs exactly T
+(the previous iteration proved there is none cheaper), so the first
+solution found is optimal and matches the serial solver's cost.
+"""
+
+import os
+import time
+import multiprocessing
+from typing import List, Optional, Tuple
+
+from .puzzle_state import PuzzleState
+from .heuristics import Heuristic
+from .branch_and_bound import SearchStatistics
+from .ida_star import bounded_dfs, IDAStarSolver
+from .memory_profile import current_rss
+
+
+# Per-solve worker settings, set in each worker by _init_worker: the shared
+# incumbent cost, and the heuristic, state class and RSS sampling that are
+# the same for every task, so tasks carry only a path and a threshold
+_incumbent = None
+_heuristic = None
+_state_class = None
+_sample_rss = False
+
+_NO_SOLUTION = 2 ** 31 - 1
+
+
+def _init_worker(incumbent, heuristic, state_class, sample_rss):
+    global _incumbent, _heuristic, _state_class, _sample_rss
+    _incumbent = incumbent
+    _heuristic = heuristic
+    _state_class = state_class
+    _sample_rss = sample_rss
+
+
+def _search_subtree(task) -> Tuple:
+    """
+    Worker entry point: bounded DFS below one subtree root.
+
+    Args:
+        task: Tuple of (path as state tuples, threshold)
+
+    Returns:
+        Tuple of (solution path as state tuples or None, next threshold,
+        nodes expanded, lower bound sum, peak frontier, peak path length,
+        worker RSS in bytes or 0, worker pid)
+    """
+    path_tiles, threshold = task
+    if _incumbent.value <= threshold:
+        return None, float('inf'), 0, 0, 0, 0, 0, os.getpid()
+
+    path = [_state_class(tiles) for tiles in path_tiles]
+    result = bounded_dfs(
+        path, len(path) - 1, threshold, _heuristic,
+        should_stop=lambda: _incumbent.value <= threshold
+    )
+    solution = None
+    if result.path is not None:
+        _incumbent.value = min(_incumbent.value, len(result.path) - 1)
+        solution = [state.state for state in result.path]
+    rss = current_rss() if _sample_rss else 0
+    return (solution, result.next_threshold, result.nodes_expanded, result.lower_bound_sum,
+            result.peak_frontier, result.peak_path, rss, os.getpid())
+
+
+class ParallelIDAStarSolver:
+    """IDA* solver that searches subtrees in parallel worker processes."""
+
+    def __init__(self, heuristic: Heuristic, workers: Optional[int] = None, tasks_per_worker: int = 8,
+                 sample_rss: bool = False):
+        """
+        Initialize solver.
+
+        Args:
+            heuristic: Heuristic function to use for search
+            workers: Number of worker processes (default: CPU count)
+            tasks_per_worker: The tree is split until there are at least
+                              this many subtrees per worker
+            sample_rss: Sample each worker's resident set size after every
+                        subtree search (see self.rss_per_worker)
+        """
+        self.heuristic = heuristic
+        self.workers = workers or os.cpu_count() or 1
+        self.tasks_per_worker = tasks_per_worker
+        self.sample_rss = sample_rss
+        self.statistics = None
+        self.nodes_per_worker = {}
+        self.rss_per_worker = {}
+
+    def _split(self, initial_state: PuzzleState) -> Tuple[List[List[PuzzleState]], Optional[List[PuzzleState]]]:
+        """
+        Expand the tree breadth-first until there are enough subtrees.
+
+        Returns:
+            Tuple of (subtree root paths, solution path if the goal lies
+            within the split depth)
+        """
+        frontier = [[initial_state]]
+        min_tasks = self.workers * self.tasks_per_worker
+        while len(frontier) < min_tasks:
+            next_frontier = []
+            for path in frontier:
+                for neighbor in path[-1].get_neighbors():
+                    if len(path) >= 2 and neighbor == path[-2]:
+                        continue
+                    new_path = path + [neighbor]
+                    if neighbor.is_goal():
+                        # Breadth-first order: the first goal is the shallowest
+                        return [], new_path
+                    next_frontier.append(new_path)
+            frontier = next_frontier
+        return frontier, None
+
+    def solve(self, initial_state: PuzzleState) -> Tuple[Optional[List[PuzzleState]], SearchStatistics]:
+        """
+        Solve the puzzle with parallel IDA*.
+
+        Per-worker expansion counts of the solve are kept in
+        self.nodes_per_worker and, with sample_rss, the largest RSS sampled
+        in each worker in self.rss_per_worker (both keyed by worker process
+        id); stats.peak_rss is the largest sample over all processes.
+
+        Args:
+            initial_state: Starting puzzle state
+
+        Returns:
+            Tuple of (solution_path, statistics)
+        """
+        start_time = time.time()
+
+        stats = SearchStatistics(
+            heuristic_name=self.heuristic.get_name(),
+            solution_found=False,
+            solution_length=0,
+            nodes_expanded=0,
+            optimal_cost=0,
+            execution_time=0,
+            lower_bound_sum=0,
+            lower_bound_count=0
+        )
+        self.nodes_per_worker = {}
+        self.rss_per_worker = {}
+
+        if not initial_state.is_solvable():
+            stats.execution_time = time.time() - start_time
+            return None, stats
+
+        path = [initial_state] if initial_state.is_goal() else None
+        subtrees = []
+        if path is None:
+            subtrees, path = self._split(initial_state)
+
+        if path is None:
+            incumbent = multiprocessing.RawValue('i', _NO_SOLUTION)
+            tasks_tiles = [[state.state for state in subtree] for subtree in subtrees]
+
+            # The heuristic is sent once per worker; the state class carries the goal (see goals.py)
+            initargs = (incumbent, self.heuristic, type(initial_state), self.sample_rss)
+            with multiprocessing.Pool(self.workers, initializer=_init_worker, initargs=initargs) as pool:
+                threshold = self.heuristic.compute(initial_state)
+                while path is None and threshold != float('inf'):
+                    tasks = [(tiles, threshold) for tiles in tasks_tiles]
+                    next_threshold = float('inf')
+                    for (solution, task_next, nodes, lb_sum, peak_frontier, peak_path,
+                         rss, pid) in pool.imap_unordered(_search_subtree, tasks):
+                        stats.nodes_expanded += nodes
+                        stats.lower_bound_sum += lb_sum
+                        stats.lower_bound_count += nodes
+                        stats.peak_frontier = max(stats.peak_frontier, peak_frontier)
+                        stats.peak_closed = max(stats.peak_closed, peak_path)
+                        self.nodes_per_worker[pid] = self.nodes_per_worker.get(pid, 0) + nodes
+                        if rss:
+                            self.rss_per_worker[pid] = max(self.rss_per_worker.get(pid, 0), rss)
+                        next_threshold = min(next_threshold, task_next)
+                        if solution is not None and path is None:
+                            path = [type(initial_state)(tiles) for tiles in solution]
+                    threshold = next_threshold
+
+        stats.bytes_per_node = IDAStarSolver._estimate_node_bytes(initial_state)
+        if self.sample_rss:
+            stats.peak_rss = max([current_rss(), *self.rss_per_worker.values()])
+
+        if path is not None:
+            stats.solution_found = True
+            stats.solution_length = len(path) - 1
+            stats.optimal_cost = len(path) - 1
+
+        stats.execution_time = time.time() - start_time
+        self.statistics = stats
+
+        return path, stats
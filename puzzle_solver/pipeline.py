@@ -0,0 +1,276 @@
+"""
+Seeded, cached experiment pipeline.
+
+Puzzles are generated from a seed, so the same corpus is rebuilt on every
+run, and every result is recorded with its puzzle key (PuzzleState.pack()).
+Results are cached per (engine, heuristic) column, one JSON line per
+puzzle, appended as each solve finishes. A column's cache file name
+includes a fingerprint of the source of the engine and heuristic classes
+and of every helper, constant and table builder they reference, followed
+into other package modules (see dependencies.definition_sources()). Editing
+one heuristic therefore re-runs only its columns (and those of heuristics
+that call it), while editing something shared such as PuzzleState re-runs
+them all. Single puzzles or subsets can be re-run by key across any engines
+and heuristics.
+
+Run as a script:
+    python -m puzzle_solver.pipeline [num_puzzles] [seed]
+"""
+
+import os
+import re
+import sys
+import json
+import random
+import inspect
+import hashlib
+import contextlib
+import dataclasses
+import multiprocessing
+from typing import Callable, Dict, Iterable, List, Tuple
+
+sys.path.insert(0, '/home/luffy/class/DAA CLA2')
+
+from puzzle_solver.puzzle_state import PuzzleState
+from puzzle_solver.generator import PuzzleGenerator
+from puzzle_solver.heuristics import Heuristic, HEURISTICS
+from puzzle_solver.branch_and_bound import BranchAndBoundSolver, PooledBranchAndBoundSolver, SearchStatistics
+from puzzle_solver.ida_star import IDAStarSolver
+from puzzle_solver.memory_bounded import SMAStarSolver
+from puzzle_solver.dependencies import definition_sources
+
+
+DEFAULT_CACHE_DIR = '/home/luffy/class/DAA CLA2/pipeline_cache'
+
+# Engine name -> factory taking a heuristic and returning a solver
+ENGINES: Dict[str, Callable[[Heuristic], object]] = {
+    "bnb": BranchAndBoundSolver,
+    "pooled": PooledBranchAndBoundSolver,
+    "ida": IDAStarSolver,
+    "sma": SMAStarSolver,
+}
+
+
+def register_engine(name: str, factory: Callable[[Heuristic], object]):
+    """
+    Make a solver available to pipelines under `name`.
+
+    Args:
+        name: Engine name used in cache files and run() arguments
+        factory: Callable taking a heuristic and returning an object with
+                 solve(initial_state) -> (path, SearchStatistics)
+    """
+    ENGINES[name] = factory
+
+
+def _source_digest(obj) -> str:
+    """
+    Digest of the definitions obj (a class, function or instance) and its
+    base classes depend on, and of its component heuristics if any.
+    """
+    if inspect.isclass(obj):
+        owners = obj.__mro__
+    elif inspect.isfunction(obj):
+        owners = (obj,)
+    else:
+        owners = type(obj).__mro__
+    parts = []
+    for owner in owners:
+        if owner is object:
+            continue
+        module = sys.modules.get(owner.__module__)
+        spec = getattr(module, "__spec__", None)
+        sources = definition_sources(spec.name, owner.__qualname__.split(".")[0]) if spec is not None else ()
+        if sources:
+            parts.extend(sources)
+            continue
+        # Defined outside the package: only its own source is known
+        try:
+            parts.append(inspect.getsource(owner))
+        except (OSError, TypeError):
+            parts.append(owner.__qualname__)
+    for component in getattr(obj, "heuristics", None) or []:
+        parts.append(_source_digest(component))
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:12]
+
+
+def _solve_task(task: Tuple[int, str, Heuristic, Tuple[int, ...]]) -> Tuple[int, SearchStatistics]:
+    index, engine, heuristic, tiles = task
+    _, stats = ENGINES[engine](heuristic).solve(PuzzleState(tiles))
+    return index, stats
+
+
+class ExperimentPipeline:
+    """Reproducible experiment runs with per-(engine, heuristic) result caching."""
+
+    def __init__(self, num_puzzles: int = 100, seed: int = 0, cache_dir: str = DEFAULT_CACHE_DIR,
+                 engines: Iterable[str] = ("bnb",), heuristics: List[Heuristic] = None, workers: int = 0):
+        """
+        Initialize pipeline.
+
+        Args:
+            num_puzzles: Number of puzzles in the corpus
+            seed: Random seed of the corpus
+            cache_dir: Directory holding cached result columns
+            engines: Default engine names (keys of ENGINES)
+            heuristics: Default heuristics (default: HEURISTICS)
+            workers: Worker processes for solving (0: solve in this process)
+        """
+        self.num_puzzles = num_puzzles
+        self.seed = seed
+        self.cache_dir = cache_dir
+        self.engines = list(engines)
+        self.heuristics = heuristics if heuristics is not None else HEURISTICS
+        self.workers = workers
+        self._puzzles = None
+
+        # Number of solves performed by the last run() (cache misses)
+        self.last_solved = 0
+
+    def puzzles(self) -> List[PuzzleState]:
+        """
+        The seeded puzzle corpus.
+
+        Returns:
+            Puzzles generated by PuzzleGenerator from random.Random(seed)
+        """
+        if self._puzzles is None:
+            self._puzzles = PuzzleGenerator.generate_batch(self.num_puzzles, random.Random(self.seed))
+        return self._puzzles
+
+    def column_path(self, engine: str, heuristic: Heuristic) -> str:
+        """Cache file of one (engine, heuristic) column."""
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", heuristic.get_name().split(":")[0]).strip("_")
+        fingerprint = hashlib.sha256(
+            f"{_source_digest(ENGINES[engine])}:{_source_digest(heuristic)}".encode()
+        ).hexdigest()[:12]
+        return os.path.join(self.cache_dir, f"{engine}-{slug}-{fingerprint}.jsonl")
+
+    def _load_column(self, path: str) -> Dict[int, SearchStatistics]:
+        column = {}
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                for line in f:
+                    record = json.loads(line)
+                    key = record.pop("puzzle_key")
+                    # Later lines (re-runs) replace earlier ones
+                    column[key] = SearchStatistics(**record)
+        return column
+
+    def run(self, engines: Iterable[str] = None, heuristics: List[Heuristic] = None,
+            puzzle_keys: Iterable[int] = None, force: bool = False) -> Dict[Tuple[str, str], Dict[int, SearchStatistics]]:
+        """
+        Solve every (engine, heuristic, puzzle) combination not yet cached.
+
+        Args:
+            engines: Engine names (default: the pipeline's engines)
+            heuristics: Heuristics (default: the pipeline's heuristics)
+            puzzle_keys: Packed keys of the puzzles to run (default: the
+                         seeded corpus); any solvable key may be given
+            force: Re-run and overwrite cached results for these puzzles
+
+        Returns:
+            Mapping of (engine, heuristic name) to {puzzle key: statistics}
+            for the requested puzzles
+        """
+        engines = list(engines) if engines is not None else self.engines
+        heuristics = heuristics if heuristics is not None else self.heuristics
+        if puzzle_keys is None:
+            puzzle_keys = [puzzle.pack() for puzzle in self.puzzles()]
+        puzzle_keys = list(puzzle_keys)
+        for engine in engines:
+            if engine not in ENGINES:
+                raise ValueError(f"Unknown engine: {engine}. Available: {', '.join(ENGINES)}")
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        columns = {}
+        tasks = []
+        for engine in engines:
+            for heuristic in heuristics:
+                path = self.column_path(engine, heuristic)
+                column = self._load_column(path)
+                columns[(engine, heuristic.get_name())] = column
+                for key in puzzle_keys:
+                    if force or key not in column:
+                        tasks.append((engine, heuristic, path, key))
+
+        payload = ((index, engine, heuristic, PuzzleState.unpack(key).state)
+                   for index, (engine, heuristic, _, key) in enumerate(tasks))
+        parallel = self.workers > 0 and len(tasks) > 1
+        with multiprocessing.Pool(self.workers) if parallel else contextlib.nullcontext() as pool:
+            solved = pool.imap_unordered(_solve_task, payload) if parallel else map(_solve_task, payload)
+            # Record each result as it arrives, so an interrupted run keeps
+            # everything solved so far
+            for index, stats in solved:
+                engine, heuristic, path, key = tasks[index]
+                columns[(engine, heuristic.get_name())][key] = stats
+                with open(path, 'a') as f:
+                    f.write(json.dumps({"puzzle_key": key, **dataclasses.asdict(stats)}) + "\n")
+        self.last_solved = len(tasks)
+
+        return {
+            name: {key: column[key] for key in puzzle_keys}
+            for name, column in columns.items()
+        }
+
+    def rerun(self, puzzle_key: int, engines: Iterable[str] = None,
+              heuristics: List[Heuristic] = None) -> Dict[Tuple[str, str], SearchStatistics]:
+        """
+        Re-run a single puzzle, replacing its cached results.
+
+        Args:
+            puzzle_key: Packed key of the puzzle
+            engines: Engine names (default: the pipeline's engines)
+            heuristics: Heuristics (default: the pipeline's heuristics)
+
+        Returns:
+            Mapping of (engine, heuristic name) to the new statistics
+        """
+        results = self.run(engines, heuristics, [puzzle_key], force=True)
+        return {name: column[puzzle_key] for name, column in results.items()}
+
+    def results(self, engine: str = "bnb") -> Dict[str, List[SearchStatistics]]:
+        """
+        Results of one engine over the corpus in ExperimentRunner.results form.
+
+        Runs whatever is not cached yet. The output can be passed to
+        results_store.write_columns().
+
+        Args:
+            engine: Engine name
+
+        Returns:
+            Mapping of heuristic name to per-puzzle statistics, in corpus order
+        """
+        keys = [puzzle.pack() for puzzle in self.puzzles()]
+        columns = self.run([engine], puzzle_keys=keys)
+        return {
+            name: [column[key] for key in keys]
+            for (_, name), column in columns.items()
+        }
+
+
+def main():
+    """Run the cached pipeline and report the slowest puzzle per column."""
+    num_puzzles = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    print("8-Puzzle Experiment Pipeline")
+    print("=" * 80)
+    print(f"Puzzles: {num_puzzles}, seed: {seed}\n")
+
+    pipeline = ExperimentPipeline(num_puzzles=num_puzzles, seed=seed)
+    results = pipeline.run()
+    print(f"Solved {pipeline.last_solved} new combinations (rest cached)\n")
+
+    print(f"{'Engine':<8} {'Heuristic':<30} {'Avg Time (s)':<14} {'Slowest (s)':<12} {'Slowest puzzle key':<20}")
+    print("-" * 86)
+    for (engine, name), column in results.items():
+        times = {key: stats.execution_time for key, stats in column.items()}
+        slowest = max(times, key=times.get)
+        print(f"{engine:<8} {name:<30} {sum(times.values()) / len(times):<14.4f} "
+              f"{times[slowest]:<12.4f} {slowest:<20}")
+
+
+if __name__ == "__main__":
+    main()
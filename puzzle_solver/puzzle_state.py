@@ -2,12 +2,79 @@
 Core puzzle state and operations for the 8-puzzle problem.
 """
 
-from typing import List, Tuple, Set
-import copy
+from typing import Iterable, List, Sequence, Tuple, Set
+
+
+def inversion_parity(tiles: Sequence[int]) -> int:
+    """
+    Parity of the number of inversions among the non-blank tiles.
+    
+    Computed in O(n) by cycle decomposition: the non-blank tiles, read in
+    row-major order, form a permutation of 1..n-1 whose inversion parity
+    equals (length - number of cycles) mod 2.
+    
+    Args:
+        tiles: Board in row-major order, 0 for the blank
+    
+    Returns:
+        0 if the inversion count is even, 1 if odd
+    """
+    perm = [t - 1 for t in tiles if t != 0]
+    n = len(perm)
+    visited = [False] * n
+    cycles = 0
+    for i in range(n):
+        if not visited[i]:
+            cycles += 1
+            j = i
+            while not visited[j]:
+                visited[j] = True
+                j = perm[j]
+    return (n - cycles) & 1
+
+
+def is_solvable_tiles(tiles: Sequence[int], width: int = 3) -> bool:
+    """
+    Check whether an N x N board can reach the goal (blank first, tiles ascending).
+    
+    Moving the blank horizontally never changes the inversion count; moving
+    it vertically jumps one tile over width-1 others. For odd widths the
+    inversion parity is therefore invariant; for even widths each vertical
+    move flips it and also changes the blank's row, so inversion parity plus
+    blank row is invariant. The goal has no inversions and its blank in row 0.
+    
+    Args:
+        tiles: Board in row-major order, 0 for the blank
+        width: Board width N
+    
+    Returns:
+        True if solvable, False otherwise
+    """
+    parity = inversion_parity(tiles)
+    if width % 2 == 0:
+        parity ^= (list(tiles).index(0) // width) & 1
+    return parity == 0
+
+
+# Cached hashes are cut to 30 bits so CPython stores them in a one-digit
+# int (28 bytes instead of 36); equal boards still hash equal, and dicts
+# and sets pick slots from the low bits, which no table of boards exhausts
+_HASH_MASK = (1 << 30) - 1
 
 
 class PuzzleState:
-    """Represents an 8-puzzle state with a 3x3 grid."""
+    """
+    Represents an 8-puzzle state with a 3x3 grid.
+    
+    States are immutable. They use __slots__ instead of a per-instance
+    __dict__ and compute their hash once, since the solver stores hundreds
+    of thousands of them in sets.
+    
+    Subclasses may override GOAL_STATE to make is_goal() test for another
+    board (see goals.py); neighbors and unpickled copies keep the subclass.
+    """
+    
+    __slots__ = ('state', 'empty_pos', '_hash')
     
     GOAL_STATE = (0, 1, 2, 3, 4, 5, 6, 7, 8)
     
@@ -19,21 +86,47 @@ class PuzzleState:
             state: tuple of 9 integers (0-8), where 0 represents the empty space
                    If None, initializes to GOAL_STATE
         """
-        if state is None:
-            self.state = self.GOAL_STATE
-        else:
-            self.state = tuple(state)
+        state = self.GOAL_STATE if state is None else tuple(state)
+        _set_state(self, state)
         
         # Find position of empty space (0)
-        self.empty_pos = self.state.index(0)
+        _set_empty_pos(self, state.index(0))
+        _set_hash(self, hash(state) & _HASH_MASK)
+    
+    @classmethod
+    def _from_known(cls, state: Tuple[int, ...], empty_pos: int) -> 'PuzzleState':
+        """
+        Build a state whose blank position is known.
+        Skips the validation and index(0) scan done by __init__.
+        
+        Args:
+            state: Tuple of tiles
+            empty_pos: Index of 0 in state
+        """
+        obj = _new(cls)
+        _set_state(obj, state)
+        _set_empty_pos(obj, empty_pos)
+        _set_hash(obj, hash(state) & _HASH_MASK)
+        return obj
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"PuzzleState is immutable (cannot set {name!r})")
+    
+    def __reduce__(self):
+        """Pickle by tiles, since __setattr__ is disabled."""
+        return (type(self), (self.state,))
     
     def __hash__(self):
         """Make state hashable for use in sets and dicts."""
-        return hash(self.state)
+        return self._hash
     
     def __eq__(self, other):
         """Check equality of two states."""
-        return self.state == other.state if isinstance(other, PuzzleState) else False
+        if self is other:
+            return True
+        if not isinstance(other, PuzzleState):
+            return False
+        return self._hash == other._hash and self.state == other.state
     
     def __repr__(self):
         """String representation of the puzzle."""
@@ -76,10 +169,37 @@ class PuzzleState:
             new_state = list(self.state)
             # Swap empty with neighbor
             new_state[empty], new_state[move_pos] = new_state[move_pos], new_state[empty]
-            neighbors.append(PuzzleState(tuple(new_state)))
+            neighbors.append(self._from_known(tuple(new_state), move_pos))
         
         return neighbors
     
+    def pack(self) -> int:
+        """
+        Pack the state into a single integer, 4 bits per tile.
+        Position i occupies bits 4*i .. 4*i+3, so keys fit in 36 bits and
+        can be stored in fixed-width integer columns.
+        
+        Returns:
+            Packed integer key of the state
+        """
+        key = 0
+        for i, tile in enumerate(self.state):
+            key |= tile << (4 * i)
+        return key
+    
+    @staticmethod
+    def unpack(key: int) -> 'PuzzleState':
+        """
+        Rebuild a state from a key produced by pack().
+        
+        Args:
+            key: Packed integer key
+        
+        Returns:
+            Corresponding PuzzleState
+        """
+        return PuzzleState(tuple((key >> (4 * i)) & 0xF for i in range(9)))
+    
     def get_inverse_count(self) -> int:
         """
         Count the number of inversions in the puzzle.
@@ -99,6 +219,18 @@ class PuzzleState:
         
         return inversions
     
+    def inversion_parity(self) -> int:
+        """
+        Parity of the inversion count, computed on demand in O(n).
+        
+        Moves never change it on the 3x3 board (see is_solvable_tiles()),
+        so it is not stored per state.
+        
+        Returns:
+            0 if the number of inversions is even, 1 if odd
+        """
+        return inversion_parity(self.state)
+    
     def is_solvable(self) -> bool:
         """
         Check if the puzzle is solvable.
@@ -107,7 +239,33 @@ class PuzzleState:
         Returns:
             True if solvable, False otherwise
         """
-        return self.get_inverse_count() % 2 == 0
+        return self.inversion_parity() == 0
+    
+    @staticmethod
+    def validate_many(boards: Iterable[Sequence[int]], width: int = 3) -> List[bool]:
+        """
+        Validate a batch of external boards.
+        
+        A board is valid if it is a permutation of 0..N*N-1 and solvable.
+        Each check is O(N*N).
+        
+        Args:
+            boards: Boards in row-major order
+            width: Board width N
+        
+        Returns:
+            List with True for each valid, solvable board
+        """
+        size = width * width
+        expected = set(range(size))
+        valid = []
+        for tiles in boards:
+            tiles = tuple(tiles)
+            valid.append(
+                len(tiles) == size and set(tiles) == expected
+                and is_solvable_tiles(tiles, width)
+            )
+        return valid
     
     @staticmethod
     def format_solution(path: List['PuzzleState']) -> str:
@@ -120,7 +278,11 @@ class PuzzleState:
         Returns:
             Formatted string representation of the solution
         """
-        result = ""
-        for i, state in enumerate(path):
-            result += f"Step {i}:\n{state}\n"
-        return result
+        return "".join(f"Step {i}:\n{state}\n" for i, state in enumerate(path))
+
+
+# Slot setters that bypass the immutability guard in __setattr__
+_new = object.__new__
+_set_state = PuzzleState.state.__set__
+_set_empty_pos = PuzzleState.empty_pos.__set__
+_set_hash = PuzzleState._hash.__set__
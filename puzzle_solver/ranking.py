@@ -0,0 +1,345 @@
+"""
+Bijections between 8-puzzle boards and dense integers.
+
+Dense indices let per-state data live in flat arrays instead of
+dictionaries: visited bitmaps, exact distance tables, pattern databases
+and compact result keys.
+
+Two rankings are provided:
+    rank / unrank                    every permutation, [0, 9!)
+    rank_solvable / unrank_solvable  solvable boards only, [0, 9!/2)
+
+rank() is the lexicographic (Lehmer code) rank of the board read in
+row-major order. Each digit counts the unused tiles below the current one,
+which is a lookup in a popcount table of the 9-bit set of unused tiles, so
+ranking is linear in the board size; unranking selects the k-th unused
+tile from a similar table.
+
+rank_solvable() uses the blank position and the order of tiles 1-8:
+    blank_position * 8!/2 + (Lehmer rank of tiles 1-8) // 2
+A board is solvable exactly when tiles 1-8 form an even permutation, and in
+lexicographic order each even permutation is paired with the odd one that
+differs in its last two elements, so dropping the last two Lehmer digits
+numbers the even permutations densely. The last two tiles are recovered on
+unranking from the parity of the other digits. Boards with an odd
+permutation share the index of their solvable partner, so rank_solvable()
+must only be given solvable boards; rank_solvable_checked() computes every
+digit instead and rejects them.
+
+Boards can be passed as tile sequences or as PuzzleState.pack() keys, and
+the *_batch functions rank or unrank NumPy arrays of many boards at once.
+"""
+
+from typing import Sequence, Tuple
+
+
+NUM_PERMUTATIONS = 362880
+NUM_SOLVABLE_STATES = 181440
+
+# Orders of tiles 1-8 per blank position in the solvable ranking
+_HALF_PERMUTATIONS = 20160
+
+_FULL_MASK = (1 << 9) - 1
+
+# _POPCOUNT[mask]: number of tiles in a 9-bit tile set
+_POPCOUNT = bytes(bin(mask).count("1") for mask in range(1 << 9))
+
+# _BELOW[tile]: set of the tiles smaller than `tile`
+_BELOW = tuple((1 << tile) - 1 for tile in range(9))
+
+# _SELECT[mask * 9 + k]: k-th smallest tile of a tile set
+_SELECT = bytearray(9 << 9)
+for _mask in range(1 << 9):
+    for _k, _tile in enumerate(t for t in range(9) if _mask >> t & 1):
+        _SELECT[_mask * 9 + _k] = _tile
+_SELECT = bytes(_SELECT)
+del _mask, _k, _tile
+
+
+def rank(tiles: Sequence[int]) -> int:
+    """
+    Rank a board among all 9! permutations, in lexicographic order.
+
+    Args:
+        tiles: Board in row-major order, 0 for the blank
+
+    Returns:
+        Index in [0, 9!)
+    """
+    index = 0
+    unused = _FULL_MASK
+    radix = 9
+    for tile in tiles:
+        index = index * radix + _POPCOUNT[unused & _BELOW[tile]]
+        unused ^= 1 << tile
+        radix -= 1
+    return index
+
+
+def unrank(index: int) -> Tuple[int, ...]:
+    """
+    Inverse of rank().
+
+    Args:
+        index: Index in [0, 9!)
+
+    Returns:
+        Board as a tuple of 9 tiles
+    """
+    digits = [0] * 9
+    for position in range(8, -1, -1):
+        index, digits[position] = divmod(index, 9 - position)
+    tiles = []
+    unused = _FULL_MASK
+    for digit in digits:
+        tile = _SELECT[unused * 9 + digit]
+        unused ^= 1 << tile
+        tiles.append(tile)
+    return tuple(tiles)
+
+
+def rank_solvable(tiles: Sequence[int]) -> int:
+    """
+    Rank a solvable board among the 9!/2 solvable boards.
+
+    Args:
+        tiles: Solvable board in row-major order, 0 for the blank
+
+    Returns:
+        Index in [0, 9!/2)
+    """
+    index = 0
+    unused = _FULL_MASK ^ 1
+    radix = 8
+    blank = 0
+    position = 0
+    for tile in tiles:
+        if tile == 0:
+            blank = position
+        elif radix > 2:
+            # The last two digits are implied by the parity
+            index = index * radix + _POPCOUNT[unused & _BELOW[tile]]
+            unused ^= 1 << tile
+            radix -= 1
+        position += 1
+    return blank * _HALF_PERMUTATIONS + index
+
+
+def rank_solvable_checked(tiles: Sequence[int]) -> int:
+    """
+    rank_solvable() of a board that may be unsolvable.
+
+    The parity of the full Lehmer digit sum is the board's inversion
+    parity, so checking it costs only the last two digits.
+
+    Args:
+        tiles: Board in row-major order, 0 for the blank
+
+    Returns:
+        Index in [0, 9!/2)
+
+    Raises:
+        ValueError: If the board is unsolvable
+    """
+    index = 0
+    unused = _FULL_MASK ^ 1
+    radix = 8
+    blank = 0
+    position = 0
+    digit_sum = 0
+    for tile in tiles:
+        if tile == 0:
+            blank = position
+        else:
+            digit = _POPCOUNT[unused & _BELOW[tile]]
+            digit_sum += digit
+            if radix > 2:
+                index = index * radix + digit
+            unused ^= 1 << tile
+            radix -= 1
+        position += 1
+    if digit_sum & 1:
+        raise ValueError(f"Board {tuple(tiles)} is unsolvable")
+    return blank * _HALF_PERMUTATIONS + index
+
+
+def unrank_solvable(index: int) -> Tuple[int, ...]:
+    """
+    Inverse of rank_solvable().
+
+    Args:
+        index: Index in [0, 9!/2)
+
+    Returns:
+        Board as a tuple of 9 tiles
+    """
+    blank, index = divmod(index, _HALF_PERMUTATIONS)
+    digits = [0] * 6
+    for position in range(5, -1, -1):
+        index, digits[position] = divmod(index, 8 - position)
+    tiles = []
+    # The blank stays in the set, so the k-th unused tile 1-8 is its (k+1)-th smallest
+    unused = _FULL_MASK
+    for digit in digits:
+        tile = _SELECT[unused * 9 + digit + 1]
+        unused ^= 1 << tile
+        tiles.append(tile)
+
+    # The digit sum is the inversion count; the last two tiles make it even
+    low = _SELECT[unused * 9 + 1]
+    high = _SELECT[unused * 9 + 2]
+    if sum(digits) & 1:
+        tiles += (high, low)
+    else:
+        tiles += (low, high)
+    tiles.insert(blank, 0)
+    return tuple(tiles)
+
+
+def rank_packed(key: int) -> int:
+    """rank() of a board given as a PuzzleState.pack() key."""
+    return rank([(key >> shift) & 0xF for shift in range(0, 36, 4)])
+
+
+def unrank_packed(index: int) -> int:
+    """unrank() returning a PuzzleState.pack() key."""
+    key = 0
+    for shift, tile in zip(range(0, 36, 4), unrank(index)):
+        key |= tile << shift
+    return key
+
+
+def rank_solvable_packed(key: int) -> int:
+    """rank_solvable() of a board given as a PuzzleState.pack() key."""
+    return rank_solvable([(key >> shift) & 0xF for shift in range(0, 36, 4)])
+
+
+def unrank_solvable_packed(index: int) -> int:
+    """unrank_solvable() returning a PuzzleState.pack() key."""
+    key = 0
+    for shift, tile in zip(range(0, 36, 4), unrank_solvable(index)):
+        key |= tile << shift
+    return key
+
+
+def _tables():
+    """_POPCOUNT, _BELOW and _SELECT as NumPy arrays."""
+    import numpy as np
+
+    popcount = np.frombuffer(_POPCOUNT, dtype=np.uint8).astype(np.int64)
+    below = np.array(_BELOW, dtype=np.int64)
+    select = np.frombuffer(_SELECT, dtype=np.uint8).reshape(1 << 9, 9)
+    return popcount, below, select
+
+
+def rank_batch(tiles):
+    """
+    rank() of many boards.
+
+    Args:
+        tiles: (N, 9) integer array of boards
+
+    Returns:
+        (N,) int64 array of indices
+    """
+    import numpy as np
+
+    popcount, below, _ = _tables()
+    tiles = np.asarray(tiles, dtype=np.int64)
+    index = np.zeros(len(tiles), dtype=np.int64)
+    unused = np.full(len(tiles), _FULL_MASK, dtype=np.int64)
+    for position in range(9):
+        column = tiles[:, position]
+        index = index * (9 - position) + popcount[unused & below[column]]
+        unused ^= 1 << column
+    return index
+
+
+def unrank_batch(indices):
+    """
+    unrank() of many indices.
+
+    Args:
+        indices: (N,) integer array of indices in [0, 9!)
+
+    Returns:
+        (N, 9) uint8 array of boards
+    """
+    import numpy as np
+
+    _, _, select = _tables()
+    index = np.array(indices, dtype=np.int64)
+    digits = np.empty((len(index), 9), dtype=np.int64)
+    for position in range(8, -1, -1):
+        digits[:, position] = index % (9 - position)
+        index //= 9 - position
+    tiles = np.empty((len(index), 9), dtype=np.uint8)
+    unused = np.full(len(index), _FULL_MASK, dtype=np.int64)
+    for position in range(9):
+        tiles[:, position] = select[unused, digits[:, position]]
+        unused ^= 1 << tiles[:, position].astype(np.int64)
+    return tiles
+
+
+def rank_solvable_batch(tiles):
+    """
+    rank_solvable() of many solvable boards.
+
+    Args:
+        tiles: (N, 9) integer array of solvable boards
+
+    Returns:
+        (N,) int64 array of indices
+    """
+    import numpy as np
+
+    popcount, below, _ = _tables()
+    tiles = np.asarray(tiles, dtype=np.int64)
+    blank = np.argmin(tiles, axis=1)
+    # Tiles 1-8 in reading order: drop the blank from each row
+    others = tiles[tiles != 0].reshape(len(tiles), 8)
+    index = np.zeros(len(tiles), dtype=np.int64)
+    unused = np.full(len(tiles), _FULL_MASK ^ 1, dtype=np.int64)
+    for position in range(6):
+        column = others[:, position]
+        index = index * (8 - position) + popcount[unused & below[column]]
+        unused ^= 1 << column
+    return blank * _HALF_PERMUTATIONS + index
+
+
+def unrank_solvable_batch(indices):
+    """
+    unrank_solvable() of many indices.
+
+    Args:
+        indices: (N,) integer array of indices in [0, 9!/2)
+
+    Returns:
+        (N, 9) uint8 array of boards
+    """
+    import numpy as np
+
+    _, _, select = _tables()
+    blank, index = np.divmod(np.array(indices, dtype=np.int64), _HALF_PERMUTATIONS)
+    count = len(index)
+    digits = np.empty((count, 6), dtype=np.int64)
+    for position in range(5, -1, -1):
+        digits[:, position] = index % (8 - position)
+        index //= 8 - position
+
+    others = np.empty((count, 8), dtype=np.uint8)
+    unused = np.full(count, _FULL_MASK, dtype=np.int64)
+    for position in range(6):
+        others[:, position] = select[unused, digits[:, position] + 1]
+        unused ^= 1 << others[:, position].astype(np.int64)
+    odd = (digits.sum(axis=1) & 1).astype(bool)
+    low, high = select[unused, 1], select[unused, 2]
+    others[:, 6] = np.where(odd, high, low)
+    others[:, 7] = np.where(odd, low, high)
+
+    # Insert the blank: tiles before it keep their column, later ones shift right
+    columns = np.arange(9)
+    source = columns - (columns > blank[:, None])
+    tiles = np.take_along_axis(others, np.minimum(source, 7), axis=1)
+    tiles[columns == blank[:, None]] = 0
+    return tiles
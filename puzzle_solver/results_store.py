@@ -0,0 +1,296 @@
+"""
+Compact columnar storage for experiment results.
+
+Results are stored one column per SearchStatistics field plus a puzzle key
+column, so large corpora can be memory-mapped and aggregated with
+vectorized NumPy operations instead of parsing pretty-printed JSON.
+
+File layout (little-endian):
+    b"PZRS" magic, uint32 header length, JSON header,
+    then each column as a contiguous block aligned to 8 bytes.
+
+Column offsets in the header are relative to the first 8-byte boundary
+after the header.
+
+The header records the row count, the heuristic names (the heuristic
+column stores indices into this list) and the dtype and byte offset of
+every column. Writing needs only the standard library. Loading memory-maps
+the columns as NumPy arrays when NumPy is installed, and otherwise reads
+them into array.array objects, with the derived columns as plain lists.
+"""
+
+import sys
+import json
+import struct
+import dataclasses
+import importlib.util
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from .branch_and_bound import SearchStatistics
+
+
+MAGIC = b"PZRS"
+FORMAT_VERSION = 1
+
+# Puzzle key used when the source data did not record the puzzle
+UNKNOWN_PUZZLE_KEY = -1
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+# SearchStatistics field type -> (array typecode, NumPy dtype)
+_COLUMN_TYPES = {
+    bool: ("B", "<u1"),
+    int: ("q", "<i8"),
+    float: ("d", "<f8"),
+}
+
+
+def statistics_columns() -> List[str]:
+    """
+    Names of the SearchStatistics fields stored as numeric columns.
+
+    Returns:
+        Field names in declaration order (heuristic_name is stored separately)
+    """
+    return [f.name for f in dataclasses.fields(SearchStatistics) if f.type in _COLUMN_TYPES]
+
+
+def _field_types() -> Dict[str, type]:
+    return {f.name: f.type for f in dataclasses.fields(SearchStatistics)}
+
+
+def _column_types() -> Dict[str, Tuple[str, str]]:
+    """(array typecode, NumPy dtype) of every stored column, in file order."""
+    field_types = _field_types()
+    types = {"heuristic": ("B", "<u1"), "puzzle_key": ("q", "<i8")}
+    for name in statistics_columns():
+        types[name] = _COLUMN_TYPES[field_types[name]]
+    return types
+
+
+# NumPy dtype -> array typecode, for loading without NumPy
+_TYPECODES = {dtype: typecode for typecode, dtype in _COLUMN_TYPES.values()}
+
+
+def write_columns(filepath: str,
+                  results: Dict[str, List[SearchStatistics]],
+                  puzzle_keys: Optional[List[int]] = None):
+    """
+    Write experiment results to a columnar results file.
+
+    Args:
+        filepath: Output path
+        results: Mapping of heuristic name to per-puzzle statistics
+        puzzle_keys: Packed puzzle keys (PuzzleState.pack()), one per puzzle,
+                     in the same order as each statistics list
+    """
+    heuristics = list(results.keys())
+    names = statistics_columns()
+    types = _column_types()
+    columns = {name: array(typecode) for name, (typecode, _) in types.items()}
+
+    for code, heuristic in enumerate(heuristics):
+        for i, stats in enumerate(results[heuristic]):
+            columns["heuristic"].append(code)
+            key = puzzle_keys[i] if puzzle_keys is not None else UNKNOWN_PUZZLE_KEY
+            columns["puzzle_key"].append(key)
+            for name in names:
+                columns[name].append(getattr(stats, name))
+
+    # Column offsets are relative to the start of the data section, which
+    # begins at the first 8-byte boundary after the header
+    rows = len(columns["heuristic"])
+    header = {
+        "version": FORMAT_VERSION,
+        "rows": rows,
+        "heuristics": heuristics,
+        "columns": [],
+    }
+    offset = 0
+    for name, data in columns.items():
+        header["columns"].append({"name": name, "dtype": types[name][1], "offset": offset})
+        offset = _align(offset + data.itemsize * rows)
+    header_bytes = json.dumps(header).encode()
+    data_start = _align(len(MAGIC) + 4 + len(header_bytes))
+
+    with open(filepath, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        for column in header["columns"]:
+            data = columns[column["name"]]
+            if sys.byteorder == "big":
+                data.byteswap()
+            f.write(b"\0" * (data_start + column["offset"] - f.tell()))
+            data.tofile(f)
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _read_columns(filepath: str, header: dict, data_start: int) -> Dict[str, array]:
+    """Read every column of a columnar results file into an array.array."""
+    columns = {}
+    with open(filepath, "rb") as f:
+        for column in header["columns"]:
+            data = array(_TYPECODES[column["dtype"]])
+            f.seek(data_start + column["offset"])
+            data.fromfile(f, header["rows"])
+            if sys.byteorder == "big":
+                data.byteswap()
+            columns[column["name"]] = data
+    return columns
+
+
+class ResultsTable:
+    """Columnar view of experiment results backed by NumPy arrays (array.array without NumPy)."""
+
+    def __init__(self, heuristics: List[str], columns: Dict[str, "np.ndarray"]):
+        """
+        Initialize table from already-built columns.
+
+        Args:
+            heuristics: Heuristic names, indexed by the heuristic column
+            columns: Mapping of column name to 1-D NumPy array or array.array
+        """
+        self.heuristics = heuristics
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns["heuristic"])
+
+    def __getitem__(self, name: str):
+        return self.columns[name]
+
+    @classmethod
+    def load(cls, filepath: str) -> "ResultsTable":
+        """
+        Memory-map a columnar results file written by write_columns().
+
+        Args:
+            filepath: Path to results file
+
+        Returns:
+            ResultsTable whose columns are read-only memory maps (in-memory
+            arrays without NumPy)
+        """
+        with open(filepath, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{filepath} is not a columnar results file")
+            (header_length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_length))
+
+        if header["version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported results format version {header['version']}")
+
+        rows = header["rows"]
+        data_start = _align(len(MAGIC) + 4 + header_length)
+        if not HAS_NUMPY:
+            return cls(header["heuristics"], _read_columns(filepath, header, data_start))
+
+        import numpy as np
+
+        columns = {}
+        for column in header["columns"]:
+            if rows == 0:
+                columns[column["name"]] = np.empty(0, dtype=column["dtype"])
+            else:
+                columns[column["name"]] = np.memmap(
+                    filepath, dtype=column["dtype"], mode="r",
+                    offset=data_start + column["offset"], shape=(rows,)
+                )
+        return cls(header["heuristics"], columns)
+
+    @classmethod
+    def from_json(cls, filepath: str) -> "ResultsTable":
+        """
+        Convert a results.json file written by ExperimentRunner.save_results().
+
+        JSON results only carry the derived average lower bound, which is
+        stored as a lower-bound sum over a count of one.
+
+        Args:
+            filepath: Path to results JSON file
+
+        Returns:
+            ResultsTable with in-memory columns
+        """
+        with open(filepath, "r") as f:
+            data = json.load(f)
+
+        heuristics = list(data.keys())
+        types = _column_types()
+        values = {name: [] for name in types}
+        for code, heuristic in enumerate(heuristics):
+            for s in data[heuristic]["statistics"]:
+                s = dict(s, lower_bound_sum=s["average_lower_bound"], lower_bound_count=1)
+                values["heuristic"].append(code)
+                values["puzzle_key"].append(s.get("puzzle_key", UNKNOWN_PUZZLE_KEY))
+                for name in statistics_columns():
+                    values[name].append(s.get(name, 0))
+
+        if not HAS_NUMPY:
+            return cls(heuristics, {name: array(types[name][0], column) for name, column in values.items()})
+
+        import numpy as np
+
+        return cls(heuristics, {name: np.array(column, dtype=types[name][1]) for name, column in values.items()})
+
+    @classmethod
+    def open(cls, filepath: str) -> "ResultsTable":
+        """Load a results file, dispatching on JSON vs columnar format."""
+        if filepath.endswith(".json"):
+            return cls.from_json(filepath)
+        return cls.load(filepath)
+
+    def ratio(self):
+        """
+        Vectorized SearchStatistics.ratio for every row.
+
+        Returns:
+            Array of average lower bound / optimal cost (0 where undefined);
+            a list without NumPy
+        """
+        if not HAS_NUMPY:
+            return [(total / count if count else 0) / cost if cost else 0.0
+                    for total, count, cost in zip(self.columns["lower_bound_sum"],
+                                                  self.columns["lower_bound_count"],
+                                                  self.columns["optimal_cost"])]
+
+        import numpy as np
+
+        count = self.columns["lower_bound_count"]
+        cost = self.columns["optimal_cost"]
+        avg = np.divide(self.columns["lower_bound_sum"], count,
+                        out=np.zeros(len(self), dtype=np.float64), where=count != 0)
+        return np.divide(avg, cost, out=np.zeros(len(self), dtype=np.float64), where=cost != 0)
+
+    def memory(self):
+        """
+        Peak memory of every row in bytes.
+
+        Uses the measured peak where the solve was profiled, and otherwise
+        estimates it as bytes per node times the peak number of held
+        states. Files without memory columns give zeros.
+
+        Returns:
+            Array of peak memory in bytes; a list without NumPy
+        """
+        if not HAS_NUMPY:
+            if "peak_memory" not in self.columns:
+                return [0.0] * len(self)
+            return [float(measured) if measured > 0 else per_node * max(closed, frontier)
+                    for measured, per_node, closed, frontier in zip(
+                        self.columns["peak_memory"], self.columns["bytes_per_node"],
+                        self.columns["peak_closed"], self.columns["peak_frontier"])]
+
+        import numpy as np
+
+        if "peak_memory" not in self.columns:
+            return np.zeros(len(self), dtype=np.float64)
+        measured = self.columns["peak_memory"].astype(np.float64)
+        held = np.maximum(self.columns["peak_closed"], self.columns["peak_frontier"])
+        estimated = self.columns["bytes_per_node"] * held
+        return np.where(measured > 0, measured, estimated)
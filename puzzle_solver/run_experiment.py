@@ -5,6 +5,7 @@ Runs experiments with all four heuristics and collects statistics.
 
 import sys
 import json
+import random
 from typing import List, Dict
 import statistics
 import time
@@ -16,26 +17,34 @@ from puzzle_solver.puzzle_state import PuzzleState
 from puzzle_solver.generator import PuzzleGenerator
 from puzzle_solver.heuristics import HEURISTICS
 from puzzle_solver.branch_and_bound import BranchAndBoundSolver, SearchStatistics
+from puzzle_solver.results_store import write_columns
+from puzzle_solver.memory_profile import MemoryProfiler
 
 
 class ExperimentRunner:
     """Run experiments with different heuristics."""
     
-    def __init__(self, num_puzzles: int = 100):
+    def __init__(self, num_puzzles: int = 100, seed: int = None, profile_memory: bool = False):
         """
         Initialize experiment runner.
         
         Args:
             num_puzzles: Number of puzzle instances to test
+            seed: Random seed for puzzle generation (None: unseeded)
+            profile_memory: Measure allocations of every solve with
+                            tracemalloc (slows solves down severalfold)
         """
         self.num_puzzles = num_puzzles
+        self.seed = seed
+        self.profile_memory = profile_memory
         self.puzzles = None
         self.results = {}
     
     def generate_puzzles(self) -> List[PuzzleState]:
         """Generate test puzzle instances."""
         print(f"Generating {self.num_puzzles} puzzle instances...")
-        self.puzzles = PuzzleGenerator.generate_batch(self.num_puzzles)
+        rng = random.Random(self.seed) if self.seed is not None else None
+        self.puzzles = PuzzleGenerator.generate_batch(self.num_puzzles, rng)
         print(f"Successfully generated {len(self.puzzles)} unique puzzles.\n")
         return self.puzzles
     
@@ -54,6 +63,8 @@ class ExperimentRunner:
         for heuristic in HEURISTICS:
             print(f"Testing {heuristic.get_name()}...")
             solver = BranchAndBoundSolver(heuristic)
+            if self.profile_memory:
+                solver = MemoryProfiler(solver)
             
             statistics_list = []
             successful = 0
@@ -175,13 +186,20 @@ class ExperimentRunner:
                 "statistics": []
             }
             
-            for stats in stats_list:
+            for puzzle, stats in zip(self.puzzles, stats_list):
                 serializable_results[heuristic_name]["statistics"].append({
+                    "puzzle_key": puzzle.pack(),
                     "solution_found": stats.solution_found,
                     "solution_length": stats.solution_length,
                     "nodes_expanded": stats.nodes_expanded,
                     "optimal_cost": stats.optimal_cost,
                     "execution_time": stats.execution_time,
+                    "heuristic_calls": stats.heuristic_calls,
+                    "nodes_after_solution": stats.nodes_after_solution,
+                    "peak_frontier": stats.peak_frontier,
+                    "peak_closed": stats.peak_closed,
+                    "bytes_per_node": stats.bytes_per_node,
+                    "peak_memory": stats.peak_memory,
                     "average_lower_bound": stats.average_lower_bound,
                     "ratio": stats.ratio
                 })
@@ -191,6 +209,24 @@ class ExperimentRunner:
             json.dump(serializable_results, f, indent=2)
         
         print(f"Results saved to {filepath}")
+    
+    def save_columnar(self, filename: str = "results.bin"):
+        """
+        Save results in the compact columnar format (see results_store.py).
+        
+        Args:
+            filename: Output filename
+        """
+        if not self.results:
+            print("No results to save. Run experiment first.")
+            return
+        
+        puzzle_keys = [puzzle.pack() for puzzle in self.puzzles]
+        
+        filepath = f'/home/luffy/class/DAA CLA2/{filename}'
+        write_columns(filepath, self.results, puzzle_keys)
+        
+        print(f"Columnar results saved to {filepath}")
 
 
 def main():
@@ -200,7 +236,7 @@ def main():
     print()
     
     # Run with 50 puzzles for quick testing (can increase to 100+ for full results)
-    runner = ExperimentRunner(num_puzzles=50)
+    runner = ExperimentRunner(num_puzzles=50, seed=0)
     
     # Generate puzzles
     runner.generate_puzzles()
@@ -215,6 +251,7 @@ def main():
     
     # Save results
     runner.save_results()
+    runner.save_columnar()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,110 @@
+"""
+Exhaustive enumeration of the 8-puzzle state space.
+
+A breadth-first search backwards from the goal reaches all 9!/2 = 181,440
+solvable states and gives the exact optimal solution cost h*(s) of each.
+"""
+
+from array import array
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from .puzzle_state import PuzzleState
+from .ranking import NUM_SOLVABLE_STATES, rank_solvable
+
+
+# Positions reachable by the blank from each position (up, down, left, right)
+BLANK_MOVES: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(p for p, ok in (
+        (pos - 3, pos >= 3),
+        (pos + 3, pos < 6),
+        (pos - 1, pos % 3 > 0),
+        (pos + 1, pos % 3 < 2),
+    ) if ok)
+    for pos in range(9)
+)
+
+
+@lru_cache(maxsize=1)
+def exact_distances() -> Dict[Tuple[int, ...], int]:
+    """
+    Compute the optimal solution cost of every solvable state.
+
+    The result is cached, and its iteration order is breadth-first, so
+    distances are non-decreasing when iterating.
+
+    Returns:
+        Dictionary mapping state tuple to its distance from the goal
+    """
+    goal = PuzzleState.GOAL_STATE
+    distances = {goal: 0}
+    queue = deque([(goal, goal.index(0))])
+
+    while queue:
+        state, empty = queue.popleft()
+        next_depth = distances[state] + 1
+        for move_pos in BLANK_MOVES[empty]:
+            tiles = list(state)
+            tiles[empty], tiles[move_pos] = tiles[move_pos], 0
+            neighbor = tuple(tiles)
+            if neighbor not in distances:
+                distances[neighbor] = next_depth
+                queue.append((neighbor, move_pos))
+
+    return distances
+
+
+def layer_sizes() -> List[int]:
+    """
+    Count solvable states at each distance from the goal.
+
+    Returns:
+        List where entry d is the number of states with h*(s) = d
+    """
+    sizes = [0] * (max(exact_distances().values()) + 1)
+    for depth in exact_distances().values():
+        sizes[depth] += 1
+    return sizes
+
+
+def states_at_depth(depth: int) -> List[PuzzleState]:
+    """
+    List all states whose optimal solution cost is exactly `depth`.
+
+    Args:
+        depth: Optimal solution cost
+
+    Returns:
+        List of PuzzleState objects
+    """
+    return [PuzzleState(s) for s, d in exact_distances().items() if d == depth]
+
+
+def solvable_state_arrays():
+    """
+    All solvable states as NumPy arrays for batched evaluation.
+
+    Returns:
+        Tuple of (states, depths): a (181440, 9) uint8 array of tiles in
+        breadth-first order, and the matching uint8 array of exact distances
+    """
+    import numpy as np
+
+    distances = exact_distances()
+    states = np.array(list(distances.keys()), dtype=np.uint8)
+    depths = np.fromiter(distances.values(), dtype=np.uint8, count=len(distances))
+    return states, depths
+
+
+def build_exact_distance_table() -> array:
+    """
+    Exact distances indexed by ranking.rank_solvable(), for storage in a table file.
+
+    Returns:
+        array('B') of 9!/2 distances
+    """
+    table = array('B', bytes(NUM_SOLVABLE_STATES))
+    for tiles, depth in exact_distances().items():
+        table[rank_solvable(tiles)] = depth
+    return table
@@ -0,0 +1,295 @@
+"""
+Hard-instance catalog and tail-latency stress benchmark.
+
+The experiments in run_experiment.py draw puzzles with PuzzleGenerator's
+random walks, which land mostly at 11-21 moves and never reach the 31-move
+worst case. This benchmark instead uses the exact distances of
+state_space.py to build a catalog that covers every depth: all
+maximum-depth states, plus a seeded sample of `per_depth` states from each
+shallower depth.
+
+Every (engine, heuristic) combination solves the whole catalog in a worker
+process of its own, so a solve that exceeds the timeout can be killed
+without losing the rest of the run; the worker is then restarted. The
+report gives the mean, median, p99 and maximum solve time per combination,
+counting timed-out solves at the timeout (so tails over the timeout are
+lower bounds), plus the slowest puzzle to reproduce the worst case with.
+
+Run as a script:
+    python -m puzzle_solver.stress [per_depth] [timeout] [seed]
+"""
+
+import sys
+import math
+import time
+import random
+import multiprocessing
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+sys.path.insert(0, '/home/luffy/class/DAA CLA2')
+
+from puzzle_solver.puzzle_state import PuzzleState
+from puzzle_solver.heuristics import Heuristic, HEURISTICS
+from puzzle_solver.branch_and_bound import SearchStatistics
+from puzzle_solver.state_space import exact_distances, layer_sizes
+from puzzle_solver.pipeline import ENGINES
+
+
+@dataclass
+class StressResult:
+    """Outcome of one solve in the stress benchmark."""
+    depth: int
+    puzzle_key: int
+    # Solve time in seconds (the timeout if timed_out)
+    time: float
+    timed_out: bool
+    nodes_expanded: int = 0
+    # Cost found, -1 if timed out
+    cost: int = -1
+
+
+def hard_instances(per_depth: int = 5, seed: int = 0, depths: Iterable[int] = None) -> List[Tuple[int, PuzzleState]]:
+    """
+    Build the catalog: every maximum-depth state and a stratified sample of the others.
+
+    Args:
+        per_depth: States sampled from each depth below the maximum (all of
+                   a depth's states if it has fewer)
+        seed: Random seed of the sample
+        depths: Depths to include (default: 0 to the maximum)
+
+    Returns:
+        List of (optimal cost, state), by increasing depth
+    """
+    max_depth = len(layer_sizes()) - 1
+    layers: Dict[int, List[Tuple[int, ...]]] = {}
+    for tiles, depth in exact_distances().items():
+        layers.setdefault(depth, []).append(tiles)
+
+    rng = random.Random(seed)
+    catalog = []
+    for depth in (range(max_depth + 1) if depths is None else sorted(depths)):
+        layer = layers[depth]
+        chosen = layer if depth == max_depth else rng.sample(layer, min(per_depth, len(layer)))
+        catalog.extend((depth, PuzzleState(tiles)) for tiles in chosen)
+    return catalog
+
+
+def percentile(values: List[float], p: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values: Samples
+        p: Percentile in (0, 100]
+
+    Returns:
+        Smallest sample with at least p% of the samples at or below it
+    """
+    ordered = sorted(values)
+    return ordered[max(math.ceil(p / 100 * len(ordered)), 1) - 1]
+
+
+def _serve(engine: str, heuristic: Heuristic, conn):
+    """Worker loop: build the solver once, then solve boards until sent None."""
+    solver = ENGINES[engine](heuristic)
+    # Warm up so table loading is not charged to the first timed solve
+    solver.solve(PuzzleState((1, 0, 2, 3, 4, 5, 6, 7, 8)))
+    conn.send(None)
+    while True:
+        tiles = conn.recv()
+        if tiles is None:
+            break
+        _, stats = solver.solve(PuzzleState(tiles))
+        conn.send(stats)
+
+
+class _TimedWorker:
+    """Worker process for one (engine, heuristic), restarted when a solve times out."""
+
+    def __init__(self, engine: str, heuristic: Heuristic):
+        self.engine = engine
+        self.heuristic = heuristic
+        self.restarts = 0
+        self._start()
+
+    def _start(self):
+        self.conn, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_serve, args=(self.engine, self.heuristic, child),
+                                               daemon=True)
+        self.process.start()
+        child.close()
+        self.conn.recv()
+
+    def solve(self, state: PuzzleState, timeout: float) -> Optional[SearchStatistics]:
+        """Solve in the worker; None if it takes longer than `timeout` seconds."""
+        self.conn.send(state.state)
+        if self.conn.poll(timeout):
+            return self.conn.recv()
+        self.process.terminate()
+        self.process.join()
+        self.conn.close()
+        self.restarts += 1
+        self._start()
+        return None
+
+    def close(self):
+        self.conn.send(None)
+        self.process.join()
+        self.conn.close()
+
+
+class StressBenchmark:
+    """Solve the hard-instance catalog with every engine and heuristic under a timeout."""
+
+    def __init__(self, per_depth: int = 5, timeout: float = 10.0, seed: int = 0,
+                 engines: Iterable[str] = ("bnb", "pooled", "ida", "sma"),
+                 heuristics: List[Heuristic] = None, depths: Iterable[int] = None):
+        """
+        Initialize benchmark.
+
+        Args:
+            per_depth: States sampled from each depth (see hard_instances())
+            timeout: Seconds allowed per solve
+            seed: Random seed of the catalog
+            engines: Engine names (keys of pipeline.ENGINES)
+            heuristics: Heuristics (default: HEURISTICS)
+            depths: Depths to include (default: all)
+        """
+        self.per_depth = per_depth
+        self.timeout = timeout
+        self.seed = seed
+        self.engines = list(engines)
+        self.heuristics = heuristics if heuristics is not None else HEURISTICS
+        self.depths = depths
+        self.results: Optional[Dict[Tuple[str, str], List[StressResult]]] = None
+
+        for engine in self.engines:
+            if engine not in ENGINES:
+                raise ValueError(f"Unknown engine: {engine}. Available: {', '.join(ENGINES)}")
+
+    def run(self) -> Dict[Tuple[str, str], List[StressResult]]:
+        """
+        Run every combination over the catalog.
+
+        Returns:
+            Mapping of (engine, heuristic name) to per-instance results, in
+            catalog order
+        """
+        catalog = hard_instances(self.per_depth, self.seed, self.depths)
+        self.results = {}
+        for engine in self.engines:
+            for heuristic in self.heuristics:
+                worker = _TimedWorker(engine, heuristic)
+                results = []
+                for depth, state in catalog:
+                    stats = worker.solve(state, self.timeout)
+                    if stats is None:
+                        results.append(StressResult(depth, state.pack(), self.timeout, True))
+                    else:
+                        results.append(StressResult(depth, state.pack(), stats.execution_time, False,
+                                                    stats.nodes_expanded, stats.optimal_cost))
+                worker.close()
+                self.results[(engine, heuristic.get_name())] = results
+        return self.results
+
+    def summary(self) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """
+        Tail-latency summary per combination.
+
+        Returns:
+            Mapping of (engine, heuristic name) to mean, p50, p99 and max
+            solve time, the number of timeouts and of wrong costs, the
+            slowest instance's puzzle key and the slowest time at the
+            maximum depth
+        """
+        if self.results is None:
+            self.run()
+
+        max_depth = len(layer_sizes()) - 1
+        summary = {}
+        for combination, results in self.results.items():
+            times = [r.time for r in results]
+            slowest = max(results, key=lambda r: r.time)
+            deepest = [r.time for r in results if r.depth == max_depth]
+            summary[combination] = {
+                "count": len(results),
+                "mean": sum(times) / len(times),
+                "p50": percentile(times, 50),
+                "p99": percentile(times, 99),
+                "max": slowest.time,
+                "max_depth_max": max(deepest) if deepest else 0.0,
+                "timeouts": sum(r.timed_out for r in results),
+                "wrong": sum(not r.timed_out and r.cost != r.depth for r in results),
+                "slowest_key": slowest.puzzle_key,
+            }
+        return summary
+
+    def format_report(self) -> str:
+        """
+        Format the tail-latency summary as a text report.
+
+        Returns:
+            Report text
+        """
+        summary = self.summary()
+        count = next(iter(summary.values()))["count"] if summary else 0
+        max_depth = len(layer_sizes()) - 1
+
+        report = []
+        report.append("=" * 100)
+        report.append("STRESS BENCHMARK: HARD-INSTANCE TAIL LATENCY")
+        report.append("=" * 100)
+        report.append(f"Instances: {count} (all maximum-depth states, up to {self.per_depth} per other depth, "
+                      f"seed {self.seed}), timeout: {self.timeout:.1f}s")
+        report.append("Times in seconds; timed-out solves count as the timeout")
+        report.append("")
+        report.append(f"{'Engine':<8} {'Heuristic':<26} {'Mean':>8} {'p50':>8} {'p99':>8} {'Max':>8} "
+                      f"{f'Max@{max_depth}':>8} {'Timeouts':>9} {'Wrong':>6}  {'Slowest key':<12}")
+        report.append("-" * 100)
+        for (engine, name), data in summary.items():
+            report.append(f"{engine:<8} {name:<26} {data['mean']:>8.3f} {data['p50']:>8.3f} {data['p99']:>8.3f} "
+                          f"{data['max']:>8.3f} {data['max_depth_max']:>8.3f} {data['timeouts']:>9} "
+                          f"{data['wrong']:>6}  {data['slowest_key']:<12}")
+        report.append("")
+        report.append("=" * 100)
+
+        return "\n".join(report)
+
+    def save_report(self, output_file: str = "stress_report.txt"):
+        """
+        Write the text report.
+
+        Args:
+            output_file: Output file name
+        """
+        report_text = self.format_report()
+
+        filepath = f'/home/luffy/class/DAA CLA2/{output_file}'
+        with open(filepath, 'w') as f:
+            f.write(report_text)
+
+        print(f"Stress report saved to {filepath}")
+        return report_text
+
+
+def main():
+    """Run the stress benchmark and print the tail-latency report."""
+    per_depth = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    timeout = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    print("Stress Benchmark - Hard Instances")
+    print("=" * 80)
+    print()
+
+    start = time.perf_counter()
+    benchmark = StressBenchmark(per_depth=per_depth, timeout=timeout, seed=seed)
+    benchmark.run()
+    print(benchmark.format_report())
+    print(f"\nStress benchmark completed in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
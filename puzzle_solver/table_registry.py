@@ -0,0 +1,230 @@
+"""
+Registry of precomputed lookup tables shared between processes.
+
+Tables (exact distance tables, pattern databases, ...) are built once and
+stored as files that every process memory-maps read-only. All processes
+attached to the same file share one copy of its pages through the OS page
+cache, so a worker process pays neither the build nor a copy.
+
+File layout (native byte order, recorded in the header):
+    b"PZTB" magic, uint32 header length, JSON header,
+    then the table data aligned to 8 bytes.
+
+A file name carries the table name and a fingerprint of the registered
+version, the source of the builder's module and of every package module
+it imports (see dependencies.py), the element type and FORMAT_VERSION, so
+changing how a table is generated, indexed or stored selects a new file
+and stale files are removed the next time the table is built.
+
+The built-in tables live in DEFAULT_TABLE_DIR: the directory named by the
+PUZZLE_SOLVER_TABLE_DIR environment variable, or "tables" next to the
+package directory.
+"""
+
+import os
+import sys
+import mmap
+import json
+import glob
+import struct
+import inspect
+import hashlib
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from .dependencies import module_source, package_modules
+from .state_space import build_exact_distance_table
+from .heuristic_tables import (
+    build_walking_distance_table, build_walking_distance_table_middle, build_linear_conflict_table,
+    build_linear_conflict_table_edge, build_linear_conflict_table_centre
+)
+
+
+MAGIC = b"PZTB"
+FORMAT_VERSION = 1
+
+TABLE_DIR_ENV = "PUZZLE_SOLVER_TABLE_DIR"
+
+DEFAULT_TABLE_DIR = os.environ.get(TABLE_DIR_ENV) or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tables"
+)
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+@dataclass
+class TableSpec:
+    """How to build one table."""
+    name: str
+    builder: Callable[[], array]
+    typecode: str
+    version: int
+
+    @property
+    def fingerprint(self) -> str:
+        """Short digest of everything that determines the table's contents and layout."""
+        modules = package_modules(getattr(self.builder, "__module__", None) or "")
+        if modules:
+            source = "\n".join(module_source(name) for name in modules)
+        else:
+            # Builder defined outside the package: only its own source is known
+            try:
+                source = inspect.getsource(self.builder)
+            except (OSError, TypeError):
+                source = getattr(self.builder, "__qualname__", repr(self.builder))
+        digest = hashlib.sha256(
+            f"{self.name}:{self.version}:{FORMAT_VERSION}:{self.typecode}:{sys.byteorder}:{source}".encode()
+        )
+        return digest.hexdigest()[:12]
+
+
+class TableRegistry:
+    """Build-once, attach-many store of memory-mapped tables."""
+
+    def __init__(self, directory: str = DEFAULT_TABLE_DIR):
+        """
+        Initialize registry. Nothing is read or written until a table is requested.
+
+        Args:
+            directory: Directory holding the table files
+        """
+        self.directory = directory
+        self._specs: Dict[str, TableSpec] = {}
+        # name -> (mmap or None for in-memory tables, base view, typed view)
+        self._attached: Dict[str, Tuple[Optional[mmap.mmap], memoryview, memoryview]] = {}
+
+    def register(self, name: str, builder: Callable[[], array], typecode: str = 'B', version: int = 1):
+        """
+        Register a table.
+
+        Args:
+            name: Table name
+            builder: Function returning the table as an array of `typecode`;
+                     must be a module-level function so the registry can be
+                     passed to worker processes
+            typecode: array typecode of the elements
+            version: Bump to invalidate files built by older code
+        """
+        self._specs[name] = TableSpec(name, builder, typecode, version)
+
+    def path(self, name: str) -> str:
+        """Path of the current file for a table."""
+        spec = self._specs[name]
+        return os.path.join(self.directory, f"{name}-{spec.fingerprint}.tbl")
+
+    def build(self, name: str) -> str:
+        """
+        Build a table and write its file, replacing stale versions.
+
+        The file is written under a temporary name and renamed into place,
+        so concurrent builders never expose a partial file.
+
+        Args:
+            name: Table name
+
+        Returns:
+            Path of the written file
+        """
+        spec = self._specs[name]
+        table = spec.builder()
+        if table.typecode != spec.typecode:
+            raise ValueError(f"Builder for {name} returned typecode {table.typecode}, expected {spec.typecode}")
+
+        header = json.dumps({
+            "name": name,
+            "fingerprint": spec.fingerprint,
+            "format_version": FORMAT_VERSION,
+            "typecode": spec.typecode,
+            "byteorder": sys.byteorder,
+            "length": len(table),
+        }).encode()
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            f.write(b"\0" * (_align(f.tell()) - f.tell()))
+            table.tofile(f)
+        os.replace(tmp_path, path)
+
+        for stale in glob.glob(os.path.join(self.directory, f"{name}-*.tbl")):
+            if stale != path:
+                os.remove(stale)
+        return path
+
+    def get(self, name: str) -> memoryview:
+        """
+        Attach to a table, building it first if no current file exists.
+        If the table directory cannot be written, the table is built and
+        kept in memory for this process only.
+
+        Args:
+            name: Table name
+
+        Returns:
+            Read-only memoryview of the table elements
+        """
+        if name in self._attached:
+            return self._attached[name][2]
+
+        spec = self._specs[name]
+        path = self.path(name)
+        if not os.path.exists(path):
+            try:
+                self.build(name)
+            except OSError:
+                # Table directory not writable: keep a private in-memory copy
+                view = memoryview(spec.builder())
+                self._attached[name] = (None, view, view)
+                return view
+
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if mapped[:4] != MAGIC:
+            mapped.close()
+            raise ValueError(f"Not a table file: {path}")
+        (header_len,) = struct.unpack("<I", mapped[4:8])
+        header = json.loads(mapped[8:8 + header_len])
+        if (header["fingerprint"] != spec.fingerprint or header["typecode"] != spec.typecode
+                or header["byteorder"] != sys.byteorder):
+            mapped.close()
+            raise ValueError(f"Table file {path} does not match the registered table")
+
+        start = _align(8 + header_len)
+        size = header["length"] * array(spec.typecode).itemsize
+        base = memoryview(mapped)
+        view = base[start:start + size].cast(spec.typecode)
+        self._attached[name] = (mapped, base, view)
+        return view
+
+    def close(self):
+        """Detach from all tables."""
+        for mapped, base, view in self._attached.values():
+            view.release()
+            base.release()
+            if mapped is not None:
+                mapped.close()
+        self._attached = {}
+
+    def __getstate__(self):
+        # Attached maps stay in this process; a worker re-attaches on first use
+        state = self.__dict__.copy()
+        state["_attached"] = {}
+        return state
+
+
+# Registry of the package's built-in tables
+TABLES = TableRegistry()
+TABLES.register("exact_distances", build_exact_distance_table)
+TABLES.register("walking_distance", build_walking_distance_table)
+TABLES.register("walking_distance_middle", build_walking_distance_table_middle)
+TABLES.register("linear_conflict", build_linear_conflict_table)
+TABLES.register("linear_conflict_edge", build_linear_conflict_table_edge)
+TABLES.register("linear_conflict_centre", build_linear_conflict_table_centre)
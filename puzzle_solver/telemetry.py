@@ -0,0 +1,151 @@
+"""
+Live progress telemetry for long solves.
+
+Solvers that accept a `telemetry` callback call it with a TelemetrySample
+every `telemetry_interval` expansions and once more when the solve ends.
+Between samples a solver only does one modulo check per expansion, so
+telemetry can be left on: the default interval of 10,000 expansions means
+a few samples per second even for the slowest heuristics.
+
+Two sinks are provided, and any callable taking a sample works:
+    ConsoleRenderer - one status line, redrawn in place on a terminal
+    JsonlSink       - one JSON object per sample, appended to a file
+
+Example:
+    with JsonlSink("h1.jsonl") as sink:
+        BranchAndBoundSolver(h1, telemetry=sink).solve(puzzle)
+"""
+
+import sys
+import json
+import time
+import dataclasses
+from dataclasses import dataclass
+from typing import Optional, TextIO
+
+
+DEFAULT_INTERVAL = 10000
+
+
+@dataclass
+class TelemetrySample:
+    """Progress of a solve at one point in time."""
+    heuristic_name: str
+    elapsed: float
+    nodes_expanded: int
+    # f of the node being expanded (IDA*: the current threshold)
+    f_bound: float
+    frontier: int
+    # Expansions per second since the previous sample
+    expansions_per_second: float
+    # Cost of the best solution found so far, None if none yet
+    incumbent: Optional[int] = None
+    done: bool = False
+
+
+class TelemetrySampler:
+    """Builds samples for one solve, tracking the expansion rate between them."""
+
+    def __init__(self, heuristic_name: str):
+        """
+        Start timing a solve.
+
+        Args:
+            heuristic_name: Name recorded in every sample
+        """
+        self.heuristic_name = heuristic_name
+        self.start = time.perf_counter()
+        self._last_time = self.start
+        self._last_nodes = 0
+
+    def sample(self, nodes_expanded: int, f_bound: float, frontier: int,
+               incumbent: float = float('inf'), done: bool = False) -> TelemetrySample:
+        """
+        Build a sample of the current progress.
+
+        Args:
+            nodes_expanded: Expansions so far
+            f_bound: Current f-bound
+            frontier: Current frontier size
+            incumbent: Best solution cost so far (inf if none)
+            done: Whether the solve has finished
+
+        Returns:
+            TelemetrySample
+        """
+        now = time.perf_counter()
+        interval = now - self._last_time
+        rate = (nodes_expanded - self._last_nodes) / interval if interval > 0 else 0.0
+        self._last_time = now
+        self._last_nodes = nodes_expanded
+        return TelemetrySample(
+            heuristic_name=self.heuristic_name,
+            elapsed=now - self.start,
+            nodes_expanded=nodes_expanded,
+            f_bound=f_bound,
+            frontier=frontier,
+            expansions_per_second=rate,
+            incumbent=None if incumbent == float('inf') else int(incumbent),
+            done=done
+        )
+
+
+class ConsoleRenderer:
+    """Telemetry sink printing a status line per sample."""
+
+    def __init__(self, stream: TextIO = None):
+        """
+        Initialize renderer.
+
+        Args:
+            stream: Output stream (default: sys.stderr); on a terminal the
+                    line is redrawn in place, otherwise one line per sample
+        """
+        self.stream = stream if stream is not None else sys.stderr
+        self.in_place = hasattr(self.stream, "isatty") and self.stream.isatty()
+
+    def format(self, sample: TelemetrySample) -> str:
+        """Render a sample as one line."""
+        incumbent = "-" if sample.incumbent is None else str(sample.incumbent)
+        return (f"{sample.heuristic_name.split(':')[0]:<4} {sample.elapsed:8.1f}s "
+                f"expanded {sample.nodes_expanded:>10,}  f {sample.f_bound:>3}  "
+                f"frontier {sample.frontier:>9,}  {sample.expansions_per_second:>9,.0f}/s  "
+                f"best {incumbent}")
+
+    def __call__(self, sample: TelemetrySample):
+        line = self.format(sample)
+        if self.in_place:
+            self.stream.write("\r\033[K" + line + ("\n" if sample.done else ""))
+        else:
+            self.stream.write(line + "\n")
+        self.stream.flush()
+
+
+class JsonlSink:
+    """Telemetry sink appending samples to a JSON-lines file."""
+
+    def __init__(self, path: str):
+        """
+        Open the file for appending.
+
+        Args:
+            path: Output file
+        """
+        self.path = path
+        self._file = open(path, "a")
+
+    def __call__(self, sample: TelemetrySample):
+        # Flush every sample so a solve that is killed or still running
+        # can be followed from the file
+        self._file.write(json.dumps(dataclasses.asdict(sample)) + "\n")
+        self._file.flush()
+
+    def close(self):
+        """Flush and close the file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -2,13 +2,48 @@
 Quick test script to validate the implementation.
 """
 
+import os
 import sys
+import tempfile
 sys.path.insert(0, '/home/luffy/class/DAA CLA2')
 
 from puzzle_solver.puzzle_state import PuzzleState
-from puzzle_solver.heuristics import h1, h2, h3, h4
-from puzzle_solver.branch_and_bound import BranchAndBoundSolver
+from puzzle_solver.heuristics import h1, h2, h3, h4, MaxHeuristic, ExactDistance, H3_Manhattan, HEURISTICS
+from puzzle_solver.heuristics import H5_WalkingDistance, H6_InversionDistance, H7_LinearConflictCorners
+from puzzle_solver.branch_and_bound import BranchAndBoundSolver, SearchStatistics, PooledBranchAndBoundSolver
+from puzzle_solver.branch_and_bound import TIE_BREAKING_POLICIES, TERMINATION_MODES, GOAL_TEST_MODES
 from puzzle_solver.generator import PuzzleGenerator
+from puzzle_solver.benchmarks import measure_import, CORE_MODULES, bench_state_layout
+from puzzle_solver.results_store import write_columns, ResultsTable
+from puzzle_solver.analyze_results import ResultsAnalyzer
+from puzzle_solver import results_store, analyze_results
+from puzzle_solver.state_space import exact_distances, solvable_state_arrays, states_at_depth, layer_sizes
+from puzzle_solver.state_space import build_exact_distance_table
+from puzzle_solver.heuristic_tables import build_walking_distance_table, build_linear_conflict_table
+from puzzle_solver.heuristic_tables import build_walking_distance_table_middle, LC_GOALS
+from puzzle_solver.heuristic_tables import build_linear_conflict_table_edge, build_linear_conflict_table_centre
+from puzzle_solver.external_bfs import ExternalBFS
+from puzzle_solver.memory_bounded import SMAStarSolver
+from puzzle_solver.heuristic_sweep import HeuristicSweep
+from puzzle_solver.ida_star import IDAStarSolver
+from puzzle_solver.parallel import ParallelIDAStarSolver
+from puzzle_solver.hda_star import HDAStarSolver
+from puzzle_solver.table_registry import TableRegistry, TABLES, TABLE_DIR_ENV
+from puzzle_solver.moves import MoveSequence
+from puzzle_solver.pipeline import ExperimentPipeline
+from puzzle_solver.dependencies import package_modules
+from puzzle_solver import dependencies
+from puzzle_solver.goals import GoalFrame, solve_pairs
+from puzzle_solver.memory_profile import MemoryProfiler
+from puzzle_solver.telemetry import ConsoleRenderer, JsonlSink
+from puzzle_solver.checkpoint import CheckpointLog
+from puzzle_solver import ranking
+from puzzle_solver.stress import StressBenchmark, hard_instances, percentile
+
+# Build the package's shared tables in a scratch directory, not the project
+# tree; worker processes that re-import the package find it in the environment
+_TABLE_DIR = tempfile.TemporaryDirectory()
+os.environ[TABLE_DIR_ENV] = TABLES.directory = _TABLE_DIR.name
 
 
 def test_puzzle_state():
@@ -111,6 +146,796 @@ def test_goal_state():
     print("✓ Goal state handled correctly")
 
 
+def test_lazy_imports():
+    """Test that importing the solver core loads no heavy dependencies."""
+    print("\nTesting Lazy Imports...")
+    
+    for module in CORE_MODULES + ("puzzle_solver.analyze_results",):
+        result = measure_import(module, repeats=1)
+        assert not result["heavy_loaded"], \
+            f"{module} should not import {result['heavy_loaded']}"
+    
+    print("✓ Solver core and analyzer import without numpy/matplotlib")
+
+
+def test_columnar_results():
+    """Test columnar results round trip."""
+    print("\nTesting Columnar Results...")
+    import os
+    import json
+    import tempfile
+    from dataclasses import asdict
+    
+    puzzles = [PuzzleState((1, 0, 2, 3, 4, 5, 6, 7, 8)), PuzzleState((1, 2, 0, 3, 4, 5, 6, 7, 8))]
+    results = {h.get_name(): [BranchAndBoundSolver(h).solve(p)[1] for p in puzzles] for h in (h2, h3)}
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.bin")
+        write_columns(path, results, [p.pack() for p in puzzles])
+        table = ResultsTable.load(path)
+        
+        assert table.heuristics == [h2.get_name(), h3.get_name()], "Heuristic names should round trip"
+        assert len(table) == 4, f"Should have 4 rows, got {len(table)}"
+        assert list(table["optimal_cost"]) == [1, 2, 1, 2], "Costs should round trip"
+        assert PuzzleState.unpack(int(table["puzzle_key"][1])) == puzzles[1], "Keys should unpack"
+        expected = [s.ratio for stats in results.values() for s in stats]
+        assert all(abs(a - b) < 1e-12 for a, b in zip(table.ratio(), expected)), "Ratios should match"
+        del table
+        
+        # Without NumPy, both formats load and analyze in pure Python
+        json_path = os.path.join(tmp, "results.json")
+        with open(json_path, "w") as f:
+            json.dump({name: {"statistics": [dict(asdict(s), average_lower_bound=s.average_lower_bound)
+                                             for s in stats]}
+                       for name, stats in results.items()}, f)
+        
+        def close(a, b):
+            if isinstance(a, dict):
+                return a.keys() == b.keys() and all(close(a[k], b[k]) for k in a)
+            if isinstance(a, tuple):
+                return all(close(x, y) for x, y in zip(a, b))
+            return abs(a - b) <= 1e-9 * max(1.0, abs(a))
+        
+        analyses = []
+        has_numpy = results_store.HAS_NUMPY
+        for numpy_available in (has_numpy, False):
+            results_store.HAS_NUMPY = analyze_results.HAS_NUMPY = numpy_available
+            try:
+                for filepath in (path, json_path):
+                    analyzer = ResultsAnalyzer(filepath)
+                    analyses.append((analyzer.extract_metrics(), analyzer.percentiles(),
+                                     analyzer.depth_breakdown("ratio")))
+                    del analyzer
+            finally:
+                results_store.HAS_NUMPY = analyze_results.HAS_NUMPY = has_numpy
+        assert all(close(analysis, analyses[0]) for analysis in analyses), \
+            "Pure-Python loading and metrics should match NumPy"
+    
+    print("✓ Columnar results round trip")
+
+
+def test_heuristic_sweep():
+    """Test full state-space sweep and batched heuristics."""
+    print("\nTesting Heuristic Sweep...")
+    
+    distances = exact_distances()
+    assert len(distances) == 181440, f"Should reach 181440 states, got {len(distances)}"
+    assert max(distances.values()) == 31, "Hardest 8-puzzle instances take 31 moves"
+    
+    states, _ = solvable_state_arrays()
+    for h in (h1, h2, h3, h4):
+        batch = h.compute_batch(states[::997])
+        scalar = [h.compute(PuzzleState(tuple(int(t) for t in row))) for row in states[::997]]
+        assert list(batch) == scalar, f"{h.get_name()} batch values should match compute()"
+    
+    sweep = HeuristicSweep(heuristics=[h2, h3], cost_sample=100)
+    results = sweep.run()
+    assert (h3.get_name(), h2.get_name()) in results["dominance"], "H3 should dominate H2"
+    assert results["heuristics"][h3.get_name()]["overestimates"] == 0, "H3 should be admissible"
+    
+    print(f"✓ Swept {len(distances)} states, H3 mean h/h* = "
+          f"{results['heuristics'][h3.get_name()]['mean_ratio']:.3f}")
+
+
+def test_max_heuristic():
+    """Test max-of-heuristics combinator."""
+    print("\nTesting MaxHeuristic...")
+    
+    combined = MaxHeuristic([h4, h2])
+    assert combined.get_name() == "Max(H2, H4)", "Components should be ordered cheapest first"
+    
+    puzzle = PuzzleState((8, 7, 6, 5, 4, 3, 2, 1, 0))
+    assert combined.compute(puzzle) == max(h2.compute(puzzle), h4.compute(puzzle)), "Should take the max"
+    assert combined.compute_bounded(puzzle, 1) == h2.compute(puzzle), "Should stop at the bound"
+    assert combined.short_circuits == 1, "Should count the short circuit"
+    assert combined.compute_bounded(puzzle, 100) == combined.compute(puzzle), "Should be exact below bound"
+    
+    start = PuzzleState((1, 2, 5, 3, 4, 0, 6, 7, 8))
+    _, stats = BranchAndBoundSolver(MaxHeuristic([h3, h4])).solve(start)
+    assert stats.optimal_cost == 3, f"Should find 3-move solution, got {stats.optimal_cost}"
+    
+    print("✓ MaxHeuristic combines and short-circuits")
+
+
+def test_solvability():
+    """Test O(n) solvability checks."""
+    print("\nTesting Solvability...")
+    
+    state = PuzzleState((8, 1, 2, 0, 4, 3, 7, 6, 5))
+    for _ in range(20):
+        state = state.get_neighbors()[-1]
+        assert state.inversion_parity() == state.get_inverse_count() % 2, "Parity should match the inversion count"
+    
+    boards = [
+        (1, 0, 2, 3, 4, 5, 6, 7, 8),        # solvable
+        (0, 2, 1, 3, 4, 5, 6, 7, 8),        # one swap: unsolvable
+        (0, 1, 2, 3, 4, 5, 6, 7, 7),        # not a permutation
+        (1, 2, 3),                          # wrong size
+    ]
+    assert PuzzleState.validate_many(boards) == [True, False, False, False], "3x3 validation"
+    
+    # 15-puzzle: moving the blank down one row flips inversion parity
+    goal_15 = tuple(range(16))
+    down = (4, 1, 2, 3, 0) + goal_15[5:]
+    swapped = (0, 2, 1) + goal_15[3:]
+    assert PuzzleState.validate_many([goal_15, down, swapped], width=4) == [True, True, False], \
+        "4x4 validation should include the blank-row term"
+    
+    print("✓ Solvability checks passed")
+
+
+def test_state_layout():
+    """Test slotted, immutable PuzzleState."""
+    print("\nTesting PuzzleState Layout...")
+    import pickle
+    
+    state = PuzzleState((1, 0, 2, 3, 4, 5, 6, 7, 8))
+    assert not hasattr(state, "__dict__"), "PuzzleState should use __slots__"
+    try:
+        state.empty_pos = 0
+        assert False, "PuzzleState should be immutable"
+    except AttributeError:
+        pass
+    
+    known = PuzzleState._from_known(state.state, 1)
+    assert known == state and hash(known) == hash(state), "Known-blank constructor should match"
+    assert pickle.loads(pickle.dumps(state)) == state, "PuzzleState should pickle"
+    assert len({state, known, PuzzleState()}) == 2, "Set lookups should use equality"
+    
+    layouts = bench_state_layout(count=20000, lookups=20000)
+    assert layouts["slots + cached hash"]["bytes_per_object"] < layouts["dict (previous)"]["bytes_per_object"], \
+        "Slotted states should be smaller than the __dict__ layout"
+    
+    print("✓ PuzzleState layout tests passed")
+
+
+def test_pooled_solver():
+    """Test that the pooled solver matches the default solver across reuse."""
+    print("\nTesting Pooled Solver...")
+    
+    puzzles = PuzzleGenerator.generate_batch(5)
+    solver = BranchAndBoundSolver(h4)
+    pooled = PooledBranchAndBoundSolver(h4, initial_capacity=4, max_f=1)
+    
+    for puzzle in puzzles + puzzles:
+        path, stats = solver.solve(puzzle)
+        pooled_path, pooled_stats = pooled.solve(puzzle)
+        assert pooled_path == path, "Pooled solver should return the same path"
+        assert pooled_stats.nodes_expanded == stats.nodes_expanded, "Pooled solver should expand the same nodes"
+        assert not any(pooled._node_state), "Pooled node slots should not keep boards alive between solves"
+    
+    print("✓ Pooled solver matches across 10 reused solves")
+
+
+def test_memory_bounded():
+    """Test SMA* under a tight node cap."""
+    print("\nTesting Memory-Bounded Solver...")
+    
+    puzzle = states_at_depth(18)[0]
+    solver = SMAStarSolver(h3, max_nodes=40)
+    path, stats = solver.solve(puzzle)
+    
+    assert stats.optimal_cost == 18, f"Should find optimal 18-move solution, got {stats.optimal_cost}"
+    assert all(b in a.get_neighbors() for a, b in zip(path, path[1:])), "Path should be connected"
+    assert solver.memory["evictions"] > 0, "Tight cap should force evictions"
+    assert solver.memory["peak_nodes"] <= 40 + 4, "Peak should stay near the cap"
+    
+    print(f"✓ Solved within {solver.memory['peak_nodes']} nodes "
+          f"({solver.memory['evictions']} evictions)")
+
+
+def test_external_bfs():
+    """Test disk-backed BFS against in-memory layer sizes."""
+    print("\nTesting External BFS...")
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        bfs = ExternalBFS(tmp, chunk_size=500, block_size=64)
+        sizes = bfs.run(max_depth=12)
+        layer = list(bfs.read_layer(12))
+    
+    assert sizes == layer_sizes()[:13], "Layer sizes should match in-memory BFS"
+    assert layer == sorted(set(layer)), "Layer files should be sorted and unique"
+    
+    print(f"✓ External BFS matched {len(sizes)} layers")
+
+
+def test_parallel_ida():
+    """Test serial and parallel IDA* against exact distances."""
+    print("\nTesting Parallel IDA*...")
+    
+    distances = exact_distances()
+    for depth in (0, 1, 14, 22):
+        puzzle = states_at_depth(depth)[-1]
+        for solver in (IDAStarSolver(h3), ParallelIDAStarSolver(h3, workers=2)):
+            path, stats = solver.solve(puzzle)
+            assert stats.optimal_cost == distances[puzzle.state], \
+                f"{type(solver).__name__} should find optimal cost {depth}, got {stats.optimal_cost}"
+            assert path[0] == puzzle and path[-1].is_goal(), "Path should run from start to goal"
+            assert all(b in a.get_neighbors() for a, b in zip(path, path[1:])), "Path should be connected"
+    
+    print("✓ Serial and parallel IDA* found optimal solutions")
+
+
+def test_hda_star():
+    """Test hash-distributed A* against exact distances."""
+    print("\nTesting HDA*...")
+    
+    for depth in (0, 1, 20, 31):
+        puzzle = states_at_depth(depth)[0]
+        path, stats = HDAStarSolver(h3, workers=2, expansions_per_round=64).solve(puzzle)
+        assert stats.optimal_cost == depth, f"Should find optimal cost {depth}, got {stats.optimal_cost}"
+        assert path[0] == puzzle and path[-1].is_goal(), "Path should run from start to goal"
+        assert all(b in a.get_neighbors() for a, b in zip(path, path[1:])), "Path should be connected"
+        assert sum(stats.nodes_per_worker) == stats.nodes_expanded, "Per-worker counts should add up"
+    
+    assert stats.nodes_sent > 0 and stats.bytes_sent > 0, "Workers should exchange nodes"
+    
+    print(f"✓ HDA* found optimal solutions ({stats.nodes_sent} nodes sent on the deepest instance)")
+
+
+def test_table_registry():
+    """Test build-once, attach-many table files and version invalidation."""
+    print("\nTesting Table Registry...")
+    import os
+    import pickle
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        builder = TableRegistry(tmp)
+        builder.register("exact_distances", build_exact_distance_table)
+        builder.get("exact_distances")
+        path = builder.path("exact_distances")
+        
+        reader = TableRegistry(tmp)
+        reader.register("exact_distances", build_exact_distance_table)
+        assert reader.path("exact_distances") == path, "Same spec should attach to the same file"
+        
+        heuristic = pickle.loads(pickle.dumps(ExactDistance(reader)))
+        for depth in (0, 9, 31):
+            puzzle = states_at_depth(depth)[0]
+            assert heuristic.compute(puzzle) == depth, f"Table should give exact distance {depth}"
+        try:
+            heuristic.compute(PuzzleState((0, 2, 1, 3, 4, 5, 6, 7, 8)))
+            assert False, "Unsolvable board should be rejected, not given its partner's distance"
+        except ValueError:
+            pass
+        
+        bumped = TableRegistry(tmp)
+        bumped.register("exact_distances", build_exact_distance_table, version=2)
+        bumped.get("exact_distances")
+        assert os.listdir(tmp) == [os.path.basename(bumped.path("exact_distances"))], \
+            "Rebuilding a new version should remove the stale file"
+        
+        for registry in (builder, heuristic.registry, bumped):
+            registry.close()
+    
+    assert "puzzle_solver.ranking" in package_modules(build_exact_distance_table.__module__), \
+        "Table fingerprints should cover the ranking the table is indexed by"
+    assert TABLES.directory == os.environ[TABLE_DIR_ENV], "Tests should build shared tables in a scratch directory"
+    
+    print("✓ Tables built once, attached, and invalidated by version")
+
+
+def test_move_sequence():
+    """Test compact move encoding, replay and serialization."""
+    print("\nTesting Move Sequences...")
+    
+    puzzle = states_at_depth(31)[0]
+    path, _ = IDAStarSolver(h3).solve(puzzle)
+    moves = MoveSequence.from_path(path)
+    
+    assert len(moves) == 31 and len(str(moves)) == 31, "Should encode one move per step"
+    assert moves.validate(), "Optimal solution should validate"
+    assert moves.to_path() == path, "Replay should rebuild the original path"
+    assert MoveSequence.from_bytes(moves.to_bytes()) == moves, "Bytes round trip should be lossless"
+    assert MoveSequence.from_dict(moves.to_dict()) == moves, "Dict round trip should be lossless"
+    assert len(moves.to_bytes()) == 18, "31 moves should pack into 18 bytes"
+    
+    assert not MoveSequence.from_moves(puzzle, str(moves)[:-1]).validate(), "Truncated solution should not validate"
+    assert not MoveSequence.from_moves(PuzzleState(), "U").validate(), "Illegal move should not validate"
+    
+    print(f"✓ Encoded 31-move solution as {str(moves)} in {len(moves.to_bytes())} bytes")
+
+
+def test_pipeline():
+    """Test seeded corpus generation and per-column result caching."""
+    print("\nTesting Experiment Pipeline...")
+    import random
+    import tempfile
+    
+    first = PuzzleGenerator.generate_batch(5, random.Random(7))
+    assert first == PuzzleGenerator.generate_batch(5, random.Random(7)), "Same seed should give same puzzles"
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = ExperimentPipeline(num_puzzles=6, seed=7, cache_dir=tmp, engines=("ida",), heuristics=[h3, h4])
+        results = pipeline.run()
+        assert pipeline.last_solved == 12, "First run should solve every combination"
+        
+        pipeline.run()
+        assert pipeline.last_solved == 0, "Second run should be fully cached"
+        
+        key = pipeline.puzzles()[0].pack()
+        rerun = pipeline.rerun(key, heuristics=[h3])
+        assert pipeline.last_solved == 1, "Re-run should solve only the requested puzzle"
+        assert rerun[("ida", h3.get_name())].optimal_cost == results[("ida", h3.get_name())][key].optimal_cost
+        
+        by_heuristic = pipeline.results("ida")
+        assert pipeline.last_solved == 0 and len(by_heuristic[h4.get_name()]) == 6, \
+            "Results should come from the cache in corpus order"
+        
+        # Worker results are recorded as they arrive, in any order
+        column = ("ida", h3.get_name())
+        parallel = ExperimentPipeline(num_puzzles=6, seed=7, cache_dir=tmp, engines=("ida",), heuristics=[h3], workers=2)
+        resolved = parallel.run(force=True)
+        assert parallel.last_solved == 6, "Forced run should solve every puzzle again"
+        assert all(resolved[column][key].optimal_cost == stats.optimal_cost for key, stats in results[column].items()), \
+            "Worker results should be recorded under their own puzzle"
+    
+    # Editing one heuristic changes only its own column names; edits outside any definition change none
+    pipeline = ExperimentPipeline(engines=("bnb", "ida"))
+    columns = [(engine, heuristic) for engine in pipeline.engines for heuristic in HEURISTICS]
+    before = [pipeline.column_path(engine, heuristic) for engine, heuristic in columns]
+    module_source = dependencies.module_source
+    original = module_source("puzzle_solver.heuristics")
+    edits = {
+        h2.get_name(): original.replace("class H2_MisplacedTiles(Heuristic):\n",
+                                        "class H2_MisplacedTiles(Heuristic):\n    edited = True\n"),
+        None: original + "\nedited = True\n",
+    }
+    for edited_name, edited in edits.items():
+        dependencies.module_source = lambda name: edited if name == "puzzle_solver.heuristics" else module_source(name)
+        try:
+            dependencies.definition_sources.cache_clear()
+            dependencies._definitions.cache_clear()
+            after = [pipeline.column_path(engine, heuristic) for engine, heuristic in columns]
+        finally:
+            dependencies.module_source = module_source
+            dependencies.definition_sources.cache_clear()
+            dependencies._definitions.cache_clear()
+        changed = {heuristic.get_name() for (_, heuristic), old, new in zip(columns, before, after) if old != new}
+        assert changed == ({edited_name} - {None}), f"Only {edited_name}'s columns should change, not {changed}"
+    assert [pipeline.column_path(engine, heuristic) for engine, heuristic in columns] == before
+    
+    print("✓ Seeded corpus reproduced and results cached per column")
+
+
+def test_table_heuristics():
+    """Test walking distance, inversion distance and corner tiles for admissibility."""
+    print("\nTesting Table Heuristics...")
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = TableRegistry(tmp)
+        registry.register("walking_distance", build_walking_distance_table)
+        registry.register("linear_conflict", build_linear_conflict_table)
+        heuristics = [H5_WalkingDistance(registry), H6_InversionDistance(), H7_LinearConflictCorners(registry)]
+        
+        states, depths = solvable_state_arrays()
+        sample = slice(0, None, 97)
+        for heuristic in heuristics:
+            values = [heuristic.compute(PuzzleState(tuple(int(t) for t in row))) for row in states[sample]]
+            assert all(v <= d for v, d in zip(values, depths[sample])), f"{heuristic.get_name()} should be admissible"
+            assert heuristic.compute(PuzzleState()) == 0, "Goal should have h = 0"
+            assert list(heuristic.compute_batch(states[sample])) == values, "Batch should match compute()"
+        
+        manhattan = [h3.compute(PuzzleState(tuple(int(t) for t in row))) for row in states[sample]]
+        walking = [heuristics[0].compute(PuzzleState(tuple(int(t) for t in row))) for row in states[sample]]
+        assert all(w >= m for w, m in zip(walking, manhattan)), "Walking distance should dominate Manhattan"
+        
+        # Vectorized linear conflicts match compute() towards every canonical goal too
+        registry.register("linear_conflict_edge", build_linear_conflict_table_edge)
+        registry.register("linear_conflict_centre", build_linear_conflict_table_centre)
+        for goal in LC_GOALS.values():
+            for heuristic in (h4.for_goal(goal), heuristics[2].for_goal(goal)):
+                values = [heuristic.compute(PuzzleState(tuple(int(t) for t in row))) for row in states[sample]]
+                assert list(heuristic.compute_batch(states[sample])) == values, \
+                    f"{heuristic.get_name()} batch values should match compute() towards {goal}"
+        registry.close()
+    
+    print("✓ H5-H7 admissible on sampled states")
+
+
+class _CutOffManhattan(H3_Manhattan):
+    """Manhattan distance that stops at the pruning threshold, as compute_bounded() may."""
+    
+    def compute_bounded(self, state: PuzzleState, bound: float) -> int:
+        return min(self.compute(state), bound)
+
+
+def test_lower_bound_accounting():
+    """Test stored h-values, heuristic call counts and lower-bound modes."""
+    print("\nTesting Lower Bound Accounting...")
+    import random
+    
+    distances = exact_distances()
+    for puzzle in PuzzleGenerator.generate_batch(10, random.Random(1)):
+        path, stats = BranchAndBoundSolver(h3).solve(puzzle)
+        assert stats.optimal_cost == distances[puzzle.state], "Solver should find the optimal cost"
+        assert len(path) - 1 == stats.optimal_cost, "Path length should match the cost"
+        assert stats.heuristic_calls < 2 * stats.nodes_expanded, \
+            "h should be computed once per generated node, not again when expanded"
+        
+        generated = BranchAndBoundSolver(h3, lower_bound_mode="generated").solve(puzzle)[1]
+        assert generated.lower_bound_count == generated.heuristic_calls, "Generated mode should count every evaluation"
+        assert stats.lower_bound_count == stats.nodes_expanded, "Expanded mode should count expansions"
+        
+        # Nodes pruned at generation count at their exact h, not at a value cut off at the bound
+        for solver_class in (BranchAndBoundSolver, PooledBranchAndBoundSolver):
+            exact, cut_off = (solver_class(heuristic, lower_bound_mode="generated", goal_test="generation")
+                              .solve(puzzle)[1] for heuristic in (h3, _CutOffManhattan()))
+            assert cut_off.lower_bound_sum == exact.lower_bound_sum, \
+                "Generated mode should record exact heuristic values"
+    
+    try:
+        BranchAndBoundSolver(h3, lower_bound_mode="popped")
+        assert False, "Unknown mode should be rejected"
+    except ValueError:
+        pass
+    
+    print(f"✓ Optimal costs with {stats.heuristic_calls} heuristic calls for {stats.nodes_expanded} expansions")
+
+
+def test_tie_breaking():
+    """Test that every tie-breaking policy stays optimal and deep-g saves expansions."""
+    print("\nTesting Tie-Breaking Policies...")
+    
+    puzzles = states_at_depth(22)[:5]
+    nodes = {}
+    for policy in TIE_BREAKING_POLICIES:
+        solver = BranchAndBoundSolver(h3, tie_breaking=policy, seed=0)
+        nodes[policy] = 0
+        for puzzle in puzzles:
+            path, stats = solver.solve(puzzle)
+            assert stats.optimal_cost == 22, f"{policy} should find the optimal cost"
+            assert len(path) == 23, f"{policy} path should match the cost"
+            nodes[policy] += stats.nodes_expanded
+    
+    assert nodes["deep_g"] == nodes["low_h"], "deep_g and low_h order equal-f nodes identically"
+    assert nodes["deep_g"] < nodes["fifo"], "Deep-g tie-breaking should expand fewer nodes"
+    
+    try:
+        BranchAndBoundSolver(h3, tie_breaking="newest")
+        assert False, "Unknown policy should be rejected"
+    except ValueError:
+        pass
+    
+    try:
+        PooledBranchAndBoundSolver(h3, tie_breaking="deep_g")
+        assert False, "Pooled solver should reject policies its buckets cannot follow"
+    except ValueError:
+        pass
+    
+    print(f"✓ All policies optimal; deep_g expanded {nodes['deep_g']} vs fifo {nodes['fifo']}")
+
+
+def test_termination_modes():
+    """Test that bound termination and generation goal tests keep solutions optimal."""
+    print("\nTesting Termination Modes...")
+    
+    puzzles = states_at_depth(18)[:5]
+    nodes = {}
+    for termination in TERMINATION_MODES:
+        for goal_test in GOAL_TEST_MODES:
+            solver = BranchAndBoundSolver(h3, termination=termination, goal_test=goal_test)
+            pooled = PooledBranchAndBoundSolver(h3, termination=termination, goal_test=goal_test)
+            nodes[termination, goal_test] = 0
+            for puzzle in puzzles:
+                path, stats = solver.solve(puzzle)
+                pooled_path, pooled_stats = pooled.solve(puzzle)
+                assert stats.optimal_cost == 18, f"{termination}/{goal_test} should find the optimal cost"
+                assert stats.first_solution_cost >= stats.optimal_cost, "Incumbents only improve"
+                assert path == pooled_path, "Pooled solver should return the same path"
+                assert stats.nodes_expanded == pooled_stats.nodes_expanded, "Pooled solver should expand the same nodes"
+                if termination == "bound":
+                    assert stats.nodes_after_solution == 0, "Bound termination stops at the solution"
+                nodes[termination, goal_test] += stats.nodes_expanded
+    
+    assert nodes["bound", "expansion"] < nodes["drain", "expansion"], "Bound termination should expand fewer nodes"
+    
+    try:
+        BranchAndBoundSolver(h3, termination="never")
+        assert False, "Unknown termination mode should be rejected"
+    except ValueError:
+        pass
+    
+    print(f"✓ All modes optimal; bound expanded {nodes['bound', 'expansion']} vs drain {nodes['drain', 'expansion']}")
+
+
+def test_arbitrary_goals():
+    """Test solving between arbitrary boards through canonical goals."""
+    print("\nTesting Arbitrary Goals...")
+    import random
+    import tempfile
+    
+    rng = random.Random(7)
+    pairs = []
+    for _ in range(18):
+        tiles = list(range(9))
+        rng.shuffle(tiles)
+        goal = PuzzleState(tuple(tiles))
+        start = goal
+        for _ in range(12):
+            start = rng.choice(start.get_neighbors())
+        pairs.append((start, goal))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = TableRegistry(tmp)
+        registry.register("walking_distance", build_walking_distance_table)
+        registry.register("walking_distance_middle", build_walking_distance_table_middle)
+        registry.register("linear_conflict", build_linear_conflict_table)
+        registry.register("linear_conflict_edge", build_linear_conflict_table_edge)
+        registry.register("linear_conflict_centre", build_linear_conflict_table_centre)
+        assert {GoalFrame(goal.state).canonical_goal for _, goal in pairs} == set(LC_GOALS.values()), \
+            "Pairs should cover corner, edge and centre goals"
+        
+        reference = solve_pairs(pairs, h1)
+        linear_conflict_corners = H7_LinearConflictCorners(registry)
+        for heuristic in (h3, H5_WalkingDistance(registry), H6_InversionDistance(), linear_conflict_corners,
+                          MaxHeuristic([h2, h3])):
+            for engine in (BranchAndBoundSolver, IDAStarSolver):
+                results = solve_pairs(pairs, heuristic, engine)
+                for (start, goal), (path, stats), (_, expected) in zip(pairs, results, reference):
+                    assert stats.optimal_cost == expected.optimal_cost, f"{heuristic.get_name()} should be optimal"
+                    assert path[0] == start and path[-1] == goal, "Path should run from start to goal"
+                    assert MoveSequence.from_path(path).validate(goal), "Path should be a legal solution"
+        
+        # H4 overestimates a few states even for the standard goal, so it need only solve
+        for (start, goal), (path, _) in zip(pairs, solve_pairs(pairs, h4)):
+            assert MoveSequence.from_path(path).validate(goal), "H4 should solve towards any goal"
+        
+        try:
+            linear_conflict_corners.for_goal((2, 1, 0, 3, 4, 5, 6, 7, 8))
+            assert False, "H7 should reject goals without a linear conflict table"
+        except ValueError:
+            pass
+        registry.close()
+    
+    # Corner goals map onto the standard goal, so standard-only tables still apply
+    for start, goal in pairs:
+        frame = GoalFrame(goal.state)
+        assert frame.to_canonical(goal).is_goal(), "Goal should map to its canonical goal"
+        assert frame.from_canonical(frame.to_canonical(start)) == start, "Mapping should round-trip"
+        if goal.empty_pos in (0, 2, 6, 8):
+            assert frame.canonical_goal == PuzzleState.GOAL_STATE
+    
+    try:
+        ExactDistance().for_goal((1, 2, 3, 4, 0, 5, 6, 7, 8))
+        assert False, "Standard-goal heuristics should reject other goals"
+    except ValueError:
+        pass
+    
+    print(f"✓ {len(pairs)} arbitrary (start, goal) pairs solved optimally")
+
+
+def test_memory_instrumentation():
+    """Test peak frontier/closed counters, tracemalloc profiling and the memory column."""
+    print("\nTesting Memory Instrumentation...")
+    import os
+    import tempfile
+    import tracemalloc
+    
+    puzzles = states_at_depth(16)[:3]
+    for puzzle in puzzles:
+        stats = BranchAndBoundSolver(h3).solve(puzzle)[1]
+        pooled = PooledBranchAndBoundSolver(h3).solve(puzzle)[1]
+        assert stats.peak_frontier > 0 and stats.peak_closed >= stats.peak_frontier, "Counters should be set"
+        assert (stats.peak_frontier, stats.peak_closed) == (pooled.peak_frontier, pooled.peak_closed), \
+            "Pooled solver should hold the same nodes"
+        assert stats.bytes_per_node > pooled.bytes_per_node, "Pooled nodes carry no path copies"
+        ida = IDAStarSolver(h3).solve(puzzle)[1]
+        assert ida.peak_closed == 17, "IDA* holds at most the solution path"
+    
+    profiler = MemoryProfiler(BranchAndBoundSolver(h3), snapshots=True)
+    results = {h3.get_name(): [profiler.solve(puzzle)[1] for puzzle in puzzles]}
+    assert not tracemalloc.is_tracing(), "Profiler should stop tracing it started"
+    assert all(stats.peak_memory > 0 for stats in results[h3.get_name()]), "Peak memory should be measured"
+    assert sum(diff.size_diff for diff in profiler.retained) < 16 * 1024, "Solve should not leave its nodes allocated"
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.bin")
+        write_columns(path, results, [p.pack() for p in puzzles])
+        table = ResultsTable.load(path)
+        assert list(table.memory()) == [s.peak_memory for s in results[h3.get_name()]], \
+            "Measured memory should round trip"
+        del table
+    
+    print("✓ Memory counters consistent and solves profiled")
+
+
+def test_telemetry():
+    """Test periodic telemetry samples and the console and JSONL sinks."""
+    print("\nTesting Telemetry...")
+    import io
+    import os
+    import json
+    import tempfile
+    
+    puzzle = states_at_depth(20)[0]
+    runs = {}
+    for name, make in (("bnb", BranchAndBoundSolver), ("pooled", PooledBranchAndBoundSolver), ("ida", IDAStarSolver)):
+        samples = []
+        stats = make(h2, telemetry=samples.append, telemetry_interval=100).solve(puzzle)[1]
+        assert samples[-1].done and samples[-1].nodes_expanded == stats.nodes_expanded, "Last sample should be final"
+        assert samples[-1].incumbent == 20, "Final sample should report the solution cost"
+        assert len(samples) == stats.nodes_expanded // 100 + 1, "One sample per interval"
+        nodes = [s.nodes_expanded for s in samples]
+        assert nodes == sorted(nodes), "Samples should be in expansion order"
+        assert all(n % 100 == 0 for n in nodes[:-1]), "Intervals should count every expansion of the solve"
+        runs[name] = [(s.nodes_expanded, s.f_bound, s.frontier) for s in samples[:-1]]
+    assert runs["bnb"] == runs["pooled"], "Pooled solver should report the same progress"
+    
+    out = io.StringIO()
+    BranchAndBoundSolver(h3, telemetry=ConsoleRenderer(out), telemetry_interval=50).solve(puzzle)
+    assert "best 20" in out.getvalue().splitlines()[-1], "Console should show the final cost"
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "telemetry.jsonl")
+        with JsonlSink(path) as sink:
+            BranchAndBoundSolver(h3, telemetry=sink, telemetry_interval=50).solve(puzzle)
+            sink(samples[0])
+            # Readable while the sink is still open, as for a solve in progress
+            with open(path) as f:
+                records = [json.loads(line) for line in f]
+            assert records[-1]["nodes_expanded"] == samples[0].nodes_expanded, "Every sample should be flushed"
+        records.pop()
+        assert records[-1]["done"] and records[-1]["heuristic_name"] == h3.get_name(), "JSONL should hold samples"
+    
+    print(f"✓ {len(runs['bnb'])} samples, identical for pooled and heap solvers")
+
+
+def test_checkpoints():
+    """Test that a killed solve resumes from its checkpoint log with the same result."""
+    print("\nTesting Checkpoints...")
+    import os
+    import tempfile
+    
+    class Killed(Exception):
+        pass
+    
+    def kill_after(nodes):
+        def telemetry(sample):
+            if sample.nodes_expanded >= nodes and not sample.done:
+                raise Killed()
+        return telemetry
+    
+    puzzle = states_at_depth(24)[0]
+    with tempfile.TemporaryDirectory() as tmp:
+        log = CheckpointLog(os.path.join(tmp, "search.ckpt"))
+        engines = (
+            ("bnb", lambda **kw: BranchAndBoundSolver(h3, tie_breaking="deep_g", **kw)),
+            ("ida", lambda **kw: IDAStarSolver(h3, **kw)),
+        )
+        for name, make in engines:
+            path, expected = make().solve(puzzle)
+            try:
+                make(checkpoint=log, checkpoint_interval=100,
+                     telemetry=kill_after(expected.nodes_expanded // 2), telemetry_interval=1).solve(puzzle)
+                assert False, "Solve should have been killed"
+            except Killed:
+                pass
+            assert log.load() is not None, "Checkpoints should have been written"
+            assert log.records_written > 1 and os.path.getsize(log.path) < log.bytes_written, \
+                "Each checkpoint should replace the previous one"
+            
+            # A snapshot cut short mid-write leaves the previous one in place
+            with open(log.path + ".tmp", "wb") as f:
+                f.write(b"PZCK\x10\x00")
+            resumed_path, stats = make(checkpoint=log, checkpoint_interval=100).solve(puzzle)
+            assert resumed_path == path, f"{name}: resumed solve should find the same path"
+            assert (stats.nodes_expanded, stats.heuristic_calls, stats.peak_frontier, stats.peak_closed) == \
+                (expected.nodes_expanded, expected.heuristic_calls, expected.peak_frontier, expected.peak_closed), \
+                f"{name}: resumed solve should continue exactly where it stopped"
+            assert not os.path.exists(log.path) and not os.path.exists(log.path + ".tmp"), \
+                "A finished solve should delete its log"
+        
+        try:
+            BranchAndBoundSolver(h3, checkpoint=log, checkpoint_interval=1,
+                                 telemetry=kill_after(5), telemetry_interval=1).solve(puzzle)
+        except Killed:
+            pass
+        try:
+            BranchAndBoundSolver(h2, checkpoint=log).solve(puzzle)
+            assert False, "A checkpoint of another search should be rejected"
+        except ValueError:
+            pass
+    
+    print(f"✓ Branch and bound and IDA* resume to {expected.nodes_expanded} expansions")
+
+
+def test_ranking():
+    """Test that the board rankings are dense bijections, one at a time and batched."""
+    print("\nTesting Ranking...")
+    import random
+    import itertools
+    import numpy as np
+    
+    solvable = list(exact_distances())
+    indices = [ranking.rank_solvable(tiles) for tiles in solvable]
+    assert sorted(indices) == list(range(ranking.NUM_SOLVABLE_STATES)), "Solvable ranks should be dense"
+    assert all(ranking.unrank_solvable(index) == tiles for index, tiles in zip(indices, solvable)), \
+        "unrank_solvable should invert rank_solvable"
+    
+    permutations = list(itertools.islice(itertools.permutations(range(9)), 0, None, 37))
+    for tiles in permutations:
+        if PuzzleState(tiles).is_solvable():
+            assert ranking.rank_solvable_checked(tiles) == ranking.rank_solvable(tiles), "Checked rank should agree"
+        else:
+            try:
+                ranking.rank_solvable_checked(tiles)
+                assert False, "Checked rank should reject unsolvable boards"
+            except ValueError:
+                pass
+    assert [ranking.rank(tiles) for tiles in permutations] == list(range(0, ranking.NUM_PERMUTATIONS, 37)), \
+        "rank should be lexicographic"
+    assert all(ranking.unrank(ranking.rank(tiles)) == tiles for tiles in permutations), "unrank should invert rank"
+    
+    for tiles in random.Random(0).sample(solvable, 200):
+        key = PuzzleState(tiles).pack()
+        assert ranking.rank_packed(key) == ranking.rank(tiles), "Packed and tuple ranks should agree"
+        assert ranking.rank_solvable_packed(key) == ranking.rank_solvable(tiles), "Packed and tuple ranks should agree"
+        assert ranking.unrank_packed(ranking.rank(tiles)) == key, "unrank_packed should give the packed key"
+        assert ranking.unrank_solvable_packed(ranking.rank_solvable(tiles)) == key, \
+            "unrank_solvable_packed should give the packed key"
+    
+    states, _ = solvable_state_arrays()
+    batch = ranking.rank_solvable_batch(states)
+    assert list(batch) == indices, "Batched solvable ranks should match"
+    assert (ranking.unrank_solvable_batch(batch) == states).all(), "Batched solvable unrank should invert"
+    full = ranking.rank_batch(states)
+    assert list(full) == [ranking.rank(tiles) for tiles in solvable], "Batched ranks should match"
+    assert (ranking.unrank_batch(full) == states).all(), "Batched unrank should invert"
+    assert full.dtype == np.int64
+    
+    print(f"✓ {len(indices)} solvable boards ranked densely into [0, 9!/2)")
+
+
+def test_stress():
+    """Test the hard-instance catalog and the timed stress runs."""
+    print("\nTesting Stress Benchmark...")
+    
+    catalog = hard_instances(per_depth=2, seed=0)
+    depths = [depth for depth, _ in catalog]
+    assert depths.count(31) == len(states_at_depth(31)), "All maximum-depth states should be included"
+    assert set(depths) == set(range(32)) and depths == sorted(depths), "Every depth should be sampled"
+    assert depths.count(1) == 2 and depths.count(0) == 1, "Small layers should be sampled up to their size"
+    assert percentile([3, 1, 2, 4], 50) == 2 and percentile(list(range(1, 101)), 99) == 99
+    
+    benchmark = StressBenchmark(per_depth=1, timeout=30.0, engines=("bnb", "ida"), heuristics=[h3],
+                                depths=(0, 12, 31))
+    summary = benchmark.summary()
+    for data in summary.values():
+        assert data["count"] == 4 and data["timeouts"] == 0 and data["wrong"] == 0, "All solves should be optimal"
+        assert data["p50"] <= data["p99"] <= data["max"] == data["max_depth_max"], "Deepest should be slowest"
+    
+    timed = StressBenchmark(per_depth=1, timeout=0.2, engines=("ida",), heuristics=[h1], depths=(2, 31))
+    results = timed.run()[("ida", h1.get_name())]
+    assert [r.timed_out for r in results] == [False, True, True], "Only the deep solves should time out"
+    assert results[0].cost == 2 and "Timeouts" in timed.format_report(), "Report should count timeouts"
+    
+    print(f"✓ {len(catalog)} catalog instances, timeouts recorded at {timed.timeout}s")
+
+
 def main():
     """Run all tests."""
     print("=" * 50)
@@ -123,6 +948,30 @@ def main():
         test_generator()
         test_solver()
         test_goal_state()
+        test_lazy_imports()
+        test_columnar_results()
+        test_heuristic_sweep()
+        test_max_heuristic()
+        test_solvability()
+        test_state_layout()
+        test_pooled_solver()
+        test_memory_bounded()
+        test_external_bfs()
+        test_parallel_ida()
+        test_hda_star()
+        test_table_registry()
+        test_move_sequence()
+        test_pipeline()
+        test_table_heuristics()
+        test_lower_bound_accounting()
+        test_tie_breaking()
+        test_termination_modes()
+        test_arbitrary_goals()
+        test_memory_instrumentation()
+        test_telemetry()
+        test_checkpoints()
+        test_ranking()
+        test_stress()
         
         print("\n" + "=" * 50)
         print("✓ All tests passed!")